@@ -34,8 +34,10 @@ modules = [
 
     # regression
     'scripts/AVL/test_AVL.py',
+    'scripts/AVL/test_AVL_cases.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
     'scripts/SU2_surrogate/BWB-450.py',
+    'scripts/SU2_surrogate/test_SU2_cases.py',
     'scripts/atmosphere/atmosphere.py',
     'scripts/dynamic_stability/dynamicstability.py',
     'scripts/weights/weights.py',
@@ -58,13 +60,26 @@ modules = [
     'scripts/payload_range/payload_range.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',
+    'scripts/test_input_output/test_binary_archive.py',
+    'scripts/test_input_output/test_histories.py',
+    'scripts/test_input_output/test_cache.py',
+    'scripts/test_input_output/test_aliases.py',
+    'scripts/test_input_output/test_mission_archive.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
     'scripts/noise_optimization/Noise_Test.py',
+    'scripts/noise_optimization/Noise_Footprint.py',
+    'scripts/noise_optimization/Noise_Histories.py',
+    'scripts/noise_tone_correction/noise_tone_correction.py',
     'scripts/Regional_Jet_Optimization/Optimize2.py',
+    'scripts/surrogate_optimization/test_surrogate_sampling.py',
     'scripts/industrial_costs/industrial_costs.py',
     'scripts/sizing_loop/sizing_loop.py',
     'scripts/lifting_line/lifting_line.py',
     'scripts/sweeps/test_sweeps.py',
+    'scripts/segments/test_discretizations.py',
+    'scripts/segments/test_jacobians.py',
+    'scripts/segments/test_batch.py',
+    'scripts/segments/test_optimized_climb.py',
 ]
 
 
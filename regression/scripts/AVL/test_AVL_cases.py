@@ -0,0 +1,177 @@
+# test_AVL_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+
+import numpy as np
+import os
+import sys
+import shutil
+import tempfile
+
+sys.path.append('../Vehicles')
+# the analysis functions
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Stub Solver
+# ----------------------------------------------------------------------
+
+# stands in for the AVL binary, it reads the deck from stdin and writes the stability files
+stub_solver = '''#!{python}
+import sys, os, math
+
+# like AVL, the deck is read up to QUIT since stdin stays open
+deck = []
+while not deck or deck[-1] != 'QUIT':
+    line = sys.stdin.readline()
+    if not line:
+        break
+    if line.strip():
+        deck.append(line.strip())
+
+# the run cases of the batch file
+alpha = {{}}
+mach  = {{}}
+for line in open(deck[0].split()[1]):
+    if line.strip().startswith('Run case'):
+        index = int(line.split()[2][:-1])
+    elif line.strip().startswith('alpha') and '->' in line:
+        alpha[index] = float(line.split('=')[1])
+    elif line.strip().startswith('Mach'):
+        mach[index] = float(line.split('=')[1])
+
+def place(line,start,end,value):
+    text = ('%' + str(end-start) + '.6f') % value
+    return line[:start] + text + line[end:]
+
+log = open({log!r},'a')
+
+ii = 2
+while deck[ii] != 'QUIT':
+    index, filename = int(deck[ii]), deck[ii+3]
+    ii += 4
+
+    CL  = 2. * math.pi * alpha[index] * math.pi / 180. / (1. - mach[index]**2)**0.5
+    CDi = CL**2 / (math.pi * 8.)
+
+    # every field that is not set reads as zero
+    lines = ['0' * 80] * 52
+    lines[23] = place(lines[23],10,20,CL)
+    lines[25] = place(lines[25],32,42,CDi)
+
+    f = open(filename,'w')
+    f.write('\\n'.join(lines) + '\\n')
+    f.close()
+
+    log.write('%s %f %f\\n' % (os.path.basename(os.getcwd()),mach[index],alpha[index]))
+
+log.close()
+'''
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the stub, its logs and the run folders are written in a temporary folder
+    folder = tempfile.mkdtemp()
+    cwd    = os.getcwd()
+    os.chdir(folder)
+    try:
+        run_cases()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(folder)
+
+    return
+
+def run_cases():
+
+    stub_filename = os.path.abspath('stub_avl.py')
+    log_filename  = os.path.abspath('stub_avl_runs.txt')
+
+    f = open(stub_filename,'w')
+    f.write(stub_solver.format(python=sys.executable,log=log_filename))
+    f.close()
+    os.chmod(stub_filename,0755)
+
+    mach = np.array([0.2,0.4,0.6])
+    AoA  = np.array([-2.,0.,3.,6.]) * Units.deg
+
+    # serial runs, all in the run folder
+    serial = run_training(stub_filename,'avl_cases_serial',1,mach,AoA)
+    check_training(serial,mach,AoA)
+
+    runs = read_runs(log_filename)
+    assert len(runs) == len(mach)*len(AoA)
+    assert set([ run[0] for run in runs ]) == set(['avl_cases_serial'])
+    os.remove(log_filename)
+
+    # concurrent runs, one folder per Mach number
+    parallel = run_training(stub_filename,'avl_cases_parallel',3,mach,AoA)
+    check_training(parallel,mach,AoA)
+
+    runs = read_runs(log_filename)
+    assert len(runs) == len(mach)*len(AoA)
+    for j,_ in enumerate(mach):
+        folder = 'case_folder_{0:03d}'.format(j)
+        assert os.path.exists(os.path.join('avl_cases_parallel',folder))
+        folder_runs = [ run for run in runs if run[0] == folder ]
+        assert len(folder_runs) == len(AoA)
+        assert np.all(np.abs(np.array([ run[1] for run in folder_runs ]) - mach[j]) < 1e-6)
+
+    # the training tables are the same
+    assert np.all(serial.grid_points  == parallel.grid_points)
+    assert np.max(np.abs(serial.coefficients - parallel.coefficients)) < 1e-12
+
+    return
+
+def run_training(stub_filename,run_folder,workers,mach,AoA):
+
+    avl = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+    avl.geometry          = vehicle_setup()
+    avl.number_of_workers = workers
+    avl.settings.filenames.avl_bin_name = stub_filename
+    avl.settings.filenames.run_folder   = run_folder
+    avl.settings.filenames.log_filename = os.path.abspath('stub_avl_log.txt')
+    avl.settings.filenames.err_filename = os.path.abspath('stub_avl_err.txt')
+    avl.training.Mach            = mach
+    avl.training.angle_of_attack = AoA
+
+    avl.sample_training()
+
+    return avl.training
+
+def check_training(training,mach,AoA):
+
+    # the rows go through the angles of attack for each Mach number
+    for i,M in enumerate(mach):
+        for j,alpha in enumerate(AoA):
+            row = i*len(AoA) + j
+            CL  = 2. * np.pi * np.round(alpha/Units.deg,5) * Units.deg / np.sqrt(1. - M**2)
+            CD  = CL**2 / (np.pi * 8.)
+            assert np.all(training.grid_points[row] == [alpha,M])
+            assert np.abs(training.coefficients[row,0] - CL) < 1e-4
+            assert np.abs(training.coefficients[row,1] - CD) < 1e-4
+
+def read_runs(log_filename):
+
+    runs = []
+    for line in open(log_filename):
+        folder, M, alpha = line.split()
+        runs.append((folder,float(M),float(alpha)))
+
+    return runs
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+# test_SU2_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Input_Output.SU2 import run_SU2_cases
+
+import numpy as np
+import os
+import sys
+import shutil
+import tempfile
+
+# ----------------------------------------------------------------------
+#   Stub Solver
+# ----------------------------------------------------------------------
+
+# stands in for SU2_CFD, it writes the files of a run from the .cfg
+stub_solver = '''
+import sys, os
+
+config = {}
+for line in open(sys.argv[1]):
+    if '=' in line:
+        key, value = line.split('=',1)
+        config[key.strip()] = value.strip()
+
+mach = float(config['MACH_NUMBER'])
+AoA  = float(config['AoA'])
+CL   = 2. * 3.14159265358979 * AoA * 3.14159265358979 / 180. / (1. - mach**2)**0.5
+CD   = CL**2 / (3.14159265358979 * 8.)
+
+restart = config['RESTART_SOL'] == 'YES' and os.path.exists(config['SOLUTION_FLOW_FILENAME'])
+
+f = open(config['BREAKDOWN_FILENAME'],'w')
+f.write('Total CL:    %.10f | Pressure (100.000%%): %.10f\\n' % (CL,CL))
+f.write('Total CD:    %.10f | Pressure (100.000%%): %.10f\\n' % (CD,CD))
+f.close()
+
+f = open(config['RESTART_FLOW_FILENAME'],'w')
+f.write('%f %f\\n' % (mach,AoA))
+f.close()
+
+f = open(os.path.join('..','stub_runs.txt'),'a')
+f.write('%f %f %i\\n' % (mach,AoA,restart))
+f.close()
+'''
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the stub, the mesh and the run folder are written in a temporary folder
+    folder = tempfile.mkdtemp()
+    cwd    = os.getcwd()
+    os.chdir(folder)
+    try:
+        run_cases()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(folder)
+
+    return
+
+def run_cases():
+
+    tag = 'stub_wing'
+
+    settings = Data()
+    settings.parallel               = False
+    settings.processors             = 1
+    settings.maximum_processors     = 3
+    settings.restart_from_neighbors = True
+    settings.run_folder             = 'SU2_cases_test'
+    settings.SU2_command            = [sys.executable,os.path.abspath('stub_SU2.py')]
+
+    f = open('stub_SU2.py','w')
+    f.write(stub_solver)
+    f.close()
+
+    f = open(tag + '.su2','w')
+    f.write('NDIME= 3\n')
+    f.close()
+
+    cases = []
+    for AoA in [-2.,3.,8.]:
+        for mach in [0.3,0.7]:
+            case = Data()
+            case.reference_area     = 10.
+            case.mach_number        = mach
+            case.angle_of_attack    = AoA
+            case.maximum_iterations = 100
+            cases.append(case)
+
+    # every case runs, the ones started after the first runs restart from them
+    results = run_SU2_cases(tag,cases,settings)
+    check_results(cases,results)
+
+    runs = read_runs(settings)
+    assert len(runs) == 6
+    assert np.sum(runs[:,2]) == 3
+
+    # the cases are not run again
+    results = run_SU2_cases(tag,cases,settings)
+    check_results(cases,results)
+    assert len(read_runs(settings)) == 6
+
+    # a new mesh runs them again
+    f = open(tag + '.su2','a')
+    f.write('NELEM= 0\n')
+    f.close()
+    results = run_SU2_cases(tag,cases,settings)
+    check_results(cases,results)
+    assert len(read_runs(settings)) == 12
+
+    return
+
+def check_results(cases,results):
+
+    for case,result in zip(cases,results):
+        CL = 2. * np.pi * case.angle_of_attack * Units.deg / np.sqrt(1. - case.mach_number**2)
+        CD = CL**2 / (np.pi * 8.)
+        assert np.abs(result.coefficient_of_lift - CL) < 1e-8
+        assert np.abs(result.coefficient_of_drag - CD) < 1e-8
+
+def read_runs(settings):
+
+    return np.atleast_2d(np.loadtxt(os.path.join(settings.run_folder,'stub_runs.txt')))
+
+if __name__ == '__main__':
+    main()
@@ -40,10 +40,10 @@ def main():
     p_truth, T_truth, rho_truth, a_truth = get_truth()
     
     # difference
-    p_err   = np.max( p_truth   - p   )
-    T_err   = np.max( T_truth   - T   )
-    rho_err = np.max( rho_truth - rho )
-    a_err   = np.max( a_truth   - a   )
+    p_err   = np.max( np.abs( p_truth   - p   ) )
+    T_err   = np.max( np.abs( T_truth   - T   ) )
+    rho_err = np.max( np.abs( rho_truth - rho ) )
+    a_err   = np.max( np.abs( a_truth   - a   ) )
     
     print 'Max Pressure Difference       = %.4e' % p_err
     print 'Max Temperature Difference    = %.4e' % T_err
@@ -86,6 +86,18 @@ def main():
     assert( T_err   < 1e-5 )
     assert( rho_err < 1e-5 )
     assert( a_err   < 1e-5 )    
+
+    # the tabulated atmosphere must match the same truth values
+    atm.settings.tabulated = True
+    conditions = atm.compute_values(z)
+
+    assert( np.max( np.abs( p_truth   - conditions.pressure       ) ) < 1e-1 )
+    assert( np.max( np.abs( T_truth   - conditions.temperature    ) ) < 1e-5 )
+    assert( np.max( np.abs( rho_truth - conditions.density        ) ) < 1e-5 )
+    assert( np.max( np.abs( a_truth   - conditions.speed_of_sound ) ) < 1e-5 )
+
+    # the table converges without running to the refinement limit
+    assert( atm.table.error <= atm.settings.table_tolerance )
  
     return
 
@@ -0,0 +1,89 @@
+# Noise_Footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+import numpy as np
+import Noise_Test
+import Procedure
+from SUAVE.Methods.Noise.Fidelity_One import noise_footprint
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import interpolate_observers
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the vehicle of the noise optimization, sized at its initial design
+    nexus = Noise_Test.setup()
+    nexus.MZFW_ratio = 0.77
+    Procedure.initial_sizing(nexus)
+    Procedure.finalize(nexus)
+
+    config   = nexus.vehicle_configurations.landing
+    analyses = nexus.analyses.landing
+    analyses.noise.settings.approach = 1
+    turbofan = config.propulsors['turbofan']
+
+    # the approach mission of the noise optimization
+    results       = SUAVE.Input_Output.SUAVE.load('approach.res')
+    noise_segment = results.segments.descent
+
+    # microphones on and beside the approach path, [x, altitude, lateral]
+    mic_grid = np.zeros((2,3,3))
+    mic_grid[:,:,0] = [[1000.,1500.,2000.],[1000.,1500.,2000.]]
+    mic_grid[:,:,2] = [[   0.,   0.,   0.],[ 300., 300., 300.]]
+
+    footprint = noise_footprint(config,analyses,noise_segment,mic_grid)
+
+    print 'EPNL footprint  =', footprint.EPNL
+    print 'SENEL footprint =', footprint.SENEL
+
+    assert(footprint.EPNL.shape  == (2,3))
+    assert(footprint.SENEL.shape == (2,3))
+
+    # the geometry of all the microphones, interpolated at the noise time steps
+    time       = noise_segment.conditions.frames.inertial.time[:,0]
+    noise_time = np.linspace(time[0],time[-1],41)
+    dist, theta, phi = noise_counterplot(noise_segment,analyses,config,np.reshape(mic_grid,(-1,3)))
+    dist_grid, n_mics = interpolate_observers(noise_time,time,dist)
+    dist_grid = np.reshape(dist_grid,(len(noise_time),n_mics))
+
+    assert(n_mics == 6)
+
+    # every microphone of the grid matches its own single microphone run
+    for i in xrange(2):
+        for j in xrange(3):
+
+            dist, theta, phi = noise_counterplot(noise_segment,analyses,config,mic_grid[i,j])
+            dist_single, n_mics = interpolate_observers(noise_time,time,dist)
+
+            assert(n_mics == 1)
+            assert(np.max(np.abs(dist_grid[:,3*i+j] - dist_single)) < 1e-8)
+
+            airframe_noise = noise_airframe_Fink(config,analyses,noise_segment)
+            engine_noise   = noise_SAE(turbofan,noise_segment,config,analyses)
+
+            assert(np.abs(footprint.airframe.EPNL[i,j]  - airframe_noise[0]) < 1e-8)
+            assert(np.abs(footprint.airframe.SENEL[i,j] - airframe_noise[2]) < 1e-8)
+            assert(np.abs(footprint.engine.EPNL[i,j]    - engine_noise[0])   < 1e-8)
+            assert(np.abs(footprint.engine.SENEL[i,j]   - engine_noise[2])   < 1e-8)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# Noise_Histories.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+import numpy as np
+import Noise_Test
+import Procedure
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the vehicle of the noise optimization, sized at its initial design
+    nexus = Noise_Test.setup()
+    nexus.MZFW_ratio = 0.77
+    Procedure.initial_sizing(nexus)
+    Procedure.finalize(nexus)
+
+    truth = truth_values()
+
+    # the approach and sideline missions of the noise optimization
+    for tag,filename,config_tag,approach in [('approach','approach.res','landing',1),
+                                             ('sideline','sideline.res','takeoff',0)]:
+
+        config   = nexus.vehicle_configurations[config_tag]
+        analyses = nexus.analyses[config_tag]
+        analyses.noise.settings.approach = approach
+        turbofan = config.propulsors['turbofan']
+
+        results       = SUAVE.Input_Output.SUAVE.load(filename)
+        noise_segment = results.segments[0]
+        noise_geometric(noise_segment,analyses,config)
+
+        airframe_noise = noise_airframe_Fink(config,analyses,noise_segment)
+        engine_noise   = noise_SAE(turbofan,noise_segment,config,analyses)
+
+        check_results(tag + ' airframe',airframe_noise,truth[tag].airframe)
+        check_results(tag + ' engine',engine_noise,truth[tag].engine)
+
+    return
+
+def check_results(tag,noise,truth):
+
+    EPNL, SPL_history, SENEL = noise
+
+    # the time histories of all the positions match the step by step calculation
+    SPL_first = SPL_history[0]
+    SPL_max   = np.max(SPL_history,axis=0)
+
+    errors = Data()
+    errors.EPNL      = np.abs(EPNL  - truth.EPNL)
+    errors.SENEL     = np.abs(SENEL - truth.SENEL)
+    errors.SPL_first = np.max(np.abs(SPL_first - truth.SPL_first))
+    errors.SPL_max   = np.max(np.abs(SPL_max   - truth.SPL_max))
+
+    print tag, 'EPNL =', EPNL, ', SENEL =', SENEL
+    for k,v in errors.items():
+        print '  error', k, ':', v
+        assert(v < 1e-6)
+
+    return
+
+def truth_values():
+
+    # computed one aircraft position and one frequency band at a time, the engine SENEL
+    # with the dBA of every position
+    truth = Data()
+
+    truth.approach = Data()
+    truth.approach.airframe = Data()
+    truth.approach.airframe.EPNL      = 92.58063834405068
+    truth.approach.airframe.SENEL     = 88.18483313890319
+    truth.approach.airframe.SPL_first = [ 54.95805400, 56.07258468, 56.85276538, 57.19886055, 57.07498840, 56.45829390,
+                                          55.42742682, 53.95126665, 52.01690724, 49.58060767, 46.95044496, 43.92467503,
+                                          40.43464373, 36.78509958, 32.66593992, 27.55205105, 22.16537883, 15.93125109,
+                                           8.22838915, -1.43675660, -8.20443750,-20.52902383,-38.52780342,-64.14905040 ]
+    truth.approach.airframe.SPL_max   = [ 83.81599166, 84.97494699, 86.08002953, 86.99701453, 87.04306577, 86.66282592,
+                                          86.16545999, 85.52089792, 84.73322597, 83.84376205, 82.98991150, 82.10519857,
+                                          81.18412158, 80.30971338, 78.07170408, 75.05579192, 72.27264140, 69.38953550,
+                                          66.23298683, 62.71939242, 59.41684502, 55.52178782, 51.11629070, 46.55653633 ]
+
+    truth.approach.engine = Data()
+    truth.approach.engine.EPNL      = 63.33527517773585
+    truth.approach.engine.SENEL     = 57.1541298892339
+    truth.approach.engine.SPL_first = [ 33.52649774, 33.56238814, 33.51733575, 33.42730947, 33.27555298, 33.10746967,
+                                        32.96982837, 32.87319250, 32.85825986, 32.91978726, 33.04007054, 33.21439824,
+                                        33.37904413, 33.49300572, 33.48956367, 33.30623382, 32.84270855, 32.03480332,
+                                        30.65991038, 28.47815871, 27.64891276, 24.19874390, 18.05011998,  8.57920039 ]
+    truth.approach.engine.SPL_max   = [ 58.43232741, 59.06632532, 59.46134674, 59.58042165, 59.44941343, 59.01117263,
+                                        58.34647303, 57.42517854, 56.20054425, 54.64300776, 52.91947629, 50.86048584,
+                                        48.43616278, 45.89940678, 43.09816204, 39.71694894, 36.36496055, 33.37272780,
+                                        32.41983324, 30.94970963, 30.37504565, 28.14991403, 24.42316582, 18.89047505 ]
+
+    truth.sideline = Data()
+    truth.sideline.airframe = Data()
+    truth.sideline.airframe.EPNL      = 77.2934242591825
+    truth.sideline.airframe.SENEL     = 71.28139339230069
+    truth.sideline.airframe.SPL_first = [  7.01334944,  8.36109816,  9.88421031, 11.22734217, 12.25330040, 12.97828295,
+                                          13.18878218, 13.00025277, 12.51075339, 11.78312408, 11.01033206, 10.14352598,
+                                           9.01698581,  7.65088965,  5.86004716,  3.44153774,  0.90260847, -1.76424599,
+                                          -4.64048816, -7.90341772, -9.75708455,-13.82416317,-20.19247411,-29.82693250 ]
+    truth.sideline.airframe.SPL_max   = [ 60.39215598, 61.63217081, 62.86608354, 63.92761595, 64.84830663, 64.52047118,
+                                          64.11627765, 63.61676347, 63.04798376, 62.43748679, 61.85254900, 61.18737091,
+                                          60.33384878, 59.32719316, 58.06747442, 55.10378380, 52.17068216, 48.89856592,
+                                          45.01221067, 40.25869467, 36.09135439, 29.88659348, 21.54582978, 11.02700122 ]
+
+    truth.sideline.engine = Data()
+    truth.sideline.engine.EPNL      = 89.2473001021362
+    truth.sideline.engine.SENEL     = 83.00579569969364
+    truth.sideline.engine.SPL_first = [ 51.61744364, 51.97155496, 52.17989748, 52.24830663, 52.17302902, 51.96167566,
+                                        51.63793716, 51.17576769, 50.54791737, 49.69239801, 48.67609220, 47.38148601,
+                                        45.72748951, 43.87677690, 41.67280609, 38.79888294, 35.70694650, 32.10962809,
+                                        27.72468082, 22.35892233, 18.19968769, 11.60244537,  2.52135219,  0.52761869 ]
+    truth.sideline.engine.SPL_max   = [ 75.05576570, 75.34573127, 75.38391876, 75.43174065, 75.50146350, 75.46926002,
+                                        75.35417902, 75.14404860, 74.80144551, 74.24992683, 73.52282871, 72.51499739,
+                                        71.19712301, 69.69070172, 67.89724948, 65.57054554, 63.11443337, 60.27927777,
+                                        56.95848814, 53.01036980, 49.39425324, 44.68515411, 38.80353332, 31.88691056 ]
+
+    return truth
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+# noise_tone_correction.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
+
+import numpy as np
+import time
+
+#----------------------------------------------------------------------
+#   The regression script
+# ---------------------------------------------------------------------
+
+def main():
+    
+    # Flyover spectra with tones in every band
+    SPL = flyover_spectra(400,seed=0)
+    
+    tone_correction       = noise_tone_correction(SPL)
+    tone_correction_truth = noise_tone_correction_loops(SPL)
+    
+    print 'steps with a tone correction:', np.sum(tone_correction_truth!=0.)
+    
+    # The vectorized correction must be identical
+    assert(np.all(tone_correction == tone_correction_truth))
+    
+    # Single spectra
+    for j in [0,7,123]:
+        assert(noise_tone_correction(SPL[j:j+1])[0] == tone_correction_truth[j])
+    
+    # Benchmark on a long trajectory at a fine time step
+    SPL = flyover_spectra(5000,seed=1)
+    
+    t0 = time.time()
+    tone_correction = noise_tone_correction(SPL)
+    t_vector = time.time() - t0
+    
+    t0 = time.time()
+    tone_correction_truth = noise_tone_correction_loops(SPL)
+    t_loops = time.time() - t0
+    
+    print 'loops      : %.4f s' % t_loops
+    print 'vectorized : %.4f s' % t_vector
+    
+    assert(np.all(tone_correction == tone_correction_truth))
+
+    return
+
+def flyover_spectra(nsteps,seed):
+    """Broadband spectra of a passing aircraft, with random tones and quiet high frequency bands"""
+    
+    rng = np.random.RandomState(seed)
+    
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+    
+    t     = np.linspace(-1.,1.,nsteps)
+    level = 70. + 20.*np.exp(-(t/0.3)**2)
+    shape = -6.*np.log10(frequency/500.)**2
+    
+    SPL = level[:,None] + shape[None,:] + rng.normal(0.,1.,(nsteps,24))
+    
+    # tones from a fraction of a dB to well above the largest correction
+    steps = np.arange(nsteps)
+    SPL[steps,rng.randint(0,24,nsteps)] += rng.uniform(0.,30.,nsteps)
+    SPL[steps,rng.randint(0,24,nsteps)] += rng.uniform(0.,10.,nsteps)
+    
+    # spectra that fall below zero in the last bands
+    SPL[::5,17:] -= 80.
+    
+    return SPL
+
+def noise_tone_correction_loops(SPL):
+    """The band by band tone correction that the vectorized version replaces, kept as the reference"""
+
+    #Defining the necessary arrays for the tone correction procedure
+    nsteps              = len(SPL)
+    slope               = np.zeros(23)
+    aux_ds              = np.zeros(23)
+    delta_slope         = np.zeros(23)
+    tone_correction_max = np.zeros(nsteps)
+    
+    for j in xrange(0,nsteps):
+    
+        #------------------------------------------------------------
+        #STEP 1 - Calculation of slopes in the one-third octave bands
+        #------------------------------------------------------------
+        for i in xrange(3,23):
+            slope[i] = SPL[j][i]-SPL[j][i-1]
+        
+        #------------------------------------------------------------
+        #STEP 2 - Encircle the necessary values of the slope
+        #------------------------------------------------------------    
+        for i in xrange(3,23):        
+            aux_ds[i] = np.abs(slope[i]-slope[i-1])
+            
+            if aux_ds[i]>5:
+                delta_slope[i]=1
+            else:
+                delta_slope[i]=0
+        #------------------------------------------------------------
+        #STEP 3 - Encircle the slope
+        #------------------------------------------------------------
+        step3  = np.zeros(23)
+        step3a = np.zeros(23)
+        step3b = np.zeros(23)
+        for i in xrange(3,23):
+            if delta_slope[i]==1 and slope[i]>0 and slope[i]>slope[i-1]:
+                step3a[i] = 1
+            if  delta_slope[i]==1 and slope[i]<=0 and slope[i-1]>0:
+                step3b[i] = 1
+        step3 = step3a + step3b
+        
+        #------------------------------------------------------------
+        #STEP 4 - Compute new adjusted sound pressure level
+        #------------------------------------------------------------        
+        step4 = np.zeros(23)
+        for i in xrange(1,23):
+            if step3[i]!=0 and i<23:
+                step4[i] = (SPL[j][i-1]+SPL[j][i+1])/2
+            if step3[i]!=0 and i==23:
+                step4[i] = SPL[j][i-1]+slope[i-1]
+            if step3[i]==0:
+                step4[i] = SPL[j][i]
+                
+        #------------------------------------------------------------
+        #STEP 5 - Recompute new slope
+        #------------------------------------------------------------    
+        step5 = np.zeros(25)
+        for i in xrange(3,23):
+            step5[i]=step4[i]-step4[i-1]
+        step5[2]  = step5[3]
+        step5[24] = step5[23]
+        
+        #------------------------------------------------------------
+        #STEP 6 - Compute the arithmetic average of the three adjacent slopes
+        #------------------------------------------------------------
+        step6 = np.zeros(23)
+        for i in xrange(2,22):
+            if i==22:
+                step6[i] = (step5[i]+step5[i+1])/3.
+            else:
+                step6[i] = (step5[i]+step5[i+1]+step5[i+2])/3.
+        
+        #------------------------------------------------------------
+        #STEP 7 - Compute the final 1/3 octave band
+        #------------------------------------------------------------
+        step7 = np.zeros(24)
+        step7[2]=SPL[j][2]
+        for i in xrange(3,23):
+            step7[i] = step7[i-1]+step6[i-1]
+        
+        #------------------------------------------------------------
+        #STEP 8 - Compute the differences between original SPL and final SPL
+        #------------------------------------------------------------    
+        step8 = np.zeros(24)
+        step8_aux = np.zeros(24)
+        for i in xrange(2,16):
+            step8_aux[i] = SPL[j][i]-step7[i]
+            if step8_aux[i]>=1.5:
+                step8[i] = step8_aux[i]
+            else:
+                step8[i]=0.
+        for i in xrange(17,22):
+            step8_aux[i] = SPL[j][i]-step7[i]
+            if step8_aux[i]>=1.5 and SPL[j][i]>0 and SPL[j][i+1]>0 and SPL[j][i-1]>0:
+                step8[i] = step8_aux[i]
+            else:
+                step8[i] = 0.
+        
+        step8_aux[23] = SPL[j][23]-step7[23]
+        if step8_aux[23]>=1.5 and SPL[j][23]>0 and SPL[j][22]>0:
+            step8[23] = step8_aux[23]
+        else:
+            step8[23]=0.
+            
+        #------------------------------------------------------------
+        #STEP 9 - Determine tone correction factors for each 1/3 octave band
+        #------------------------------------------------------------
+        tone_correction = np.zeros(23)
+        for i in xrange(2,9):
+            if step8[i]>=1.5 and step8[i]<3:
+                tone_correction = (step8[i]/3)-0.5
+            if step8[i]>=3 and step8[i]<20:
+                tone_correction = step8[i]/6.
+            if step8[i]>20:
+                tone_correction = 3+(1/3)
+        for i in xrange(10,20):
+            if step8[i]>=1.5 and step8[i]<3:
+                tone_correction = (2/3)*(step8[i])-1
+            if step8[i]>=3 and step8[i]<20:
+                tone_correction = step8[i]/3.
+            if step8[i]>20:
+                tone_correction = 6+(2/3)
+        for i in xrange(21,23):
+            if step8[i]>=1.5 and step8[i]<3:
+                tone_correction = (step8[i]/3)-(1/2)
+            if step8[i]>=3 and step8[i]<20:
+                tone_correction = step8[i]/6.
+            if step8[i]>20:
+                tone_correction = 3+(1/3)
+                
+        #------------------------------------------------------------
+        #STEP 10 - Largest tone correction factor
+        #------------------------------------------------------------
+        tone_correction_max[j] = np.max(tone_correction)
+    
+    
+    return (tone_correction_max)
+
+# ----------------------------------------------------------------------        
+#   Call Main
+# ----------------------------------------------------------------------    
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@
 # full_setup.py
 #
 # Created:  SUave Team, Aug 2014
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 """ setup file for a mission with a E190
 """
@@ -53,11 +53,47 @@ def main():
     
     check_results(payload_range_results)
     
+    # the results are kept on the function, the next run replaces them
+    serial_range    = np.array(payload_range_results.range)
+    serial_payload  = list(payload_range_results.payload)
+    serial_fuel     = list(payload_range_results.fuel)
+    serial_distance = mission.segments[cruise_segment_tag].distance
+    serial_takeoff  = mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff
+    
+    # the same diagram with a point inside each leg, on three workers
+    intermediate_points = 1
+    parallel_results = payload_range(vehicle,mission,cruise_segment_tag,reserves,number_of_workers=3,
+                                     intermediate_points=intermediate_points)
+    
+    corners = (intermediate_points+1)*np.arange(1,4)
+    assert len(parallel_results.range) == 3*(intermediate_points+1) + 1
+    
+    # the points are converged to the same fuel tolerance from other starting points
+    for i,j in zip([1,2,3],corners):
+        error = np.abs(parallel_results.range[j] - serial_range[i]) / serial_range[i]
+        print 'parallel corner', i, 'error :', error
+        assert error < 1e-3
+        assert parallel_results.payload[j] == serial_payload[i]
+        assert parallel_results.fuel[j]    == serial_fuel[i]
+    
+    # and the mission is left as the serial run leaves it
+    error = np.abs(mission.segments[cruise_segment_tag].distance - serial_distance) / serial_distance
+    assert error < 1e-3
+    assert mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff == serial_takeoff
+    
     return
 
 
 def check_results(new_results):
 
+    # the ranges at max payload, at max fuel and the ferry range
+    range_truth = [ 2033.7722672157038, 2542.771895471921, 3041.4597572909447 ]
+    
+    for i in range(3):
+        error = np.abs(new_results.range[i+1] - range_truth[i]) / range_truth[i]
+        print 'range', i+1, 'error :', error
+        assert error < 1e-6
+
     return
 
 
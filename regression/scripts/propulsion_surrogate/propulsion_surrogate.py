@@ -1,7 +1,7 @@
 # propulsion_surrogate.py
 #
 # Created:  Jun 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -54,6 +54,33 @@ def main():
     print 'Errors:'
     print  error
     
+    for k,v in error.items():
+        assert(np.abs(v)<1e-6)
+        
+    # Gridded deck, linear in every input so the interpolation is exact
+    propulsion = Propulsor_Surrogate()
+    propulsion.input_file        = 'deck_grid.csv'
+    propulsion.number_of_engines = 1.
+    propulsion.surrogate_type    = 'grid'
+    propulsion.build_surrogate()
+    
+    state.conditions.freestream.mach_number = np.array([[0.4],[0.2]])
+    state.conditions.freestream.altitude    = np.array([[2500.],[0.]])
+    state.conditions.propulsion.throttle    = np.array([[0.75],[0.5]])
+    
+    results = propulsion.evaluate_thrust(state)
+    F    = results.thrust_force_vector
+    mdot = results.vehicle_mass_rate
+    
+    F_truth    = np.array([[2575.],[2100.]])
+    mdot_truth = np.array([[1390.5],[1092.]])
+    
+    error = Data()
+    error.Grid_Thrust    = np.max(np.abs(F[:,0:1]-F_truth)/F_truth)
+    error.Grid_Mass_Rate = np.max(np.abs(mdot-mdot_truth)/mdot_truth)
+    
+    print  error
+    
     for k,v in error.items():
         assert(np.abs(v)<1e-6)
      
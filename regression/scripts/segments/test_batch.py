@@ -0,0 +1,137 @@
+# test_batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    # vehicle variants with different takeoff weights and wing areas
+    variants = [ (79015.8 * Units.kg, 124.862 * Units['meters**2']),
+                 (72000.0 * Units.kg, 124.862 * Units['meters**2']),
+                 (75000.0 * Units.kg, 135.000 * Units['meters**2']) ]
+
+    batch = SUAVE.Analyses.Mission.Batch()
+    batch.tag = 'the_batch'
+
+    missions = []
+    for ii,(mass,area) in enumerate(variants):
+        analyses = variant_analyses(mass,area)
+        missions.append(mission_setup(analyses,'case_%i' % ii))
+        batch.append_case(mission_setup(analyses,'case_%i' % ii))
+
+    # the same cases solved one at a time
+    t0 = time.time()
+    singles = [ mission.evaluate() for mission in missions ]
+    t1 = time.time()
+    results = batch.evaluate()
+    t2 = time.time()
+
+    print 'cases one at a time : %.3f s' % (t1-t0)
+    print 'batch               : %.3f s' % (t2-t1)
+
+    # a batch does not cost more than its cases
+    assert (t2-t1) < 1.2 * (t1-t0) + 0.5
+
+    for ii,single in enumerate(singles):
+        case = results.segments['case_%i' % ii]
+        for tag in ['climb','cruise']:
+            check_results(case.segments[tag],single.segments[tag],'case_%i %s' % (ii,tag))
+
+    # the cases are independent, so each one starts from its own vehicle
+    masses = [ results.segments['case_%i' % ii].segments.climb.conditions.weights.total_mass[0,0] for ii in xrange(len(variants)) ]
+    assert np.max(np.abs(np.array(masses) - np.array([ mass for mass,area in variants ]))) < 1e-6
+
+    return
+
+def variant_analyses(mass,area):
+
+    vehicle = vehicle_setup()
+    vehicle.mass_properties.takeoff         = mass
+    vehicle.wings.main_wing.areas.reference = area
+    vehicle.reference_area                  = area
+
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses
+
+def mission_setup(analyses,tag):
+
+    mission = SUAVE.Analyses.Mission.All_At_Once()
+    mission.tag = tag
+
+    airport = SUAVE.Attributes.Airports.Airport()
+    airport.altitude   =  0.0  * Units.ft
+    airport.delta_isa  =  0.0
+    airport.atmosphere = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
+    mission.airport = airport
+
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.tag = "climb"
+
+    segment.analyses.extend( analyses.takeoff )
+
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 8.0   * Units.km
+    segment.air_speed      = 150.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude()
+    segment.tag = "cruise"
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.altitude  = 8.0    * Units.km
+    segment.air_speed = 230.0  * Units['m/s']
+    segment.distance  = 1000.0 * Units.km
+
+    mission.append_segment(segment)
+
+    return mission
+
+def check_results(results,truth,name):
+
+    mass       = results.conditions.weights.total_mass[:,0]
+    mass_truth = truth.conditions.weights.total_mass[:,0]
+
+    throttle       = results.conditions.propulsion.throttle[:,0]
+    throttle_truth = truth.conditions.propulsion.throttle[:,0]
+
+    mass_error     = np.max(np.abs(mass - mass_truth)) / mass_truth[-1]
+    throttle_error = np.max(np.abs(throttle - throttle_truth))
+
+    print name, 'mass error :', mass_error, ', throttle error :', throttle_error
+
+    assert mass_error     < 1e-6
+    assert throttle_error < 1e-5
+
+if __name__ == '__main__':
+    main()
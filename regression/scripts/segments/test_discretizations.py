@@ -0,0 +1,113 @@
+# test_discretizations.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------        
+#   Imports
+# ----------------------------------------------------------------------  
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Utilities.Chebyshev import lgl_data, piecewise_data
+from SUAVE.Methods.Missions.Segments import converge_adaptive
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------        
+#   The Test
+# ----------------------------------------------------------------------  
+
+def main():
+    
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    # the default Chebyshev discretization
+    mission = mission_setup(analyses)
+    truth   = mission.evaluate().segments.climb
+    
+    # Legendre-Gauss-Lobatto points
+    mission = mission_setup(analyses)
+    mission.segments.climb.state.numerics.discretization_method = lgl_data
+    results = mission.evaluate().segments.climb
+    check_results(results,truth,'lgl_data')
+    
+    # three Chebyshev elements
+    mission = mission_setup(analyses)
+    mission.segments.climb.state.numerics.discretization_method = piecewise_data
+    mission.segments.climb.state.numerics.number_of_elements    = 3
+    results = mission.evaluate().segments.climb
+    check_results(results,truth,'piecewise_data')
+    
+    # adaptive refinement from a coarse discretization
+    mission = mission_setup(analyses)
+    segment = mission.segments.climb
+    segment.state.numerics.number_control_points = 5
+    segment.process.converge.converge_root       = converge_adaptive
+    results = mission.evaluate().segments.climb
+    check_results(results,truth,'converge_adaptive')
+    
+    numerics = results.numerics
+    print 'adaptive control points :', numerics.number_control_points
+    assert numerics.number_control_points > 5
+    assert numerics.discretization_error <= numerics.adaptive_tolerance
+    
+    return
+
+def mission_setup(analyses):
+    
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+    
+    airport = SUAVE.Attributes.Airports.Airport()
+    airport.altitude   =  0.0  * Units.ft
+    airport.delta_isa  =  0.0
+    airport.atmosphere = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
+    mission.airport = airport    
+    
+    Segments = SUAVE.Analyses.Mission.Segments
+    
+    segment = Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.tag = "climb"
+    
+    segment.analyses.extend( analyses.takeoff )
+    
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 8.0   * Units.km
+    segment.air_speed      = 150.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    
+    mission.append_segment(segment)
+    
+    return mission
+
+def check_results(results,truth,name):
+    
+    mass       = results.conditions.weights.total_mass[-1,0]
+    mass_truth = truth.conditions.weights.total_mass[-1,0]
+    
+    distance       = results.conditions.frames.inertial.position_vector[-1,0]
+    distance_truth = truth.conditions.frames.inertial.position_vector[-1,0]
+    
+    mass_error     = np.abs(mass - mass_truth) / mass_truth
+    distance_error = np.abs(distance - distance_truth) / distance_truth
+    
+    print name, 'final mass error :', mass_error, ', distance error :', distance_error
+    
+    assert mass_error     < 1e-6
+    assert distance_error < 1e-6
+
+if __name__ == '__main__':
+    main()
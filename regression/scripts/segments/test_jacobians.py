@@ -0,0 +1,137 @@
+# test_jacobians.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Missions.Segments.converge_root import iterate
+from SUAVE.Methods.Missions.Segments.jacobian import jacobian_sparsity, color_columns, colored_finite_difference
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # the dense Jacobian of fsolve
+    mission = mission_setup(analyses,SUAVE.Analyses.Mission.Sequential_Segments())
+    truth   = mission.evaluate()
+
+    # the colored finite difference Jacobian
+    mission = mission_setup(analyses,SUAVE.Analyses.Mission.Sequential_Segments())
+    for segment in mission.segments.values():
+        segment.state.numerics.solver_jacobian = 'finite_difference'
+    results = mission.evaluate()
+    check_results(results,truth,'sequential')
+
+    # all the segments at once, the Jacobian drops the couplings between the segments
+    mission = mission_setup(analyses,SUAVE.Analyses.Mission.All_At_Once())
+    mission.state.numerics.solver_jacobian = 'finite_difference'
+    results = mission.evaluate()
+    check_results(results,truth,'all at once')
+
+    # the colored Jacobian of the converged climb against a dense one
+    segment = mission_setup(analyses,SUAVE.Analyses.Mission.Sequential_Segments()).segments.climb
+    segment.state.numerics.solver_jacobian = 'finite_difference'
+    state    = segment.evaluate()
+    unknowns = state.unknowns.pack_array()
+
+    sparsity = jacobian_sparsity(segment,state)
+    colors   = color_columns(sparsity)
+    columns  = [ np.array([col]) for col in xrange(len(unknowns)) ]
+
+    colored = colored_finite_difference(iterate,unknowns,[segment,state,None],sparsity,colors)
+    dense   = colored_finite_difference(iterate,unknowns,[segment,state,None],np.ones_like(sparsity),columns)
+
+    scale          = np.max(np.abs(dense))
+    pattern_error  = np.max(np.abs(colored - dense)[sparsity]) / scale
+    dropped        = np.max(np.abs(dense[~sparsity])) / scale
+
+    print 'colors :', len(colors), 'of', len(unknowns), 'columns'
+    print 'pattern error :', pattern_error, ', dropped coupling :', dropped
+
+    assert len(colors) < len(unknowns)
+    assert np.all(colored[~sparsity] == 0.)
+
+    # the only difference is the mass integration coupling that the pattern leaves out
+    assert dropped       < 1e-3
+    assert pattern_error < 1e-2
+
+    return
+
+def mission_setup(analyses,mission):
+
+    mission.tag = 'the_mission'
+
+    airport = SUAVE.Attributes.Airports.Airport()
+    airport.altitude   =  0.0  * Units.ft
+    airport.delta_isa  =  0.0
+    airport.atmosphere = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
+    mission.airport = airport
+
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.tag = "climb"
+
+    segment.analyses.extend( analyses.takeoff )
+
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 8.0   * Units.km
+    segment.air_speed      = 150.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude()
+    segment.tag = "cruise"
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.altitude  = 8.0    * Units.km
+    segment.air_speed = 230.0  * Units['m/s']
+    segment.distance  = 1000.0 * Units.km
+
+    mission.append_segment(segment)
+
+    return mission
+
+def check_results(results,truth,name):
+
+    mass       = results.segments[-1].conditions.weights.total_mass[-1,0]
+    mass_truth = truth.segments[-1].conditions.weights.total_mass[-1,0]
+
+    distance       = results.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+    distance_truth = truth.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+
+    mass_error     = np.abs(mass - mass_truth) / mass_truth
+    distance_error = np.abs(distance - distance_truth) / distance_truth
+
+    print name, 'final mass error :', mass_error, ', distance error :', distance_error
+
+    assert mass_error     < 1e-6
+    assert distance_error < 1e-6
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# test_optimized_climb.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Missions.Segments.optimize import get_objective, get_econstraints, get_ieconstraints, make_bnds
+
+import numpy as np
+import scipy.optimize as opt
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # the solve with the gradients of scipy, every output at every point runs the segment
+    mission = mission_setup(analyses)
+    mission.segments.climb.process.converge.converge_root = converge_scipy_gradients
+    truth   = mission.evaluate().segments.climb
+
+    # the solve that shares one iteration per point and finds all the gradients together
+    mission = mission_setup(analyses)
+    mission.segments.climb.process.iterate.outputs.record = record_point
+    del points_run[:]
+    results = mission.evaluate().segments.climb
+
+    counters = results.numerics.optimization
+
+    print 'iterations :', counters.iterations, ', gradients :', counters.gradients, ', memo hits :', counters.memo_hits
+    print 'scipy gradient iterations :', truth.scipy_iterations
+
+    # the objective, the constraints and the gradients at a point come from one iteration,
+    # only the solution is run again by the iterate process of the segment after converging
+    assert counters.gradients > 0
+    assert counters.memo_hits > 0
+    assert counters.iterations == len(points_run) - 1
+    assert len(set(points_run)) == counters.iterations
+    assert points_run[-1] in points_run[:-1]
+    assert counters.iterations < truth.scipy_iterations
+
+    # the same climb
+    time       = results.conditions.frames.inertial.time[-1,0]
+    time_truth = truth.conditions.frames.inertial.time[-1,0]
+
+    altitude       = results.conditions.freestream.altitude[:,0]
+    altitude_truth = truth.conditions.freestream.altitude[:,0]
+
+    time_error     = np.abs(time - time_truth) / time_truth
+    altitude_error = np.max(np.abs(altitude - altitude_truth)) / segment_altitude_end
+
+    residuals = np.max(np.abs(results.residuals.pack_array()))
+
+    print 'time to climb :', time, ', error :', time_error
+    print 'altitude error :', altitude_error, ', residuals :', residuals
+
+    assert time_error     < 1e-5
+    assert altitude_error < 1e-4
+    assert residuals      < 1e-5
+
+    return
+
+segment_altitude_end = 8.0 * Units.km
+
+# the unknowns of every iteration of the segment
+points_run = []
+
+def record_point(segment,state):
+
+    points_run.append(state.unknowns.pack_array().tostring())
+
+    return
+
+def converge_scipy_gradients(segment,state):
+
+    # the solve with the finite difference gradients of scipy, each output is run on its own
+    state.scipy_iterations = 0
+
+    def count(function):
+        def counted(unknowns):
+            state.scipy_iterations += 1
+            return function(unknowns,(segment,state))
+        return counted
+
+    unknowns = state.unknowns.pack_array()
+    bnds     = make_bnds(unknowns,(segment,state))
+
+    unknowns = opt.fmin_slsqp(count(get_objective),unknowns,f_eqcons=count(get_econstraints),
+                              f_ieqcons=count(get_ieconstraints),bounds=bnds,iter=2000)
+
+    get_objective(unknowns,(segment,state))
+
+    return
+
+def mission_setup(analyses):
+
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+
+    airport = SUAVE.Attributes.Airports.Airport()
+    airport.altitude   =  0.0  * Units.ft
+    airport.delta_isa  =  0.0
+    airport.atmosphere = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
+    mission.airport = airport
+
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    segment = Segments.Climb.Optimized()
+    segment.tag = "climb"
+
+    segment.analyses.extend( analyses.takeoff )
+
+    segment.altitude_start  = 0.0   * Units.km
+    segment.altitude_end    = segment_altitude_end
+    segment.air_speed_start = 150.0 * Units['m/s']
+    segment.air_speed_end   = 200.0 * Units['m/s']
+    segment.objective       = 'conditions.frames.inertial.time[-1,0]'
+    segment.state.numerics.number_control_points = 4
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+# test_surrogate_sampling.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Optimization import Nexus, Surrogate_Optimization, read_optimization_outputs, write_optimization_outputs
+from SUAVE.Analyses import Process
+
+import numpy as np
+import os
+import shutil
+import tempfile
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the optimization files and their plans are written in a temporary folder
+    folder = tempfile.mkdtemp()
+    try:
+        run_samples(folder)
+    finally:
+        shutil.rmtree(folder)
+
+    return
+
+def run_samples(folder):
+
+    npoints = 12
+
+    # an interrupted serial run, restarted in parallel
+    filename = os.path.join(folder,'surrogate_samples_restart.hist')
+
+    surrogate = surrogate_setup(filename,npoints,1)
+    surrogate.problem.sample_limit = 5
+    try:
+        surrogate.build_surrogate()
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError, 'The sampling was not interrupted'
+
+    assert len(surrogate.sampled_inputs()) == 4
+
+    surrogate = surrogate_setup(filename,npoints,3)
+    surrogate.build_surrogate()
+
+    # only the points that were left are run, and only the parent writes them
+    assert surrogate.problem.evaluation_count == npoints - 4
+    restarted = check_samples(surrogate,npoints)
+
+    # a parallel run from the start
+    filename = os.path.join(folder,'surrogate_samples_parallel.hist')
+
+    surrogate = surrogate_setup(filename,npoints,3)
+    surrogate.build_surrogate()
+
+    assert surrogate.problem.evaluation_count == npoints
+    parallel = check_samples(surrogate,npoints)
+
+    # the same plan, the same samples
+    assert np.all(restarted == parallel)
+
+    # a run that is complete is not run again
+    surrogate = surrogate_setup(filename,npoints,3)
+    surrogate.build_surrogate()
+    assert surrogate.problem.evaluation_count == 0
+    check_samples(surrogate,npoints)
+
+    return
+
+def check_samples(surrogate,npoints):
+
+    problem = surrogate.problem
+    opt_prob = problem.optimization_problem
+
+    iterations, objectives, inputs, constraints = read_optimization_outputs(surrogate.optimization_filename,opt_prob.inputs,opt_prob.constraints)
+
+    # every point of the plan is in the file once
+    plan = np.loadtxt(surrogate.optimization_filename + '.doe',ndmin=2)
+    assert len(inputs) == npoints
+    for x in plan:
+        assert np.sum(np.all(np.abs(inputs - x) < 1e-12,axis=1)) == 1
+
+    # with the values of the procedure
+    x1 = inputs[:,0] * 2.
+    x2 = inputs[:,1] * 0.5
+    assert np.max(np.abs(objectives - ((x1 - 1.)**2 + (x2 - 2.)**2))) < 1e-10
+    assert np.max(np.abs(constraints[:,0] - (x1 + x2))) < 1e-10
+
+    return np.array(sorted(map(tuple,inputs)))
+
+def sample_plan(bounds,npoints):
+
+    # a fixed set of points inside the scaled bounds
+    state = np.random.RandomState(4)
+    lower = bounds[:,0]
+    upper = bounds[:,1]
+
+    return lower + (upper - lower) * state.rand(npoints,len(bounds))
+
+# ----------------------------------------------------------------------
+#   Toy Problem
+# ----------------------------------------------------------------------
+
+def surrogate_setup(filename,npoints,workers):
+
+    surrogate = Surrogate_Optimization()
+    surrogate.problem               = toy_setup()
+    surrogate.sample_plan           = sample_plan
+    surrogate.optimization_filename = filename
+    surrogate.number_of_points      = npoints
+
+    surrogate.problem.number_of_workers = workers
+    surrogate.problem.use_history_file  = True
+
+    return surrogate
+
+def toy_setup():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    #   [ tag , initial, (lb,ub)    , scaling , units ]
+    problem.inputs = np.array([
+        [ 'x1', 0.5    , (-2., 2.)  , 2.      , Units.less],
+        [ 'x2', 0.5    , (-2., 2.)  , 0.5     , Units.less],
+    ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'f', 1., Units.less ]
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'g', '>', 0., 1., Units.less ]
+    ])
+
+    problem.aliases = [
+        [ 'x1', 'results.x1' ],
+        [ 'x2', 'results.x2' ],
+        [ 'f' , 'summary.f'  ],
+        [ 'g' , 'summary.g'  ],
+    ]
+
+    nexus.results.x1 = 0.
+    nexus.results.x2 = 0.
+    nexus.total_number_of_iterations = 0
+    nexus.sample_limit = None
+
+    nexus.procedure = Process()
+    nexus.procedure.toy   = toy_procedure
+    nexus.procedure.write = write_procedure
+
+    return nexus
+
+def toy_procedure(nexus):
+
+    # stands in for a run that is killed
+    if nexus.sample_limit is not None and nexus.evaluation_count >= nexus.sample_limit:
+        raise RuntimeError, 'The sampling was interrupted'
+
+    x1 = nexus.results.x1
+    x2 = nexus.results.x2
+
+    nexus.summary = Data()
+    nexus.summary.f = (x1 - 1.)**2 + (x2 - 2.)**2
+    nexus.summary.g = x1 + x2
+
+    return nexus
+
+def write_procedure(nexus):
+
+    nexus.total_number_of_iterations += 1
+    write_optimization_outputs(nexus)
+
+    return nexus
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# test_aliases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Optimization import Nexus
+from SUAVE.Analyses import Process
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    index_test()
+    recompile_test()
+    error_test()
+
+    return
+
+def index_test():
+
+    nexus = toy_setup()
+
+    # the inputs are set in the array, the outputs read from it
+    obj = nexus.objective([0.5,1.5])
+    assert np.all(nexus.results.x == [[0.,1.5],[0.,0.],[0.5,0.]])
+    assert obj == (0.5 - 1.)**2 + (1.5 - 2.)**2
+    assert nexus.all_constraints([0.5,1.5]) == [2.]
+
+    return
+
+def recompile_test():
+
+    nexus = toy_setup()
+    problem = nexus.optimization_problem
+
+    nexus.objective([0.5,1.5])
+    compiled = nexus.compiled_aliases
+
+    # the same tables keep the same compiled paths
+    nexus.objective([1.,1.])
+    assert nexus.compiled_aliases is compiled
+
+    # an alias changed in place
+    problem.aliases[2][1] = 'summary.g[0]'
+    assert nexus.objective([1.,1.5]) == 2.5
+    assert not nexus.compiled_aliases is compiled
+    compiled = nexus.compiled_aliases
+
+    # an objective with another name, in a new table
+    problem.aliases.append([ 'h', 'summary.f[-1,0]' ])
+    problem.objective = np.array([
+        [ 'h', 1., Units.less ]
+    ])
+    assert nexus.objective([1.,2.5]) == 0.25
+    assert not nexus.compiled_aliases is compiled
+    compiled = nexus.compiled_aliases
+
+    # inputs renamed in place
+    problem.aliases.append([ 'y', 'results.x[0,1]' ])
+    problem.inputs[1,0] = 'y'
+    assert nexus.objective([1.,3.]) == 1.
+    assert not nexus.compiled_aliases is compiled
+
+    return
+
+def error_test():
+
+    nexus = toy_setup()
+    nexus.optimization_problem.aliases[2][1] = 'summary.f[-1:,0]'
+
+    # the error names the alias that can not be compiled
+    try:
+        nexus.objective([0.5,1.5])
+    except ValueError, error:
+        assert '"f"' in str(error)
+        assert 'summary.f[-1:,0]' in str(error)
+    else:
+        raise AssertionError, 'The slice was compiled'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Toy Problem
+# ----------------------------------------------------------------------
+
+def toy_setup():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    #   [ tag , initial, (lb,ub)    , scaling , units ]
+    problem.inputs = np.array([
+        [ 'x1', 0.5    , (-2., 2.)  , 1.      , Units.less],
+        [ 'x2', 0.5    , (-2., 2.)  , 1.      , Units.less],
+    ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'f', 1., Units.less ]
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'g', '>', 0., 1., Units.less ]
+    ])
+
+    problem.aliases = [
+        [ 'x1', 'results.x[-1,0]'  ],
+        [ 'x2', 'results.x[0,1]'   ],
+        [ 'f' , 'summary.f[-1,0]'  ],
+        [ 'g' , 'summary.g[0]'     ],
+    ]
+
+    nexus.results.x = np.zeros((3,2))
+
+    nexus.procedure = Process()
+    nexus.procedure.toy = toy_procedure
+
+    return nexus
+
+def toy_procedure(nexus):
+
+    x1 = nexus.results.x[-1,0]
+    x2 = nexus.results.x[0,1]
+
+    nexus.summary = Data()
+    nexus.summary.f = np.array([[0.],[(x1 - 1.)**2 + (x2 - 2.)**2]])
+    nexus.summary.g = np.array([x1 + x2])
+
+    return nexus
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# test_binary_archive.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------        
+#   Imports
+# ----------------------------------------------------------------------  
+
+import SUAVE
+from SUAVE.Core import Data, DataOrdered
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------        
+#   The Test
+# ----------------------------------------------------------------------  
+
+def main():
+    
+    results = build_results(n_segments=3,n_points=16)
+    
+    SUAVE.Input_Output.SUAVE.archive(results,'results_binary.res',binary=True)
+    
+    # eager and memory mapped loads give the same data
+    for lazy in [False,True]:
+        loaded = SUAVE.Input_Output.SUAVE.load('results_binary.res',lazy=lazy)
+        check_equal(results,loaded)
+        
+    # changing a memory mapped array does not change the file
+    loaded = SUAVE.Input_Output.SUAVE.load('results_binary.res',lazy=True)
+    loaded.segments.segment_0.conditions.frames.inertial.position_vector[:] = 0.
+    loaded = SUAVE.Input_Output.SUAVE.load('results_binary.res')
+    check_equal(results,loaded)
+    
+    # timing against the JSON archive
+    results = build_results(n_segments=20,n_points=2000)
+    
+    t0 = time.time()
+    SUAVE.Input_Output.SUAVE.archive(results,'results_json.res')
+    SUAVE.Input_Output.SUAVE.load('results_json.res')
+    t1 = time.time()
+    SUAVE.Input_Output.SUAVE.archive(results,'results_binary.res',binary=True)
+    SUAVE.Input_Output.SUAVE.load('results_binary.res')
+    t2 = time.time()
+    
+    print 'JSON archive and load   : %.3f s' % (t1-t0)
+    print 'Binary archive and load : %.3f s' % (t2-t1)
+    
+    return
+
+def build_results(n_segments,n_points):
+    
+    results = Data()
+    results.tag      = 'mission'
+    results.segments = DataOrdered()
+    
+    for i in xrange(n_segments):
+        segment = Data()
+        segment.tag        = 'segment_%i' % i
+        segment.converged  = True
+        segment.weights    = [1., 2., 3.]
+        segment.note       = None
+        segment.conditions = Data()
+        segment.conditions.frames = Data()
+        segment.conditions.frames.inertial = Data()
+        segment.conditions.frames.inertial.position_vector = np.random.rand(n_points,3)
+        segment.conditions.frames.inertial.time            = np.linspace(0.,100.,n_points)[:,None]
+        segment.conditions.weights = DataOrdered()
+        segment.conditions.weights.total_mass = np.random.rand(n_points,1).astype(np.float32)
+        segment.conditions.weights.count      = np.arange(n_points)
+        segment.conditions.weights.empty      = np.zeros((0,3))
+        segment.conditions.weights.scalar     = np.float64(2.)
+        segment.conditions.flags = np.random.rand(n_points,1) > 0.5
+        results.segments[segment.tag] = segment
+        
+    return results
+
+def check_equal(a,b):
+    
+    assert type(a) == type(b)
+    # only ordered data keeps the order of its keys
+    if isinstance(a,DataOrdered):
+        assert a.keys() == b.keys()
+    else:
+        assert sorted(a.keys()) == sorted(b.keys())
+    
+    for k in a.keys():
+        u = a[k]
+        v = b[k]
+        if isinstance(u,dict):
+            check_equal(u,v)
+        elif isinstance(u,np.ndarray):
+            assert u.dtype == v.dtype
+            assert u.shape == v.shape
+            assert np.all(u == v)
+        else:
+            assert u == v
+    
+# ----------------------------------------------------------------------        
+#   Call Main
+# ----------------------------------------------------------------------  
+    
+if __name__ == '__main__':
+    main()
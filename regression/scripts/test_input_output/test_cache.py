@@ -0,0 +1,212 @@
+# test_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units, Cache, hash_data
+from SUAVE.Optimization import Nexus
+from SUAVE.Analyses import Process
+
+import numpy as np
+import os
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    hash_test()
+    eviction_test()
+    persistence_test()
+    history_test()
+
+    return
+
+def hash_test():
+
+    a = Data()
+    a.x = np.array([1.,2.,3.])
+    a.y = 'wing'
+
+    # the order of the keys does not change the hash
+    b = Data()
+    b.y = 'wing'
+    b.x = np.array([1.,2.,3.])
+
+    assert hash_data(a) == hash_data(b)
+    assert hash_data(a,1) != hash_data(a,2)
+
+    # nor does the copy of an array, but its type and shape do
+    assert hash_data(np.arange(4.)) == hash_data(np.arange(4.).copy())
+    assert hash_data(np.arange(4.)) != hash_data(np.arange(4))
+    assert hash_data(np.arange(4.)) != hash_data(np.arange(4.).reshape((2,2)))
+    assert hash_data([1.,2.]) != hash_data([2.,1.])
+
+    return
+
+def eviction_test():
+
+    for policy in ['lru','fifo']:
+        cache = Cache(max_size=3,policy=policy)
+        for key in 'abc':
+            cache.store(key,Data(value=key))
+
+        found, value = cache.lookup('d')
+        assert not found and value is None
+
+        # a copy comes out, changing it leaves the cache alone
+        found, value = cache.lookup('a')
+        assert found and value.value == 'a'
+        value.value = 'changed'
+        assert cache.lookup('a')[1].value == 'a'
+
+        assert cache.hits   == 2
+        assert cache.misses == 1
+
+        # the lookups of 'a' keep it with lru, the oldest store goes with fifo
+        cache.store('d',Data(value='d'))
+        assert len(cache) == 3
+        if policy == 'lru':
+            assert 'a' in cache and not 'b' in cache
+        else:
+            assert not 'a' in cache and 'b' in cache
+        assert 'c' in cache and 'd' in cache
+
+        cache.clear()
+        assert len(cache) == 0 and cache.hits == 0 and cache.misses == 0
+
+    return
+
+def persistence_test():
+
+    filename = 'cache_test.pkl'
+    if os.path.exists(filename):
+        os.remove(filename)
+
+    cache = Cache(max_size=3,filename=filename)
+    for ii in xrange(7):
+        cache.store(str(ii),np.ones(2)*ii)
+
+    # each store is appended, the file is not rewritten
+    size = os.path.getsize(filename)
+    cache.store('1',np.ones(2)*10.)
+    assert os.path.getsize(filename) > size
+
+    # the latest records win and the oldest ones are left out
+    cache = Cache(max_size=3,filename=filename)
+    assert cache.entries.keys() == ['5','6','1']
+    assert np.all(cache.lookup('1')[1] == 10.)
+    assert np.all(cache.lookup('6')[1] == 6.)
+
+    # the reload rewrote the file with only the entries it kept
+    assert len(Cache(max_size=None,filename=filename)) == 3
+
+    # a record cut short ends the file
+    f = open(filename,'ab')
+    f.write('\x80\x02(U')
+    f.close()
+    assert len(Cache(max_size=3,filename=filename)) == 3
+
+    os.remove(filename)
+
+    return
+
+def history_test():
+
+    nexus = toy_setup()
+    nexus.evaluation_history = Cache(max_size=16)
+
+    obj = nexus.objective([0.5,0.5])
+    con = nexus.all_constraints([0.5,0.5])
+    nexus.objective([1.,1.])
+
+    # a point run before is replayed
+    assert nexus.objective([0.5,0.5]) == obj
+    assert nexus.all_constraints([0.5,0.5]) == con
+    assert nexus.evaluation_count == 2
+    assert nexus.evaluation_history.misses == 2
+    assert nexus.evaluation_history.hits   == 1
+
+    # within the tolerance, a point is replayed
+    nexus.history_tolerance = 1e-6
+    nexus.objective([0.5,0.5])
+    nexus.objective([0.5+1e-8,0.5])
+    assert nexus.evaluation_count == 3
+
+    # the finite difference steps are evaluated, the point itself is the one replayed above
+    grad_obj, jac_con = nexus.finite_difference(np.array([0.5,0.5]),diff_interval=1e-5)
+    assert nexus.evaluation_count == 5
+    assert np.max(np.abs(grad_obj - [-1.,-3.])) < 2e-3
+    assert np.max(np.abs(jac_con  - [[1.,1.]])) < 2e-3
+
+    # a tolerance larger than the step is rejected
+    nexus.history_tolerance = 1e-4
+    try:
+        nexus.finite_difference(np.array([0.5,0.5]),diff_interval=1e-5)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError, 'The history tolerance was not checked'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Toy Problem
+# ----------------------------------------------------------------------
+
+def toy_setup():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    #   [ tag , initial, (lb,ub)    , scaling , units ]
+    problem.inputs = np.array([
+        [ 'x1', 0.5    , (-2., 2.)  , 1.      , Units.less],
+        [ 'x2', 0.5    , (-2., 2.)  , 1.      , Units.less],
+    ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'f', 1., Units.less ]
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'g', '>', 0., 1., Units.less ]
+    ])
+
+    problem.aliases = [
+        [ 'x1', 'results.x1' ],
+        [ 'x2', 'results.x2' ],
+        [ 'f' , 'summary.f'  ],
+        [ 'g' , 'summary.g'  ],
+    ]
+
+    nexus.results.x1 = 0.
+    nexus.results.x2 = 0.
+
+    nexus.procedure = Process()
+    nexus.procedure.toy = toy_procedure
+
+    return nexus
+
+def toy_procedure(nexus):
+
+    x1 = nexus.results.x1
+    x2 = nexus.results.x2
+
+    nexus.summary = Data()
+    nexus.summary.f = (x1 - 1.)**2 + (x2 - 2.)**2
+    nexus.summary.g = x1 + x2
+
+    return nexus
+
+if __name__ == '__main__':
+    main()
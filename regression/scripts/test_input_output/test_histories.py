@@ -0,0 +1,113 @@
+# test_histories.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------        
+#   Imports
+# ----------------------------------------------------------------------  
+
+import SUAVE
+from SUAVE.Core import Data, is_history_file
+from SUAVE.Optimization import read_optimization_outputs
+from SUAVE.Optimization.write_optimization_outputs import write_optimization_record
+from SUAVE.Sizing import read_sizing_inputs, write_sizing_outputs
+
+import numpy as np
+import os
+
+# ----------------------------------------------------------------------        
+#   The Test
+# ----------------------------------------------------------------------  
+
+def main():
+    
+    optimization_test()
+    sizing_test()
+    
+    for filename in ['optimization_history.hist','optimization_history.txt','sizing_history.hist','sizing_history.txt']:
+        os.remove(filename)
+    
+    return
+
+def optimization_test():
+    
+    base_inputs       = np.zeros(2)
+    constraint_inputs = np.zeros(3)
+    
+    for filename in ['optimization_history.hist','optimization_history.txt']:
+        if os.path.exists(filename):
+            os.remove(filename)
+    
+    # a new file is a history file when asked, read again after every record
+    filename = 'optimization_history.hist'
+    records  = []
+    for ii in xrange(4):
+        record = [ii, np.array([10.-ii]), np.array([1.,2.])*ii, np.array([3.,4.,5.])*ii]
+        write_optimization_record(filename,*record,history=True)
+        records.append(record)
+        
+        iterations, objectives, inputs, constraints = read_optimization_outputs(filename,base_inputs,constraint_inputs)
+        check_optimization(records,iterations,objectives,inputs,constraints)
+        
+    assert is_history_file(filename)
+    
+    # an existing file keeps its format
+    record = [4, np.array([6.]), np.array([4.,8.]), np.array([12.,16.,20.])]
+    write_optimization_record(filename,*record)
+    records.append(record)
+    assert is_history_file(filename)
+    
+    # by default, a new file is a text file
+    filename = 'optimization_history.txt'
+    assert not is_history_file(filename)
+    for record in records:
+        write_optimization_record(filename,*record)
+        
+    assert not is_history_file(filename)
+    iterations, objectives, inputs, constraints = read_optimization_outputs(filename,base_inputs,constraint_inputs)
+    check_optimization(records,iterations,objectives,inputs,constraints)
+    
+    return
+
+def check_optimization(records,iterations,objectives,inputs,constraints):
+    
+    assert len(iterations) == len(records)
+    for ii,(iteration,objective,inp,con) in enumerate(records):
+        assert iterations[ii] == iteration
+        assert objectives[ii] == objective[0]
+        assert np.all(inputs[ii] == inp)
+        assert np.all(constraints[ii] == con)
+
+def sizing_test():
+    
+    sizing_loop = Data()
+    sizing_loop.default_y = np.array([1.,1.])
+    
+    for filename in ['sizing_history.hist','sizing_history.txt']:
+        if os.path.exists(filename):
+            os.remove(filename)
+            
+        sizing_loop.output_filename  = filename
+        sizing_loop.use_history_file = filename.endswith('.hist')
+        
+        opt_inputs = np.array([0.5,2.,3.])
+        records    = []
+        for ii in xrange(3):
+            y_save = np.array([100.+ii,200.+ii])
+            write_sizing_outputs(sizing_loop,y_save,opt_inputs*(ii+1))
+            records.append((opt_inputs*(ii+1),y_save))
+            
+            data_inputs, data_outputs, read_success = read_sizing_inputs(sizing_loop,opt_inputs)
+            assert read_success == 1
+            assert data_inputs.shape == (ii+1,3)
+            for jj,(inp,y) in enumerate(records):
+                assert np.all(data_inputs[jj]  == inp)
+                assert np.all(data_outputs[jj] == y)
+                
+        assert is_history_file(filename) == filename.endswith('.hist')
+    
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# test_mission_archive.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+import os
+import shutil
+import tempfile
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+
+    configs.finalize()
+    analyses.finalize()
+
+    results = analyses.missions.base.evaluate()
+
+    # the solver leaves nothing in the states that can not be archived
+    for segment in results.segments.values():
+        assert not [ key for key in segment.keys() if key.startswith('_') ]
+
+    folder = tempfile.mkdtemp()
+    try:
+        for binary in [False,True]:
+            filename = os.path.join(folder,'mission_results.res')
+            SUAVE.Input_Output.SUAVE.archive(results,filename,binary=binary)
+            loaded = SUAVE.Input_Output.SUAVE.load(filename)
+
+            assert loaded.segments.keys() == results.segments.keys()
+            for tag,segment in results.segments.items():
+                check_equal(segment.conditions,loaded.segments[tag].conditions)
+    finally:
+        shutil.rmtree(folder)
+
+    return
+
+def check_equal(a,b):
+
+    assert sorted(a.keys()) == sorted(b.keys())
+    for key,value in a.items():
+        if isinstance(value,Data):
+            check_equal(value,b[key])
+        elif isinstance(value,np.ndarray):
+            assert np.all(value == b[key])
+
+if __name__ == '__main__':
+    main()
@@ -36,6 +36,10 @@ def main():
     analyses.finalize()
     
     results = mission.evaluate()
+    
+    # the next solve starts from this one
+    mission.set_warm_start(results)
+    
     results = results.merged()
     
     plot_results(results)
@@ -44,6 +48,18 @@ def main():
     print 'landing weight error' , error
     assert error < 1.
     
+    # a slightly heavier vehicle, solved from the warm start
+    vehicle.mass_properties.takeoff = 70100 * Units.kg
+    configs.finalize()
+    analyses.finalize()
+    
+    results = mission.evaluate()
+    results = results.merged()
+    
+    error = abs(mission.target_landing_weight - results.conditions.weights.total_mass[-1,0])
+    print 'warm started landing weight error' , error
+    assert error < 1.
+    
     return
     
     
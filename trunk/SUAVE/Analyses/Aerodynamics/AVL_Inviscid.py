@@ -2,6 +2,7 @@
 # AVL_Inviscid.py
 #
 # Created: Apr 2017, M. Clarke 
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -28,12 +29,12 @@ from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
 
 # Package imports
 import time
-import pylab as plt
 import os
 import sklearn
 from sklearn import gaussian_process
 import numpy as np
 import sys
+import multiprocessing
 from shutil import rmtree
 from warnings import warn
 
@@ -70,6 +71,7 @@ class AVL_Inviscid(Aerodynamics):
         """          
         self.tag                             = 'avl'
         self.keep_files                      = True
+        self.number_of_workers               = 1
         
         self.settings                        = Settings()
         
@@ -83,6 +85,7 @@ class AVL_Inviscid(Aerodynamics):
         
         self.settings.filenames.log_filename = sys.stdout
         self.settings.filenames.err_filename = sys.stderr
+        self.settings.plot_surrogate         = False
         
         # Conditions table, used for surrogate model training
         self.training                        = Data()   
@@ -160,11 +163,9 @@ class AVL_Inviscid(Aerodynamics):
         lift_model    = surrogates.lift_coefficient
         drag_model    = surrogates.drag_coefficient
         
-        # Inviscid lift
+        # Inviscid lift, all the points at once
         data_len      = len(AoA)
-        inviscid_lift = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii] = lift_model.predict(np.array([AoA[ii][0],mach[ii][0]]))
+        inviscid_lift = np.reshape(lift_model.predict(np.hstack([AoA,mach])),[data_len,1])
             
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()    
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = inviscid_lift
@@ -180,7 +181,9 @@ class AVL_Inviscid(Aerodynamics):
         
 
     def sample_training(self):
-        """Call methods to run AVL for sample point evaluation.
+        """Call methods to run AVL for sample point evaluation. There is one AVL run per Mach
+        number. With more than one worker, the runs are done concurrently, each in its own
+        folder inside the run folder.
 
         Assumptions:
         Returned drag values are not meaningful.
@@ -202,6 +205,10 @@ class AVL_Inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.number_of_workers
+        self.settings.filenames.
+          run_folder
+          case_folder_template
         """          
         # Unpack
         geometry = self.geometry
@@ -223,7 +230,9 @@ class AVL_Inviscid(Aerodynamics):
             
             for i,_ in enumerate(mach):
                 for j,_ in enumerate(AoA):
-                    xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
+                    xy[i*len(AoA)+j,:] = np.array([AoA[j],mach[i]])
+                    
+            run_cases = []
             for j,_ in enumerate(mach):
                 # Set training conditions
                 run_conditions = Aerodynamics()
@@ -232,15 +241,35 @@ class AVL_Inviscid(Aerodynamics):
                 run_conditions.freestream.gravity           = 9.81          
                 run_conditions.aerodynamics.angle_of_attack = AoA
                 run_conditions.freestream.mach_number       = mach[j]
+                run_cases.append(run_conditions)
+                
+            workers = min(self.number_of_workers,len(mach))
+            
+            if workers > 1:
+                # Each Mach number runs in its own folder
+                run_folder   = os.path.abspath(self.settings.filenames.run_folder)
+                case_folders = [ os.path.join(run_folder,self.settings.filenames.case_folder_template.format(j)) for j in xrange(len(mach)) ]
                 
-                #Run Analysis at AoA[i] and mach[j]
-                results =  self.evaluate_conditions(run_conditions)
+                pool = multiprocessing.Pool(workers,initializer=initialize_worker,initargs=(self,))
+                try:
+                    coefficients = pool.map(evaluate_case,zip(case_folders,run_cases),chunksize=1)
+                finally:
+                    pool.terminate()
+                    pool.join()
+                    
+                if not self.keep_files and os.path.exists(run_folder):
+                    rmtree( run_folder )
+            else:
+                coefficients = []
+                for run_conditions in run_cases:
+                    #Run Analysis at all AoA and mach[j]
+                    results = self.evaluate_conditions(run_conditions)
+                    coefficients.append(case_coefficients(results))
                 
-                # Obtain CD and CL # Store other variables here as well 
-                CL[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.lift_coefficient[:,0]
-                CD[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.drag_breakdown.induced.total[:,0]      
-           
-                count += 1
+            # Obtain CD and CL, the runs come back in the order of the Mach numbers
+            for count,(CL_case,CD_case) in enumerate(coefficients):
+                CL[count*len(AoA):(count+1)*len(AoA),0] = CL_case
+                CD[count*len(AoA):(count+1)*len(AoA),0] = CD_case
             
             time1 = time.time()
             
@@ -281,7 +310,7 @@ class AVL_Inviscid(Aerodynamics):
           drag_coefficient <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.plot_surrogate
         """   
         # Unpack data
         training                         = self.training
@@ -298,20 +327,46 @@ class AVL_Inviscid(Aerodynamics):
         cd_surrogate                     = regr_cd.fit(xy, CD_data)
         self.surrogates.lift_coefficient = cl_surrogate
         self.surrogates.drag_coefficient = cd_surrogate  
+        
+        if self.settings.plot_surrogate:
+            self.plot_surrogate()
+
+        return
+    
+    def plot_surrogate(self):
+        """Plots the lift coefficient surrogate over the range of the training data.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
 
+        Inputs:
+        self.training.
+          grid_points      [radians,-] angles of attack and mach numbers 
+        self.surrogates.
+          lift_coefficient <Guassian process surrogate>
+
+        Outputs:
+        Contour plot
+
+        Properties Used:
+        No others
+        """   
+        import pylab as plt
+        
+        xy                               = self.training.grid_points 
+        cl_surrogate                     = self.surrogates.lift_coefficient
+        
         AoA_points                       = np.linspace(-3.,11.,100)*Units.deg 
         mach_points                      = np.linspace(.02,.9,100)         
             
         AoA_mesh,mach_mesh               = np.meshgrid(AoA_points,mach_points)
         
-        CL_sur                           = np.zeros(np.shape(AoA_mesh))
-        CD_sur                           = np.zeros(np.shape(AoA_mesh))
-        
-        
-        for jj in range(len(AoA_points)):
-            for ii in range(len(mach_points)):
-                CL_sur[ii,jj] = cl_surrogate.predict(np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]]))
-                CD_sur[ii,jj] = cd_surrogate.predict(np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]]))
+        # Evaluate the whole grid at once
+        points                           = np.vstack([AoA_mesh.ravel(),mach_mesh.ravel()]).T
+        CL_sur                           = np.reshape(cl_surrogate.predict(points),np.shape(AoA_mesh))
         
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
@@ -397,12 +452,89 @@ class AVL_Inviscid(Aerodynamics):
     
         return results
 
-   
+
+# ----------------------------------------------------------------------
+#  Worker Functions
+# ----------------------------------------------------------------------
+
+# the analysis copy owned by a worker process
+_worker_avl = None
+
+## @ingroup Analyses-Aerodynamics
+def initialize_worker(avl):
+    """Stores the copy of the analysis that a worker process runs AVL with.
+
+    Assumptions:
+    Called once when a worker process starts
+
+    Source:
+    N/A
+
+    Inputs:
+    avl            [AVL_Inviscid()]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    global _worker_avl
+    _worker_avl = avl
     
+## @ingroup Analyses-Aerodynamics
+def evaluate_case(case):
+    """Runs AVL for one set of training conditions in its own folder.
 
+    Assumptions:
+    initialize_worker was called in this process. Every case has a different folder.
 
+    Source:
+    N/A
 
+    Inputs:
+    case           [tuple of folder <string> and run conditions <Aerodynamics()>]
+
+    Outputs:
+    CL             [array]
+    CD             [array]
+
+    Properties Used:
+    N/A
+    """
+    folder, run_conditions = case
+    
+    avl = _worker_avl
+    avl.settings.filenames.run_folder = folder
+    avl.current_status.batch_index    = 0
     
+    results = avl.evaluate_conditions(run_conditions)
     
+    return case_coefficients(results)
+
+## @ingroup Analyses-Aerodynamics
+def case_coefficients(results):
+    """Pulls the training coefficients out of the results of an AVL run.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    results.aerodynamics.
+      lift_coefficient              [-]
+      drag_breakdown.induced.total  [-]
+
+    Outputs:
+    CL             [array]
+    CD             [array]
+
+    Properties Used:
+    N/A
+    """
+    CL = results.aerodynamics.lift_coefficient[:,0]
+    CD = results.aerodynamics.drag_breakdown.induced.total[:,0]
     
-  
\ No newline at end of file
+    return CL, CD
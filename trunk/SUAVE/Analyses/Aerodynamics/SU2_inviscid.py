@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,7 @@ from SUAVE.Core import Data, Units
 from Aerodynamics import Aerodynamics
 from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
+from SUAVE.Input_Output.SU2.run_SU2_cases import run_SU2_cases
 
 # Package imports
 import numpy as np
@@ -65,6 +67,13 @@ class SU2_inviscid(Aerodynamics):
         self.settings.parallel           = False
         self.settings.processors         = 1
         self.settings.maximum_iterations = 1500
+        
+        # Case scheduler, runs the training cases concurrently in their own folders
+        self.settings.use_case_scheduler     = False
+        self.settings.maximum_processors     = 1
+        self.settings.restart_from_neighbors = True
+        self.settings.run_folder             = 'SU2_cases'
+        self.settings.SU2_command            = 'SU2_CFD'
 
         # Conditions table, used for surrogate model training
         self.training = Data()        
@@ -155,7 +164,9 @@ class SU2_inviscid(Aerodynamics):
 
 
     def sample_training(self):
-        """Call methods to run SU2 for sample point evaluation.
+        """Call methods to run SU2 for sample point evaluation. With the case scheduler, the cases
+        run concurrently, restart from the closest converged case and are kept between runs, see
+        run_SU2_cases.
 
         Assumptions:
         None
@@ -177,6 +188,7 @@ class SU2_inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.use_case_scheduler <boolean>
         """               
         # Unpack
         geometry = self.geometry
@@ -197,6 +209,7 @@ class SU2_inviscid(Aerodynamics):
             table_size = len(AoA)*len(mach)
             xy = np.zeros([table_size,2])
             count = 0
+            cases = []
             time0 = time.time()
             for i,_ in enumerate(AoA):
                 for j,_ in enumerate(mach):
@@ -206,8 +219,17 @@ class SU2_inviscid(Aerodynamics):
                     konditions.aerodynamics.angle_of_attack = AoA[i]
                     konditions.aerodynamics.mach            = mach[j]
                     
-                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
+                    if settings.use_case_scheduler:
+                        cases.append(SU2_case(konditions, settings, geometry))
+                    else:
+                        CL[count],CD[count] = call_SU2(konditions, settings, geometry)
                     count += 1
+                    
+            if settings.use_case_scheduler:
+                SU2_results = run_SU2_cases(geometry.tag, cases, settings)
+                for count,results in enumerate(SU2_results):
+                    CL[count] = results.coefficient_of_lift
+                    CD[count] = results.coefficient_of_drag
             
             time1 = time.time()
             
@@ -357,10 +379,47 @@ def call_SU2(conditions,settings,geometry):
     N/A
     """      
 
-    half_mesh_flag = settings.half_mesh_flag
     tag            = geometry.tag
     parallel       = settings.parallel
     processors     = settings.processors 
+    
+    SU2_settings = SU2_case(conditions,settings,geometry)
+    
+    # Build SU2 configuration file
+    write_SU2_cfg(tag, SU2_settings)
+    
+    # Run SU2
+    CL, CD = call_SU2_CFD(tag,parallel,processors)
+        
+    return CL, CD
+
+def SU2_case(conditions,settings,geometry):
+    """Sets up the SU2 settings of a case
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions.
+      mach_number        [-]
+      angle_of_attack    [radians]
+    settings.
+      half_mesh_flag     <boolean> Determines if a symmetry plane is used
+      maximum_iterations [-]
+    geometry.
+      reference_area     [m^2]
+
+    Outputs:
+    SU2_settings         [Data] see write_SU2_cfg
+
+    Properties Used:
+    N/A
+    """
+
+    half_mesh_flag = settings.half_mesh_flag
     iters          = settings.maximum_iterations
     
     SU2_settings = Data()
@@ -372,10 +431,4 @@ def call_SU2(conditions,settings,geometry):
     SU2_settings.angle_of_attack = conditions.aerodynamics.angle_of_attack / Units.deg
     SU2_settings.maximum_iterations = iters
     
-    # Build SU2 configuration file
-    write_SU2_cfg(tag, SU2_settings)
-    
-    # Run SU2
-    CL, CD = call_SU2_CFD(tag,parallel,processors)
-        
-    return CL, CD
+    return SU2_settings
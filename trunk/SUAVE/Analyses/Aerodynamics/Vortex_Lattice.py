@@ -6,6 +6,7 @@
 #           Feb 2016, A. Wendorff
 #           Apr 2017, T. MacDonald
 #           Nov 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -17,6 +18,7 @@ import SUAVE
 
 from SUAVE.Core import Data
 from SUAVE.Core import Units
+from SUAVE.Core.Cache import Cache, hash_data
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice
 
@@ -40,6 +42,10 @@ class Vortex_Lattice(Aerodynamics):
     Source:
     None
     """ 
+    
+    # training data of previously seen geometries, shared by all instances
+    # set training_cache.filename to keep it on disk between runs
+    training_cache = Cache(max_size=256)
 
     def __defaults__(self):
         """This sets the default values and methods for the analysis.
@@ -74,6 +80,9 @@ class Vortex_Lattice(Aerodynamics):
 
         # vortex lattice configurations
         self.settings.number_panels_spanwise = 5
+        
+        # reuse the training data of identical geometries
+        self.settings.use_training_cache     = True
 
         # conditions table, used for surrogate model training
         self.training = Data()        
@@ -200,7 +209,9 @@ class Vortex_Lattice(Aerodynamics):
         Properties Used:
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
+        self.settings.use_training_cache
         self.training.angle_of_attack [radians]
+        self.training_cache
         """        
         # unpack
         geometry = self.geometry
@@ -208,6 +219,15 @@ class Vortex_Lattice(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
+        
+        # check for a geometry that was already sampled
+        if settings.use_training_cache:
+            key = training_key(geometry,settings,AoA)
+            found, cached = self.training_cache.lookup(key)
+            if found:
+                training.lift_coefficient       = cached.lift_coefficient
+                training.wing_lift_coefficients = cached.wing_lift_coefficients
+                return
         CL  = np.zeros_like(AoA)
         
         wing_CLs = Data.fromkeys(geometry.wings.keys(), np.zeros_like(AoA))
@@ -220,20 +240,23 @@ class Vortex_Lattice(Aerodynamics):
         konditions              = Data()
         konditions.aerodynamics = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts = calculate_lift_vortex_lattice(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+        # calculate aerodynamics for the whole table at once
+        konditions.aerodynamics.angle_of_attack = AoA
+        
+        # these functions are inherited from Aerodynamics() or overridden
+        CL[:], wing_lifts = calculate_lift_vortex_lattice(konditions, settings, geometry)
+        for wing in geometry.wings.values():
+            wing_CLs[wing.tag][:] = wing_lifts[wing.tag]
 
         # store training data
         training.lift_coefficient = CL
         training.wing_lift_coefficients = wing_CLs
+        
+        if settings.use_training_cache:
+            cached = Data()
+            cached.lift_coefficient       = CL
+            cached.wing_lift_coefficients = wing_CLs
+            self.training_cache.store(key,cached)
 
         return
 
@@ -328,3 +351,58 @@ def calculate_lift_vortex_lattice(conditions,settings,geometry):
         wing_lifts[wing.tag] = wing_lift_coeff
 
     return total_lift_coeff, wing_lifts
+
+
+def training_key(geometry,settings,angle_of_attack):
+    """Builds the cache key of the vortex lattice training data from everything it depends on.
+
+    Assumptions:
+    The wing fields listed below are the only geometry used by the vortex lattice method
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.reference_area                  [m^2]
+    geometry.wings.*.
+      tag                                    [string]
+      spans.projected                        [m]
+      chords.root                            [m]
+      chords.tip                             [m]
+      sweeps.quarter_chord                   [radians]
+      taper                                  [Unitless]
+      twists.root                            [radians]
+      twists.tip                             [radians]
+      symmetric                              [Boolean]
+      areas.reference                        [m^2]
+      vertical                               [Boolean]
+    settings.number_panels_spanwise          [Unitless]
+    angle_of_attack                          [radians]
+
+    Outputs:
+    key                                      [string]
+
+    Properties Used:
+    N/A
+    """
+
+    wings = []
+    for wing in geometry.wings.values():
+        wings.append([ wing.tag,
+                       wing.spans.projected,
+                       wing.chords.root,
+                       wing.chords.tip,
+                       wing.sweeps.quarter_chord,
+                       wing.taper,
+                       wing.twists.root,
+                       wing.twists.tip,
+                       wing.symmetric,
+                       wing.areas.reference,
+                       wing.vertical ])
+
+    key = hash_data(geometry.reference_area,
+                    wings,
+                    settings.number_panels_spanwise,
+                    angle_of_attack)
+
+    return key
@@ -3,6 +3,7 @@
 #
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,7 +21,7 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
 from SUAVE.Core.Arrays import atleast_2d_col
 
 
@@ -61,6 +62,11 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # optional lookup table in place of the exact layer evaluation
+        self.settings.tabulated       = False
+        self.settings.table_tolerance = 1e-7 # maximum relative pressure error
+        self.table                    = Data()
     
     def compute_values(self,altitude,temperature_deviation=0.0):
 
@@ -85,6 +91,7 @@ class US_Standard_1976(Atmospheric):
 
         Properties Used:
         self.
+          settings.tabulated                     [boolean]
           fluid_properties.gas_specific_constant [J/(kg*K)]
           planet.sea_level_gravity               [m/s^2]
           planet.mean_radius                     [m]
@@ -127,6 +134,25 @@ class US_Standard_1976(Atmospheric):
             print "Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km"   
             zs[zs > zmax] = zmax        
 
+        # use the lookup table if requested
+        if self.settings.tabulated:
+            T, p = self.interpolate_table(zs)
+            T    = T + delta_isa
+            
+            rho = gas.compute_density(T,p)
+            a   = gas.compute_speed_of_sound(T)
+            mew = gas.compute_absolute_viscosity(T)
+            
+            atmo_data = Conditions()
+            atmo_data.expand_rows(zs.shape[0])
+            atmo_data.pressure          = p
+            atmo_data.temperature       = T
+            atmo_data.density           = rho
+            atmo_data.speed_of_sound    = a
+            atmo_data.dynamic_viscosity = mew
+            
+            return atmo_data
+
         # initialize return data
         zeros = np.zeros_like(zs)
         p     = zeros * 0.0
@@ -172,6 +198,184 @@ class US_Standard_1976(Atmospheric):
         return atmo_data
 
 
+    def build_table(self):
+        """Tabulates the standard temperature and the log of the pressure on a geopotential altitude
+        grid that contains every layer break. The temperature is linear in each layer so it is
+        interpolated exactly. The grid is refined until the pressure interpolated at the midpoints
+        of the grid is within settings.table_tolerance of the exact value.
+
+        Each layer is tabulated up to its upper break with its own equations, so the breaks appear
+        twice in the table. The break pressures are not exactly continuous, and the small jump is
+        kept at the break instead of being spread over the last interval of the layer.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        self.table.
+          altitude                               [m]
+          temperature                            [K]
+          log_pressure                           [log(Pa)]
+          error                                  [Unitless]
+
+        Properties Used:
+        self.
+          settings.table_tolerance               [Unitless]
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        breaks    = self.breaks
+        tolerance = self.settings.table_tolerance
+        
+        n_per_layer = 8
+        
+        n_layers    = len(breaks.altitude)-1
+        
+        while True:
+            
+            z_layers    = []
+            T_layers    = []
+            logp_layers = []
+            error       = 0.
+            
+            for i in xrange(n_layers):
+                
+                # grid of the layer with both breaks, plus the midpoints for the error check
+                z_fine         = np.linspace(breaks.altitude[i],breaks.altitude[i+1],2*n_per_layer+1)
+                T_fine, p_fine = self.standard_values(z_fine,i*np.ones(len(z_fine),dtype=int))
+                
+                logp = np.log(p_fine[::2])
+                
+                # error of the interpolation at the midpoints
+                logp_mid = 0.5*(logp[:-1] + logp[1:])
+                error    = max(error,np.max(np.abs(np.exp(logp_mid)/p_fine[1::2] - 1.)))
+                
+                z_layers.append(z_fine[::2])
+                T_layers.append(T_fine[::2])
+                logp_layers.append(logp)
+            
+            if error <= tolerance or n_per_layer >= 2**16:
+                break
+            
+            n_per_layer = n_per_layer * 2
+        
+        self.table.altitude     = np.hstack(z_layers)
+        self.table.temperature  = np.hstack(T_layers)
+        self.table.log_pressure = np.hstack(logp_layers)
+        self.table.error        = error
+        
+        return
+    
+    def interpolate_table(self,zs):
+        """Interpolates the standard temperature and pressure from the lookup table,
+        building the table the first time it is needed.
+
+        Assumptions:
+        zs is a geopotential altitude within the break altitudes
+
+        Source:
+        N/A
+
+        Inputs:
+        zs                                       [m]
+
+        Output:
+        T                                        [K]
+        p                                        [Pa]
+
+        Properties Used:
+        self.table.
+          altitude                               [m]
+          temperature                            [K]
+          log_pressure                           [log(Pa)]
+        """
+        
+        if not self.table.has_key('altitude'):
+            self.build_table()
+        
+        z    = self.table.altitude
+        T0   = self.table.temperature
+        logp = self.table.log_pressure
+        
+        # interval indices, a break is taken from the layer above it as in compute_values
+        i = np.searchsorted(z,zs,side='right') - 1
+        i = np.clip(i,0,len(z)-2)
+        
+        # linear weights
+        w = (zs - z[i])/(z[i+1] - z[i])
+        
+        T = T0[i]   + w*(T0[i+1]   - T0[i])
+        p = np.exp( logp[i] + w*(logp[i+1] - logp[i]) )
+        
+        return T, p
+    
+    def standard_values(self,zs,layers=None):
+        """Computes the exact standard temperature and pressure, without temperature deviation.
+
+        Assumptions:
+        US 1976 Standard Atmosphere, zs is a geopotential altitude within the break altitudes
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        zs                                       [m]
+        layers                                   [Unitless] (optional, the layer of each altitude)
+
+        Output:
+        T                                        [K]
+        p                                        [Pa]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        grav   = self.planet.sea_level_gravity
+        gamma  = self.fluid_properties.gas_specific_constant
+        breaks = self.breaks
+        
+        # layer indices
+        if layers is None:
+            i = np.searchsorted(breaks.altitude,zs,side='right') - 1
+            i = np.clip(i,0,len(breaks.altitude)-2)
+        else:
+            i = layers
+        
+        z0    = breaks.altitude[i]
+        T0    = breaks.temperature[i]
+        p0    = breaks.pressure[i]
+        alpha = -(breaks.temperature[i+1] - breaks.temperature[i])/ \
+                 (breaks.altitude[i+1]    - breaks.altitude[i])
+        
+        dz      = zs-z0
+        i_isoth = (alpha == 0.)
+        i_adiab = (alpha != 0.)
+        
+        p = np.zeros_like(zs)
+        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(gamma*T0[i_isoth]))
+        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*gamma)) )
+        
+        T = T0 - dz*alpha
+        
+        return T, p
+
 # ----------------------------------------------------------------------
 #   Module Tests
 # ----------------------------------------------------------------------
@@ -192,4 +396,35 @@ if __name__ == '__main__':
     mew = data.dynamic_viscosity
     
     print data
+    
+    # compare the lookup table with the exact layers
+    import time
+    
+    h = np.linspace(-1.,80.,16*10) * Units.km
+    
+    exact = US_Standard_1976()
+    table = US_Standard_1976()
+    table.settings.tabulated = True
+    table.compute_values(h,delta_isa)
+    
+    n_calls = 1000
+    
+    t0 = time.time()
+    for i in xrange(n_calls):
+        data_exact = exact.compute_values(h,delta_isa)
+    t_exact = time.time() - t0
+    
+    t0 = time.time()
+    for i in xrange(n_calls):
+        data_table = table.compute_values(h,delta_isa)
+    t_table = time.time() - t0
+    
+    p_error = np.max(np.abs(data_table.pressure/data_exact.pressure - 1.))
+    T_error = np.max(np.abs(data_table.temperature - data_exact.temperature))
+    
+    print 'Exact     : %.4f s' % t_exact
+    print 'Tabulated : %.4f s' % t_table
+    print 'Table size            = %i' % len(table.table.altitude)
+    print 'Max Pressure Error    = %.4e' % p_error
+    print 'Max Temperature Error = %.4e' % T_error
     
\ No newline at end of file
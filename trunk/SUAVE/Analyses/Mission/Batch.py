@@ -0,0 +1,99 @@
+## @ingroup Analyses-Mission
+# Batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods import Missions as Methods
+
+from Mission import Mission
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Batch(Mission):
+    """ Evaluates several independent missions, usually one per vehicle variant, and collects
+        their results in one state. Each case is converged on its own, so a case only takes the
+        iterations it needs and the batch costs about the same as solving the cases one at a time.
+
+        Assumptions:
+        Each case is a mission with its own vehicle analyses. The cases do not share initial conditions.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+            """
+
+        self.tag = 'batch'
+
+        # --------------------------------------------------------------
+        #   The Solving Process
+        # --------------------------------------------------------------
+
+        # --------------------------------------------------------------
+        #   Initialize
+        # --------------------------------------------------------------
+        self.process.initialize.expand_state        = Methods.Segments.expand_state
+        self.process.initialize.expand_sub_segments = Methods.Segments.Common.Sub_Segments.expand_independent_sub_segments
+
+        # --------------------------------------------------------------
+        #   Converge
+        # --------------------------------------------------------------
+        self.process.converge.sub_segments          = Methods.Segments.Common.Sub_Segments.converge_independent_sub_segments
+
+        # --------------------------------------------------------------
+        #   Iterate
+        # --------------------------------------------------------------
+        del self.process.iterate
+
+        # --------------------------------------------------------------
+        #   Finalize
+        # --------------------------------------------------------------
+        self.process.finalize.sub_segments          = Methods.Segments.Common.Sub_Segments.finalize_independent_sub_segments
+
+        return
+
+    def append_case(self,mission):
+        """ Add a mission to the batch
+
+            Assumptions:
+            The mission tag is unique in the batch
+
+            Source:
+            N/A
+
+            Inputs:
+            mission  [All_At_Once()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.append_segment(mission)
+        return
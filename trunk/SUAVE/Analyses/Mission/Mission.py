@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 """ Mission.py: Top-level mission class """
 
@@ -12,6 +13,7 @@
 
 import SUAVE
 from SUAVE.Core import Container as ContainerBase
+from SUAVE.Methods.Missions.Segments import set_warm_start, clear_warm_start
 import Segments
 
 # ----------------------------------------------------------------------
@@ -73,6 +75,48 @@ class Mission(Segments.Simple.Container):
     
     
 
+    def set_warm_start(self,results):
+        """ Stores the converged unknowns of every segment, and the outer unknowns of the mission 
+            such as the cruise distance of Vary_Cruise missions, so that the next evaluations start 
+            from them. Unknowns are interpolated if the number of control points changes.
+    
+            Assumptions:
+            The results are an evaluation of this mission
+    
+            Source:
+            N/A
+    
+            Inputs:
+            results   [Data()]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """         
+        set_warm_start(self,results)
+        
+    def clear_warm_start(self):
+        """ Starts the next evaluations from the default guesses again
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """         
+        clear_warm_start(self)
+        
 # ----------------------------------------------------------------------
 #   Container Class
 # ----------------------------------------------------------------------
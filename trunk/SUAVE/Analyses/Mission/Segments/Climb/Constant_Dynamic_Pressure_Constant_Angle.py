@@ -67,6 +67,7 @@ class Constant_Dynamic_Pressure_Constant_Angle(Unknown_Throttle):
         ones_row = self.state.ones_row        
         self.state.unknowns.altitudes  = ones_row(1) * 0.0
         self.state.residuals.forces    = ones_row(3) * 0.0        
+        self.state.numerics.jacobian_coupled_unknowns = ['altitudes']
         
         # --------------------------------------------------------------
         #   The Solving Process
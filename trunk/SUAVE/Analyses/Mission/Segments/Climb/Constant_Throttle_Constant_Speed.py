@@ -76,6 +76,7 @@ class Constant_Throttle_Constant_Speed(Aerodynamic):
         self.state.unknowns.body_angle = ones_row(1) * 5.0 * Units.deg
         self.state.unknowns.wind_angle = ones_row(1) * 0.0 * Units.deg
         self.state.residuals.forces    = ones_row(2) * 0.0
+        self.state.numerics.jacobian_coupled_unknowns = ['wind_angle']
         
         
         # --------------------------------------------------------------
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -51,8 +52,15 @@ class Numerics(Conditions):
         
         self.number_control_points = 16
         self.discretization_method = chebyshev_data
+        self.number_of_elements    = 1     # used by piecewise_data
+        
+        # used by converge_adaptive
+        self.adaptive_tolerance     = 1e-4
+        self.maximum_control_points = 64
+        self.discretization_error   = None
         
         self.solver_jacobian                  = "none"
+        self.jacobian_coupled_unknowns        = []
         self.tolerance_solution               = 1e-8
         self.tolerance_boundary_conditions    = 1e-8  
         self.converged                        = None
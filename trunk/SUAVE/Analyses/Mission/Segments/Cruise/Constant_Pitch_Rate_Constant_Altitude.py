@@ -75,6 +75,7 @@ class Constant_Pitch_Rate_Constant_Altitude(Aerodynamic):
         self.state.unknowns.throttle = ones_row(1) * 0.5
         self.state.unknowns.velocity = ones_row(1) * 1.0
         self.state.residuals.forces  = ones_row(2) * 0.0
+        self.state.numerics.jacobian_coupled_unknowns = ['velocity']
         
         
         # --------------------------------------------------------------
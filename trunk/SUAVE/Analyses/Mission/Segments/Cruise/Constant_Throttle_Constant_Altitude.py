@@ -77,6 +77,7 @@ class Constant_Throttle_Constant_Altitude(Aerodynamic):
         self.state.unknowns.time                  = 0.1
         self.state.residuals.final_velocity_error = 0.0
         self.state.residuals.forces               = ones_row(2) * 0.0
+        self.state.numerics.jacobian_coupled_unknowns = ['velocity_x']
     
         # --------------------------------------------------------------
         #   The Solving Process
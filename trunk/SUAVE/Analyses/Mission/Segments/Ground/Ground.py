@@ -90,6 +90,7 @@ class Ground(Aerodynamic):
         self.state.unknowns.time                  = 0.1
         self.state.residuals.acceleration_x       = ones_row(1) * 0.0
         self.state.residuals.final_velocity_error = ones_row(1) * 0.0
+        self.state.numerics.jacobian_coupled_unknowns = ['velocity_x']
     
         # Specific ground things
         self.state.conditions.ground = Data()
@@ -3,6 +3,7 @@
 #
 # Created:  Jun 2014, E. Botero
 # Modified: Jan 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -58,12 +59,17 @@ class Propeller(Energy_Component):
         self.prop_attributes.chord_distribution = 0.0
         self.prop_attributes.mid_chord_aligment = 0.0
         self.thrust_angle                       = 0.0
+        self.warm_start                         = False
         
     def spin(self,conditions):
         """Analyzes a propeller given geometry and operating conditions.
 
         Assumptions:
         per source
+        The iteration stops when no station changes by more than the tolerance, stations that
+        barely change any more are left out of the work before that. With warm_start (off by
+        default), the iteration starts from the last solution when the number of points
+        is the same, so the result can depend on the earlier calls.
 
         Source:
         Qprop theory document
@@ -100,6 +106,9 @@ class Propeller(Energy_Component):
         torque                       [Nm]
         power                        [W]
         Cp                           [-] (coefficient of power)
+        self.outputs.
+          psi                        [radians] (converged solution, for the warm start)
+          iterations                 [-] (Newton iterations per point and station)
 
         Properties Used:
         self.prop_attributes.
@@ -110,6 +119,7 @@ class Propeller(Energy_Component):
           chord_distribution         [m]
           mid_chord_aligment         [m] (distance from the mid chord to the line axis out of the center of the blade)
         self.thrust_angle            [radians]
+        self.warm_start              [boolean]
         """         
            
         #Unpack    
@@ -178,85 +188,97 @@ class Propeller(Energy_Component):
         
         #Things that will change with iteration
         size = (len(a),N)
+        
+        # Spread everything over the stations, so that converged stations can be left out
+        ones   = np.ones(size)
+        r_s    = r*ones
+        c_s    = c*ones
+        beta_s = beta*ones
+        a_s    = a*ones
     
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
+        #Setup a Newton iteration, warm started from the last solution if it fits
+        psi = np.ones(size)
+        if self.warm_start:
+            psi_last = self.outputs.get('psi',None)
+            if psi_last is not None and np.shape(psi_last) == size and np.all(np.isfinite(psi_last)):
+                psi = psi_last*1.
+        
+        psiold     = np.zeros(size)
+        psi_eval   = psi*1.
+        diff       = 1.
+        active     = np.ones(size,dtype=bool)
+        iterations = np.zeros(size,dtype=int)
+        
+        # Stations that change by less than this are not iterated any more
+        station_tol = 1e-6*tol
         
-        ii = 0
         while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            #va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound
-            
-            #if np.any(Ma> 1.0):
-                #warn('Propeller blade tips are supersonic.', Warning)
-            
-            lamdaw = r*Wa/(R*Wt)
             
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
+            # while all the stations are iterated, work on the whole arrays
+            sel = Ellipsis if np.all(active) else active
             
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+            psi_a  = psi[sel]
+            psi_eval[sel] = psi_a
+            Ua_a   = Ua[sel]
+            Ut_a   = Ut[sel]
+            U_a    = U[sel]
+            r_a    = r_s[sel]
+            beta_a = beta_s[sel]
             
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Cl = 2.*pi*alpha
+            Wa, Wt, W, Ma, alpha, Cl, Gamma, piece, arccos_piece = \
+                station_aerodynamics(psi_a,Ua_a,Ut_a,U_a,beta_a,c_s[sel],r_a,a_s[sel],B,R)
             
-            # By 90 deg, it's totally stalled.
-            Cl[alpha>=pi/2] = 0.
-            
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-            
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-            
-            Rsquiggly = Gamma - 0.5*W*c*Cl
+            Rsquiggly = Gamma - 0.5*W*c_s[sel]*Cl
             
             #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
             #This was solved symbolically in Matlab and exported        
+            sin_psi = np.sin(psi_a)
+            cos_psi = np.cos(psi_a)
             f_wt_2 = 4*Wt*Wt
             f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
+            Ucospsi  = U_a*cos_psi
+            Usinpsi  = U_a*sin_psi
+            Utcospsi = Ut_a*cos_psi
+            Uasinpsi = Ua_a*sin_psi
             
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
+            UapUsinpsi = (Ua_a + Usinpsi)
+            utpUcospsi = (Ut_a + Ucospsi)
             
             utpUcospsi2 = utpUcospsi*utpUcospsi
             UapUsinpsi2 = UapUsinpsi*UapUsinpsi
             
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
+            dR_dpsi = ((4.*U_a*r_a*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
+                       (pi*U_a*(Ua_a*cos_psi - Ut_a*sin_psi)*(beta_a - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+                       + (pi*U_a*(f_wt_2 +f_wa_2)**(0.5)*(U_a + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+                       - (4.*U_a*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r_a)*(Ut_a/2. - 
+                      (Ucospsi)/2.)*(U_a + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
+                       r_a))/(r_a*(Wa+Wa))))**(0.5)) + (128.*U_a*r_a*arccos_piece*(Wa+Wa)*(Ut_a/2. - (Ucospsi)/2.)*(U_a + 
                        Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
             
             dR_dpsi[np.isnan(dR_dpsi)] = 0.1
                       
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
+            dpsi        = -Rsquiggly/dR_dpsi
+            psi_a       = psi_a + dpsi
+            psi[sel]    = psi_a
+            iterations[sel] += 1
+            diff        = np.max(abs(psiold-psi))
+            psiold      = psi*1.
             
             # If its really not going to converge
             if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
                 break
+            
+            # Leave out the stations that barely change
+            active[active] = (np.abs(dpsi) > station_tol).ravel()
+            if not np.any(active):
+                break
+            
+        # The aerodynamics of the last iteration of each station
+        Wa, Wt, W, Ma, alpha, Cl, Gamma, piece, arccos_piece = \
+            station_aerodynamics(psi_eval,Ua,Ut,U,beta_s,c_s,r_s,a_s,B,R)
+        
+        self.outputs.psi        = psi
+        self.outputs.iterations = iterations
 
         #This is an atrocious fit of DAE51 data at RE=50k for Cd
         #There is also RE scaling
@@ -310,4 +332,85 @@ class Propeller(Energy_Component):
         
         
         return thrust, torque, power, Cp
-    
\ No newline at end of file
+
+# ----------------------------------------------------------------------
+#  Station Aerodynamics
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Energy-Converters
+def station_aerodynamics(psi,Ua,Ut,U,beta,c,r,a,B,R):
+    """Computes the velocities, lift and circulation of blade stations for a given psi.
+    All arrays have the same shape, any subset of the stations can be passed.
+
+    Assumptions:
+    per source
+
+    Source:
+    Qprop theory document
+
+    Inputs:
+    psi          [radians]
+    Ua           [m/s]
+    Ut           [m/s]
+    U            [m/s]
+    beta         [radians]
+    c            [m]
+    r            [m]
+    a            [m/s]
+    B            [-]
+    R            [m]
+
+    Outputs:
+    Wa           [m/s]
+    Wt           [m/s]
+    W            [m/s]
+    Ma           [-]
+    alpha        [radians]
+    Cl           [-]
+    Gamma        [m^2/s]
+    piece        [-]
+    arccos_piece [-]
+
+    Properties Used:
+    N/A
+    """
+    
+    pi      = np.pi
+    sin_psi = np.sin(psi)
+    cos_psi = np.cos(psi)
+    Wa      = 0.5*Ua + 0.5*U*sin_psi
+    Wt      = 0.5*Ut + 0.5*U*cos_psi   
+    #va     = Wa - Ua
+    vt      = Ut - Wt
+    alpha   = beta - np.arctan2(Wa,Wt)
+    W       = (Wa*Wa + Wt*Wt)**0.5
+    Ma      = (W)/a #a is the speed of sound
+    
+    #if np.any(Ma> 1.0):
+        #warn('Propeller blade tips are supersonic.', Warning)
+    
+    lamdaw = r*Wa/(R*Wt)
+    
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+    
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+    
+    # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
+    Cl = 2.*pi*alpha
+    
+    # By 90 deg, it's totally stalled.
+    Cl[alpha>=pi/2] = 0.
+    
+    # Scale for Mach, this is Karmen_Tsien
+    sub     = Ma<1.
+    Ma2     = Ma[sub]*Ma[sub]
+    Cl[sub] = Cl[sub]/((1-Ma2)**0.5+(Ma2/(1+(1-Ma2)**0.5))*Cl[sub]/2)
+    
+    # If the blade segments are supersonic, don't scale
+    
+    return Wa, Wt, W, Ma, alpha, Cl, Gamma, piece, arccos_piece
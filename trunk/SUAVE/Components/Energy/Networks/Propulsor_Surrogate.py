@@ -2,7 +2,7 @@
 # Propulsor_Surrogate.py
 #
 # Created:  Mar 2017, E. Botero
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +16,7 @@ import numpy as np
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
 
 from SUAVE.Core import Data
+import scipy.ndimage
 import sklearn
 from sklearn import gaussian_process
 from sklearn import neighbors
@@ -31,6 +32,9 @@ class Propulsor_Surrogate(Propulsor):
         A .csv file is read in, a surrogate made, that surrogate is used during the mission analysis.
         
         You need to use build surrogate first when setting up the vehicle to make this work.
+        
+        With the 'grid' surrogate type, the deck is used as tables on its regular altitude, Mach
+        and throttle grid and interpolated instead of fitting a model.
     
         Assumptions:
         The input format for this should be Altitude, Mach, Throttle, Thrust, SFC
@@ -66,6 +70,7 @@ class Propulsor_Surrogate(Propulsor):
         self.thrust_angle      = 0.0
         self.areas             = Data()
         self.surrogate_type    = 'gaussian'
+        self.grid_interpolation_order = 1
     
     # manage process with a driver function
     def evaluate_thrust(self,state):
@@ -100,13 +105,10 @@ class Propulsor_Surrogate(Propulsor):
         
         cond = np.hstack([altitude,mach,throttle])
         
-        # Run the surrogate for a range of altitudes
+        # Run the surrogate for all the points at once
         data_len = len(altitude)
-        sfc = np.zeros([data_len,1])  
-        thr = np.zeros([data_len,1]) 
-        for ii,_ in enumerate(altitude):
-            sfc[ii] = sfc_surrogate.predict(np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]]))    
-            thr[ii] = thr_surrogate.predict(np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]]))   
+        sfc = np.reshape(sfc_surrogate.predict(cond),[data_len,1])
+        thr = np.reshape(thr_surrogate.predict(cond),[data_len,1])
         
         F    = thr
         mdot = thr*sfc*self.number_of_engines
@@ -123,9 +125,11 @@ class Propulsor_Surrogate(Propulsor):
             -Gaussian Processes
             -KNN
             -SVR
+            -Grid, interpolation of the deck tables
     
             Assumptions:
-            None
+            For the grid, the deck has one line for every combination of its altitudes, Mach
+            numbers and throttles
     
             Source:
             N/A
@@ -163,7 +167,14 @@ class Propulsor_Surrogate(Propulsor):
         
 
         # Pick the type of process
-        if self.surrogate_type  == 'gaussian':
+        if self.surrogate_type  == 'grid':
+            # every line is a grid point, only drop the ones that did not read
+            my_data = my_data[~np.any(np.isnan(my_data[:,:5]),axis=1)]
+            order   = self.grid_interpolation_order
+            thr_surrogate = Deck_Table(my_data[:,:3],my_data[:,3],order)
+            sfc_surrogate = Deck_Table(my_data[:,:3],my_data[:,4],order)
+        
+        elif self.surrogate_type  == 'gaussian':
             regr_sfc = gaussian_process.GaussianProcess(theta0=50.,thetaL=8.,thetaU=100.)
             regr_thr = gaussian_process.GaussianProcess(theta0=15.,thetaL=8.,thetaU=100.)                
             thr_surrogate = regr_thr.fit(xy, thr)
@@ -184,4 +195,87 @@ class Propulsor_Surrogate(Propulsor):
         
         # Save the output
         self.sfc_surrogate    = sfc_surrogate
-        self.thrust_surrogate = thr_surrogate     
\ No newline at end of file
+        self.thrust_surrogate = thr_surrogate
+        
+# ----------------------------------------------------------------------
+#  Deck Table
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Energy-Networks
+class Deck_Table(object):
+    """ A table of an engine deck output on a regular altitude, Mach and throttle grid, with the
+        same predict interface as the other surrogates.
+    
+        Assumptions:
+        Points outside of the grid take the value at the nearest edge
+        
+        Source:
+        None
+    """
+    
+    def __init__(self,points,values,order=1):
+        """ Arranges the deck lines into a table
+    
+            Assumptions:
+            There is exactly one line for each grid point
+    
+            Source:
+            N/A
+    
+            Inputs:
+            points [array of altitude, Mach, throttle]
+            values [array]
+            order  [int] 1 for multilinear, 3 for cubic spline interpolation
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            N/A
+        """           
+        
+        axes = [ np.unique(points[:,ii]) for ii in xrange(3) ]
+        
+        shape = [ len(axis) for axis in axes ]
+        if len(points) != np.prod(shape):
+            raise ValueError, 'the engine deck is not a regular altitude, Mach and throttle grid'
+        
+        indices = [ np.searchsorted(axes[ii],points[:,ii]) for ii in xrange(3) ]
+        
+        table = np.zeros(shape)
+        table[indices[0],indices[1],indices[2]] = values
+        
+        if order > 1:
+            table = scipy.ndimage.spline_filter(table,order=order)
+        
+        self.axes  = axes
+        self.table = table
+        self.order = order
+        
+    def predict(self,X):
+        """ Interpolates the table at all the points at once
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            X      [array of altitude, Mach, throttle]
+    
+            Outputs:
+            values [array]
+    
+            Properties Used:
+            N/A
+        """          
+        
+        X = np.atleast_2d(X)
+        
+        # fractional grid indices, the grid spacing does not need to be uniform
+        coordinates = np.array([ np.interp(X[:,ii],axis,np.arange(len(axis))) for ii,axis in enumerate(self.axes) ])
+        
+        values = scipy.ndimage.map_coordinates(self.table,coordinates,order=self.order,mode='nearest',prefilter=False)
+        
+        return values
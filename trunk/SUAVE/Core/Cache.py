@@ -0,0 +1,282 @@
+## @ingroup Core
+# Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import cPickle as pickle
+from collections import OrderedDict
+
+import numpy as np
+
+from Arrays import array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#   Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Cache(object):
+    """ A bounded cache with hit and miss counters. Keys are usually made with hash_data() from
+        the inputs that fully determine the cached value. When full, either the least recently
+        used ('lru') or the oldest stored ('fifo') entry is evicted.
+
+        Assumptions:
+        Values are copied in and out of the cache, so callers may modify them freely
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,max_size=128,filename=None,policy='lru'):
+        """ Initializes the cache, loading it from disk if a file is given and exists
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            max_size   [int]
+            filename   [string] optional, appends every store to this file
+            policy     ['lru' or 'fifo']
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        if not policy in ('lru','fifo'):
+            raise ValueError, 'Unknown cache policy %s' % policy
+        
+        self.max_size = max_size
+        self.filename = filename
+        self.policy   = policy
+        self.hits     = 0
+        self.misses   = 0
+        self.entries  = OrderedDict()
+
+        if filename and os.path.exists(filename):
+            self.load(filename)
+
+    def __len__(self):
+        """ Number of entries in the cache """
+        return len(self.entries)
+
+    def __contains__(self,key):
+        """ Checks for a key without changing the counters or the order """
+        return key in self.entries
+
+    def lookup(self,key):
+        """ Retrieves a copy of a value and, with the 'lru' policy, marks it as most recently used
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            key        [string]
+
+            Outputs:
+            found      [boolean]
+            value      [any] None if not found
+
+            Properties Used:
+            N/A
+        """
+        entries = self.entries
+        if key in entries:
+            if self.policy == 'lru':
+                value = entries.pop(key)
+                entries[key] = value
+            else:
+                value = entries[key]
+            self.hits += 1
+            return True, pickle.loads(pickle.dumps(value,-1))
+        else:
+            self.misses += 1
+            return False, None
+
+    def store(self,key,value):
+        """ Stores a copy of a value, evicting entries beyond max_size according to the policy
+
+            Assumptions:
+            The value can be pickled
+
+            Source:
+            N/A
+
+            Inputs:
+            key        [string]
+            value      [any]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        entries = self.entries
+        if key in entries:
+            del entries[key]
+        entries[key] = pickle.loads(pickle.dumps(value,-1))
+
+        while self.max_size is not None and len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+        if self.filename:
+            self.append(self.filename,key,entries[key])
+
+    def clear(self):
+        """ Removes all entries and resets the counters """
+        self.entries.clear()
+        self.hits   = 0
+        self.misses = 0
+
+    def append(self,filename,key,value):
+        """ Appends one entry to the end of the file on disk, so a store does not rewrite the file
+
+            Assumptions:
+            Records later in the file replace earlier ones with the same key
+
+            Source:
+            N/A
+
+            Inputs:
+            filename   [string]
+            key        [string]
+            value      [any]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        with open(filename,'ab') as f:
+            pickle.dump((key,value),f,-1)
+
+    def save(self,filename):
+        """ Writes all the entries to disk, through a temporary file so a crash leaves the old file
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            filename   [string]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        temporary = filename + '.tmp'
+        with open(temporary,'wb') as f:
+            for key,value in self.entries.items():
+                pickle.dump((key,value),f,-1)
+        os.rename(temporary,filename)
+
+    def load(self,filename):
+        """ Reads the entries appended to a file, keeping at most max_size of the most recent ones.
+            A file with many replaced or evicted records is rewritten with only the entries kept.
+
+            Assumptions:
+            A record cut short by a crash ends the file
+
+            Source:
+            N/A
+
+            Inputs:
+            filename   [string]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        entries = self.entries
+        records = 0
+        with open(filename,'rb') as f:
+            while True:
+                try:
+                    key, value = pickle.load(f)
+                except (EOFError,pickle.UnpicklingError,ValueError,IndexError):
+                    break
+                records += 1
+                if key in entries:
+                    del entries[key]
+                entries[key] = value
+                
+        while self.max_size is not None and len(entries) > self.max_size:
+            entries.popitem(last=False)
+            
+        if records > 2 * len(entries):
+            self.save(filename)
+
+# ----------------------------------------------------------------------
+#   Hash Data
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def hash_data(*items):
+    """ Hashes the content of numbers, strings, arrays and nested dicts or lists of them.
+        Dict keys are sorted, so two Data() with the same content have the same hash.
+
+        Assumptions:
+        Objects of other types are hashed by their repr
+
+        Source:
+        N/A
+
+        Inputs:
+        items      [any]
+
+        Outputs:
+        key        [string] hex digest
+
+        Properties Used:
+        N/A
+    """
+
+    sha = hashlib.sha1()
+
+    def do_hash(v):
+        if isinstance(v,dict):
+            sha.update('{')
+            for k in sorted(v.keys()):
+                sha.update(repr(k))
+                do_hash(v[k]) # recursion!
+            sha.update('}')
+        elif isinstance(v,(list,tuple)):
+            sha.update('[')
+            for u in v:
+                do_hash(u)
+            sha.update(']')
+        elif isinstance(v,(array_type,matrix_type)):
+            v = np.ascontiguousarray(v)
+            sha.update(str(v.dtype) + str(v.shape))
+            sha.update(v.tostring())
+        elif isinstance(v,float):
+            sha.update(repr(float(v)))
+        else:
+            sha.update(repr(v))
+
+    for item in items:
+        do_hash(item)
+
+    return sha.hexdigest()
@@ -0,0 +1,356 @@
+## @ingroup Core
+# Data_Fast.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from Data import Data
+
+dictgetitem  = dict.__getitem__
+dictsetitem  = dict.__setitem__
+dictdelitem  = dict.__delitem__
+dictcontains = dict.__contains__
+objgetattrib = object.__getattribute__
+objsetattrib = object.__setattr__
+objdelattrib = object.__delattr__
+
+# ----------------------------------------------------------------------
+#   Data Fast
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Data_Fast(Data):
+    """ A Data() with the same attribute API, where every item is mirrored into the instance
+        __dict__ so attribute reads go through the default C lookup instead of the Python level
+        __getattribute__ of Data(). Writes keep the item and the mirror in sync.
+
+        Assumptions:
+        Items are changed through the Data() or dict item interface, not through dict.__setitem__
+
+        Source:
+        N/A
+    """
+
+    __getattribute__ = object.__getattribute__
+
+    def __setattr__(self, k, v):
+        """ An override of the standard __setattr_ in Python.
+
+            Assumptions:
+            Existing items and new names are set as items, other attributes as objects
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            v        [value]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        if dictcontains(self,k):
+            self[k] = v
+            return
+        try:
+            objgetattrib(self, k)
+        except AttributeError:
+            self[k] = v
+        else:
+            objsetattrib(self, k, v)
+
+    def __delattr__(self, k):
+        """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
+
+            Assumptions:
+            Items are deleted first
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        if dictcontains(self,k):
+            del self[k]
+        else:
+            objdelattrib(self, k)
+
+    def __setitem__(self, k, v):
+        """ Sets an item and its attribute mirror
+
+            Assumptions:
+            Only string keys are mirrored
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            v        [value]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        dictsetitem(self, k, v)
+        if isinstance(k,str):
+            objgetattrib(self,'__dict__')[k] = v
+
+    def __delitem__(self, k):
+        """ Deletes an item and its attribute mirror
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        dictdelitem(self, k)
+        objgetattrib(self,'__dict__').pop(k,None)
+
+    def pop(self, k, *default):
+        """ Removes an item and its attribute mirror, returning the item
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            default  [optional]
+
+            Outputs:
+            value
+
+            Properties Used:
+            N/A
+        """
+        if dictcontains(self,k):
+            objgetattrib(self,'__dict__').pop(k,None)
+        return dict.pop(self, k, *default)
+
+    def popitem(self):
+        """ Removes an arbitrary item and its attribute mirror
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            (key, value)
+
+            Properties Used:
+            N/A
+        """
+        k,v = dict.popitem(self)
+        objgetattrib(self,'__dict__').pop(k,None)
+        return k,v
+
+    def setdefault(self, k, default=None):
+        """ Sets an item if it does not exist yet and returns it
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            default  [value]
+
+            Outputs:
+            value
+
+            Properties Used:
+            N/A
+        """
+        if not dictcontains(self,k):
+            self[k] = default
+        return dictgetitem(self,k)
+
+    def clear(self):
+        """ Removes all the items and their attribute mirrors
+
+            Assumptions:
+            Attributes that are not items are kept
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        mirror = objgetattrib(self,'__dict__')
+        for k in dict.keys(self):
+            mirror.pop(k,None)
+        dict.clear(self)
+
+# methods that are copied onto the fast version of any Data() class
+_fast_methods = dict([ (k,v) for k,v in Data_Fast.__dict__.items() if not k in ('__module__','__doc__','__dict__','__weakref__') ])
+
+# the fast versions of other Data() classes, by class
+_fast_classes = { Data : Data_Fast }
+
+## @ingroup Core
+def fast_class(klass):
+    """ Returns the fast attribute version of a Data() class. The new class directly inherits from
+        klass, so it keeps its methods and defaults.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        klass       [Data() class]
+
+        Outputs:
+        fast_klass  [Data() class]
+
+        Properties Used:
+        N/A
+    """
+
+    if issubclass(klass,Data_Fast) or klass in _fast_classes.values():
+        return klass
+
+    try:
+        return _fast_classes[klass]
+    except KeyError:
+        pass
+
+    # register in this module so the class can be pickled
+    name = 'Fast_' + klass.__module__.replace('.','_') + '_' + klass.__name__
+
+    methods = dict(_fast_methods)
+    methods['__module__']   = __name__
+    methods['__doc__']      = klass.__doc__
+    methods['__defaults__'] = Data.__defaults__ # klass defaults are already run by Data.__new__
+
+    fast_klass = type(name,(klass,),methods)
+
+    _fast_classes[klass] = fast_klass
+    globals()[name] = fast_klass
+
+    return fast_klass
+
+## @ingroup Core
+def make_fast(data):
+    """ Switches a Data() tree in place to the fast attribute versions of its classes. The values
+        and the class methods are unchanged.
+
+        Assumptions:
+        Dictionaries that are not Data() are searched but not switched
+
+        Source:
+        N/A
+
+        Inputs:
+        data   [Data()]
+
+        Outputs:
+        data   [Data()]
+
+        Properties Used:
+        N/A
+    """
+
+    visited = set()
+
+    def do_switch(D):
+        if id(D) in visited:
+            return
+        visited.add(id(D))
+
+        if isinstance(D,Data):
+            D.__class__ = fast_class(type(D))
+            mirror = objgetattrib(D,'__dict__')
+            for k,v in dict.iteritems(D):
+                if isinstance(k,str):
+                    mirror[k] = v
+
+        for v in dict.itervalues(D):
+            if isinstance(v,dict):
+                do_switch(v) # recursion!
+
+    do_switch(data)
+
+    return data
+
+# ----------------------------------------------------------------------
+#   Module Tests
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # micro benchmark of the chained attribute reads done in the mission iterate loop
+    import timeit
+    import numpy as np
+
+    def build(klass):
+        state = klass()
+        state.conditions = klass()
+        state.conditions.freestream = klass()
+        state.conditions.freestream.velocity = np.ones([16,1])
+        state.conditions.freestream.density  = np.ones([16,1])
+        return state
+
+    def read(state):
+        for i in xrange(100):
+            v   = state.conditions.freestream.velocity
+            rho = state.conditions.freestream.density
+
+    slow = build(Data)
+    fast = make_fast(build(Data))
+
+    assert fast.conditions.freestream.velocity is fast['conditions']['freestream']['velocity']
+
+    fast.conditions.freestream.velocity = np.zeros([16,1])
+    assert fast.conditions.freestream['velocity'][0,0] == 0.
+
+    t_slow = min(timeit.repeat(lambda: read(slow),number=1000,repeat=3))
+    t_fast = min(timeit.repeat(lambda: read(fast),number=1000,repeat=3))
+
+    print 'Data      : %.4f s' % t_slow
+    print 'Data_Fast : %.4f s' % t_fast
+    print 'speedup   : %.1fx' % (t_slow/t_fast)
@@ -0,0 +1,191 @@
+## @ingroup Core
+# Data_Layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from Arrays import array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#   Data Layout
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Data_Layout(object):
+    """ A compiled map between a Data() tree and a 1D vector, matching Data.pack_array() and
+        Data.unpack_array() in vector mode. The tree is walked once when the layout is built,
+        afterwards packing and unpacking only copy between the values and views into a
+        preallocated buffer.
+
+        Assumptions:
+        The structure of the data and the shapes of its values do not change while the layout
+        is in use. Values may be replaced by new arrays of the same shape.
+
+        Source:
+        N/A
+    """
+
+    __slots__ = ['size','buffer','scalars','arrays']
+
+    def __init__(self,data):
+        """ Walks the data once and records where each value goes in the vector
+
+            Assumptions:
+            will only map int, float, np.array and np.matrix (max rank 2)
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data()]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        valid_types = ( int, float,
+                        array_type,
+                        matrix_type )
+
+        entries = []
+
+        # the walking function, same order as pack_array
+        def do_walk(D):
+            for k,v in D.iteritems():
+                if isinstance(v,dict):
+                    do_walk(v) # recursion!
+                    continue
+                elif not isinstance(v,valid_types): continue
+                rank = np.rank(v)
+                if rank > 2: continue
+                entries.append((D,k,rank,np.shape(v)))
+
+        do_walk(data)
+
+        size = 0
+        for D,k,rank,shape in entries:
+            size += int(np.prod(shape))
+
+        buffer  = np.zeros(size)
+        scalars = []
+        arrays  = []
+
+        index = 0
+        for D,k,rank,shape in entries:
+            if rank == 0:
+                scalars.append((D,k,index))
+                index += 1
+            elif rank == 1:
+                n = shape[0]
+                arrays.append((D,k,buffer[index:(index+n)]))
+                index += n
+            else:
+                n,m = shape
+                # column major, as in pack_array
+                arrays.append((D,k,buffer[index:(index+n*m)].reshape([m,n]).T))
+                index += n*m
+
+        self.size    = size
+        self.buffer  = buffer
+        self.scalars = scalars
+        self.arrays  = arrays
+
+    def pack(self):
+        """ Copies the current values of the data into the buffer
+
+            Assumptions:
+            The returned array is the layout buffer, it is overwritten by the next pack or unpack
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            buffer   [array]
+
+            Properties Used:
+            N/A
+        """
+
+        buffer = self.buffer
+
+        for D,k,view in self.arrays:
+            value = D[k]
+            if not value is view:
+                view[...] = value
+
+        for D,k,index in self.scalars:
+            buffer[index] = D[k]
+
+        return buffer
+
+    def unpack(self,M):
+        """ Copies a 1D vector into the values of the data
+
+            Assumptions:
+            M has the size of the layout
+
+            Source:
+            N/A
+
+            Inputs:
+            M        [array]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        buffer = self.buffer
+        buffer[:] = M
+
+        for D,k,view in self.arrays:
+            value = D[k]
+            if not value is view:
+                value[...] = view
+
+        for D,k,index in self.scalars:
+            D[k] = buffer[index]
+
+        return
+
+    def bind(self):
+        """ Replaces the arrays in the data with views into the buffer, so that unpacking only
+            copies the vector into the buffer. An array that is later replaced in the data is
+            copied as usual.
+
+            Assumptions:
+            Nothing else holds on to the original arrays
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.pack()
+
+        for D,k,view in self.arrays:
+            D[k] = view
+
+        return
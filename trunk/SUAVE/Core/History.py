@@ -0,0 +1,285 @@
+## @ingroup Core
+# History.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import struct
+
+import numpy as np
+
+# history files start with this line, followed by the record width
+history_magic = 'SUAVE_HISTORY 1\n'
+
+# ----------------------------------------------------------------------
+#   History
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class History(object):
+    """ An append-only file of fixed width records of floats, such as the evaluations of an
+        optimization. Records are appended with a single write each. The records read so far
+        are kept in memory with the byte offset where reading stopped, so each read only
+        parses the records appended since the last one.
+
+        Assumptions:
+        Records are only appended. A file that shrinks is read again from the start.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,filename):
+        """ Initializes an empty index of a history file, which may not exist yet
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            filename   [string]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.filename = filename
+        self.width    = None
+        self.offset   = 0
+        self.count    = 0
+        self.buffer   = np.zeros((0,0))
+
+    def append(self,record):
+        """ Appends one record, creating the file on the first one
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            record     [array] 1D, the same width for every record
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        record = np.asarray(record,dtype='<f8').ravel()
+
+        if not os.path.exists(self.filename):
+            f = open(self.filename,'wb')
+            f.write(history_magic + struct.pack('<Q',record.size))
+            f.close()
+            self.reset()
+
+        width = self.read_width()
+        if record.size != width:
+            raise ValueError, 'History record of width %i in a file of width %i' % (record.size,width)
+
+        f = open(self.filename,'ab')
+        f.write(record.tostring())
+        f.close()
+
+    def read_width(self):
+        """ Reads the record width from the file header
+
+            Assumptions:
+            The file exists
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            width      [int]
+
+            Properties Used:
+            N/A
+        """
+        if self.width is None:
+            f = open(self.filename,'rb')
+            header = f.read(len(history_magic) + 8)
+            f.close()
+            if not header.startswith(history_magic):
+                raise IOError, '%s is not a SUAVE history file' % self.filename
+            self.width = struct.unpack('<Q',header[len(history_magic):])[0]
+        return self.width
+
+    def read_new(self):
+        """ Reads the records appended since the last read and adds them to the index
+
+            Assumptions:
+            A record that is only partly written is left for the next read
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            records    [array] new records, one per row
+
+            Properties Used:
+            N/A
+        """
+        if not os.path.exists(self.filename):
+            self.reset()
+            return np.zeros((0,0))
+
+        start = len(history_magic) + 8
+        size  = os.path.getsize(self.filename)
+        if size < start + self.offset:
+            self.reset()
+
+        width = self.read_width()
+
+        f = open(self.filename,'rb')
+        f.seek(start + self.offset)
+        data = f.read(size - start - self.offset)
+        f.close()
+
+        n    = len(data) // (8*width)
+        rows = np.fromstring(data[:n*8*width],dtype='<f8').reshape((n,width))
+        self.offset += n*8*width
+
+        # grow the index by doubling, so that appending stays linear
+        needed = self.count + n
+        if needed > self.buffer.shape[0] or self.buffer.shape[1] != width:
+            buffer = np.zeros((max(needed,2*self.buffer.shape[0]),width))
+            if self.count > 0 and self.buffer.shape[1] == width:
+                buffer[:self.count] = self.buffer[:self.count]
+            self.buffer = buffer
+        self.buffer[self.count:needed] = rows
+        self.count = needed
+
+        return rows
+
+    def reset(self):
+        """ Empties the index, the file is read again from the start by the next read """
+        self.width  = None
+        self.offset = 0
+        self.count  = 0
+
+    def read(self):
+        """ Reads the new records and returns all of them
+
+            Assumptions:
+            The returned array is a view of the index, it should not be modified
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            records    [array] one per row
+
+            Properties Used:
+            N/A
+        """
+        self.read_new()
+        return self.buffer[:self.count]
+
+# the open histories, by file
+_histories = {}
+
+## @ingroup Core
+def open_history(filename):
+    """ Returns the History of a file, the same one for every call in a process so that its
+        index is reused
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        filename   [string]
+
+        Outputs:
+        history    [History()]
+
+        Properties Used:
+        N/A
+    """
+    key = os.path.abspath(filename)
+    if not key in _histories:
+        _histories[key] = History(filename)
+    return _histories[key]
+
+## @ingroup Core
+def is_history_file(filename):
+    """ Checks if a file is a History file. Files that do not exist yet are not History files,
+        writers decide the format of a new file.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        filename   [string]
+
+        Outputs:
+        is_history [boolean]
+
+        Properties Used:
+        N/A
+    """
+    if not os.path.exists(filename):
+        return False
+    f = open(filename,'rb')
+    header = f.read(len(history_magic))
+    f.close()
+    return header == history_magic
+
+# ----------------------------------------------------------------------
+#   Module Tests
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    import tempfile
+    import time
+
+    filename = os.path.join(tempfile.mkdtemp(),'history.hist')
+    history  = open_history(filename)
+
+    assert not is_history_file(filename)
+    assert history.read().shape[0] == 0
+
+    for i in xrange(3):
+        history.append([i,2.*i,3.*i])
+
+    assert is_history_file(filename)
+
+    assert history.read().shape == (3,3)
+
+    history.append([3.,6.,9.])
+    assert history.read_new().tolist() == [[3.,6.,9.]]
+    assert history.read()[:,1].tolist() == [0.,2.,4.,6.]
+
+    # reading after every append stays linear in the number of records
+    t0 = time.time()
+    for i in xrange(5000):
+        history.append([i,i,i])
+        history.read()
+    print 'append and read of 5000 records : %.3f s' % (time.time()-t0)
@@ -4,6 +4,10 @@
 from Arrays import *
 
 from Data             import Data
+from Data_Layout      import Data_Layout
+from Data_Fast        import Data_Fast, make_fast
+from Cache            import Cache, hash_data
+from History          import History, open_history, is_history_file
 from DataOrdered      import DataOrdered
 from Diffed_Data      import Diffed_Data
 from Container        import Container
@@ -3,6 +3,7 @@
 # 
 # Created:  Oct 2016, T. MacDonald
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 import subprocess
 from SUAVE.Core import Data
@@ -40,32 +41,61 @@ def call_SU2_CFD(tag,parallel=False,processors=1):
     else:
         subprocess.call(['SU2_CFD',tag+'.cfg'])
         
-    f = open(tag + '_forces_breakdown.dat')
+    SU2_results = read_SU2_forces_breakdown(tag + '_forces_breakdown.dat')
+    
+    print 'CL:',SU2_results.coefficient_of_lift
+    print 'CD:',SU2_results.coefficient_of_drag
+           
+    CL = SU2_results.coefficient_of_lift
+    CD = SU2_results.coefficient_of_drag
+            
+    return CL,CD
+
+## @ingroup Input_Output-SU2
+def read_SU2_forces_breakdown(filename):
+    """Reads the total force and moment coefficients of an SU2 run.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename                     <string>  The forces breakdown file of the run
+
+    Outputs:
+    SU2_results.
+      coefficient_of_lift        [-]
+      coefficient_of_drag        [-]
+      moment_coefficient_x       [-]
+      moment_coefficient_y       [-]
+      moment_coefficient_z       [-]
+
+    Properties Used:
+    N/A
+    """
+    
+    f = open(filename)
         
     SU2_results = Data()    
     
     # only the total forces have the ":"
     for line in f:
         if line.startswith('Total CL:'):
-            print 'CL:',line.split()[2]
             SU2_results.coefficient_of_lift = float(line.split()[2])
         elif line.startswith('Total CD:'):
-            print 'CD:',line.split()[2]
             SU2_results.coefficient_of_drag = float(line.split()[2])
         elif line.startswith('Total CMx:'):
-            print 'CMx:',line.split()[2]
             SU2_results.moment_coefficient_x = float(line.split()[2])
         elif line.startswith('Total CMy:'):
-            print 'CMy:',line.split()[2]
             SU2_results.moment_coefficient_y = float(line.split()[2])
         elif line.startswith('Total CMz:'):
-            print 'CMz:',line.split()[2]
             SU2_results.moment_coefficient_z = float(line.split()[2])
-           
-    CL = SU2_results.coefficient_of_lift
-    CD = SU2_results.coefficient_of_drag
             
-    return CL,CD
+    f.close()
+            
+    return SU2_results
 
 if __name__ == '__main__':
     call_SU2_CFD('cruise',parallel=True)
\ No newline at end of file
@@ -0,0 +1,343 @@
+## @ingroup Input_Output-SU2
+# run_SU2_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import time
+import shutil
+import hashlib
+import subprocess
+
+import numpy as np
+
+from SUAVE.Core import Data, Cache, hash_data
+
+from write_SU2_cfg import write_SU2_cfg
+from call_SU2_CFD import read_SU2_forces_breakdown
+
+# ----------------------------------------------------------------------
+#  Run SU2 Cases
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SU2
+def run_SU2_cases(tag,cases,settings):
+    """Runs a set of SU2 cases on the same mesh concurrently, each in its own folder, within a total
+    number of processors. Each case starts from the solution of the closest converged case, and the
+    results are kept by the content of the mesh and of the case, so cases that were already run are
+    not run again.
+
+    Assumptions:
+    The mesh <tag>.su2 is in the working directory. A case is converged when SU2 exits normally and
+    writes its forces breakdown. Cases only restart from cases on the same side of Mach 1.
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>  The name of the mesh and of the SU2 files
+    cases                        [list of Data] The SU2_settings of each case, see write_SU2_cfg
+    settings.
+      parallel                   <boolean> Runs each case with the SU2 parallel_computation script
+      processors                 [-]       Processors of each case, if parallel
+      maximum_processors         [-]       Processors of all the cases running at the same time
+      restart_from_neighbors     <boolean>
+      run_folder                 <string>  Holds the case folders and the result cache
+      SU2_command                <string or list> Runs a serial case, given the .cfg
+
+    Outputs:
+    SU2_results                  [list of Data] One per case, see read_SU2_forces_breakdown
+
+    Properties Used:
+    N/A
+    """
+
+    run_folder = os.path.abspath(settings.run_folder)
+    if not os.path.exists(run_folder):
+        os.makedirs(run_folder)
+
+    mesh_filename = os.path.abspath(tag + '.su2')
+
+    if settings.parallel:
+        processors = max(int(settings.processors),1)
+    else:
+        processors = 1
+    slots = max(int(settings.maximum_processors) // processors,1)
+
+    # results of earlier runs, kept with the folder of the case that has its solution
+    cache = Cache(max_size=None,filename=os.path.join(run_folder,tag + '_SU2_cases.pkl'))
+
+    mesh_key = hash_file(mesh_filename)
+    keys     = [ hash_data(mesh_key,case) for case in cases ]
+    folders  = [ os.path.join(run_folder,tag + '_' + key[:16]) for key in keys ]
+
+    points = scaled_conditions(cases)
+
+    SU2_results = [None] * len(cases)
+    converged   = []
+    pending     = []
+    duplicates  = {}
+    for ii,key in enumerate(keys):
+        if key in keys[:ii]:
+            # the same case is only run once
+            duplicates[ii] = keys.index(key)
+            continue
+        found, cached = cache.lookup(key)
+        if found:
+            SU2_results[ii] = cached
+            converged.append(ii)
+        else:
+            pending.append(ii)
+
+    running = {}
+    failed  = []
+
+    while pending or running:
+
+        # start cases while there are free processors
+        while pending and len(running) < slots:
+            ii = next_case(points,pending,converged,folders,tag)
+            pending.remove(ii)
+
+            neighbor = None
+            if settings.restart_from_neighbors:
+                neighbor = closest_case(points,ii,converged,folders,tag)
+
+            running[ii] = start_case(tag,cases[ii],folders[ii],folders[neighbor] if neighbor is not None else None,
+                                     mesh_filename,settings,processors)
+
+        # collect the cases that finished
+        finished = [ ii for ii,process in running.items() if process.poll() is not None ]
+        if not finished:
+            time.sleep(0.1)
+            continue
+
+        for ii in finished:
+            process = running.pop(ii)
+            process.log.close()
+
+            forces_filename = os.path.join(folders[ii],tag + '_forces_breakdown.dat')
+            if process.returncode != 0 or not os.path.exists(forces_filename):
+                failed.append(ii)
+                continue
+
+            SU2_results[ii] = read_SU2_forces_breakdown(forces_filename)
+            cache.store(keys[ii],SU2_results[ii])
+            converged.append(ii)
+
+    if failed:
+        raise IOError, 'SU2 failed for the cases in ' + ', '.join([ folders[ii] for ii in failed ])
+
+    for ii,first in duplicates.items():
+        SU2_results[ii] = Data()
+        SU2_results[ii].update(SU2_results[first])
+
+    return SU2_results
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SU2
+def start_case(tag,case,folder,restart_folder,mesh_filename,settings,processors):
+    """Writes the configuration of a case in its folder and starts SU2 there.
+
+    Assumptions:
+    The restart folder holds the flow solution of a converged case on the same mesh
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>
+    case                         [Data]    SU2_settings, see write_SU2_cfg
+    folder                       <string>
+    restart_folder               <string>  None to start from the freestream
+    mesh_filename                <string>
+    settings                     [Data]    see run_SU2_cases
+    processors                   [-]
+
+    Outputs:
+    process                      <Popen>   with its log file in process.log
+
+    Properties Used:
+    N/A
+    """
+
+    if os.path.exists(folder):
+        shutil.rmtree(folder)
+    os.makedirs(folder)
+
+    SU2_settings = Data()
+    SU2_settings.update(case)
+    SU2_settings.mesh_filename = mesh_filename
+
+    restart_filename = None
+    if restart_folder is not None:
+        restart_filename = os.path.join(restart_folder,tag + '_restart_flow.dat')
+    if restart_filename is not None and os.path.exists(restart_filename):
+        shutil.copy(restart_filename,os.path.join(folder,'restart_from.dat'))
+        SU2_settings.restart_filename = 'restart_from.dat'
+
+    write_SU2_cfg(tag,SU2_settings,folder)
+
+    if settings.parallel:
+        script  = os.path.join(os.environ['SU2_HOME'],'parallel_computation.py')
+        command = [sys.executable,script,'-f',tag + '.cfg','-n',str(processors)]
+    else:
+        command = settings.SU2_command
+        if isinstance(command,basestring):
+            command = [command]
+        command = list(command) + [tag + '.cfg']
+
+    log = open(os.path.join(folder,'SU2_log.txt'),'w')
+    process = subprocess.Popen(command,cwd=folder,stdout=log,stderr=subprocess.STDOUT)
+    process.log = log
+
+    return process
+
+## @ingroup Input_Output-SU2
+def closest_case(points,index,converged,folders,tag):
+    """Finds the converged case with a flow solution that is the closest to a case.
+
+    Assumptions:
+    Cases on the other side of Mach 1 are too far
+
+    Source:
+    N/A
+
+    Inputs:
+    points                       [array] see scaled_conditions
+    index                        [-]
+    converged                    [list of indices]
+    folders                      [list of strings]
+    tag                          <string>
+
+    Outputs:
+    closest                      [-] None if no case qualifies
+
+    Properties Used:
+    N/A
+    """
+
+    closest  = None
+    distance = np.inf
+    for ii in converged:
+        if points[ii,2] != points[index,2]:
+            continue
+        if not os.path.exists(os.path.join(folders[ii],tag + '_restart_flow.dat')):
+            continue
+        d = np.sum((points[ii,:2]-points[index,:2])**2)
+        if d < distance:
+            closest  = ii
+            distance = d
+
+    return closest
+
+## @ingroup Input_Output-SU2
+def next_case(points,pending,converged,folders,tag):
+    """Picks the pending case to start next, the one closest to a converged case so that it can
+    restart from it, or the first one if none is converged yet.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    points                       [array] see scaled_conditions
+    pending                      [list of indices]
+    converged                    [list of indices]
+    folders                      [list of strings]
+    tag                          <string>
+
+    Outputs:
+    index                        [-]
+
+    Properties Used:
+    N/A
+    """
+
+    index    = pending[0]
+    distance = np.inf
+    for ii in pending:
+        neighbor = closest_case(points,ii,converged,folders,tag)
+        if neighbor is None:
+            continue
+        d = np.sum((points[neighbor,:2]-points[ii,:2])**2)
+        if d < distance:
+            index    = ii
+            distance = d
+
+    return index
+
+## @ingroup Input_Output-SU2
+def scaled_conditions(cases):
+    """Places the cases in the plane of Mach number and angle of attack, each scaled by its range,
+    to measure how close two cases are.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    cases                        [list of Data]
+      mach_number                [-]
+      angle_of_attack            [degrees]
+
+    Outputs:
+    points                       [array] scaled Mach number, scaled angle of attack, supersonic flag
+
+    Properties Used:
+    N/A
+    """
+
+    mach = np.array([ float(case.mach_number)     for case in cases ])
+    AoA  = np.array([ float(case.angle_of_attack) for case in cases ])
+
+    mach_range = max(np.max(mach) - np.min(mach),1e-6)
+    AoA_range  = max(np.max(AoA)  - np.min(AoA) ,1e-6)
+
+    points = np.vstack([mach/mach_range,AoA/AoA_range,mach >= 1.]).T
+
+    return points
+
+## @ingroup Input_Output-SU2
+def hash_file(filename):
+    """Hashes the content of a file, in blocks so that large meshes are not read at once.
+
+    Assumptions:
+    A missing file has an empty hash
+
+    Source:
+    N/A
+
+    Inputs:
+    filename                     <string>
+
+    Outputs:
+    key                          <string> hex digest
+
+    Properties Used:
+    N/A
+    """
+
+    sha = hashlib.sha1()
+    if os.path.exists(filename):
+        f = open(filename,'rb')
+        block = f.read(1 << 20)
+        while block:
+            sha.update(block)
+            block = f.read(1 << 20)
+        f.close()
+
+    return sha.hexdigest()
@@ -3,9 +3,12 @@
 # 
 # Created:  Oct 2016, T. MacDonald
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
+
+import os
 
 ## @ingroup Input_Output-SU2
-def write_SU2_cfg(tag,SU2_settings):
+def write_SU2_cfg(tag,SU2_settings,folder=''):
     """Creates an SU2 .cfg file that can be used for an SU2 run.
 
     Assumptions:
@@ -21,6 +24,9 @@ def write_SU2_cfg(tag,SU2_settings):
       mach_number               [-]
       angle_of_attack           [degrees]
       maximum_iterations        [-]
+      mesh_filename   (optional) <string>  Defaults to <tag>.su2
+      restart_filename (optional) <string>  Flow solution the run starts from
+    folder     (optional)        <string>  Where the .cfg is written, the run directory of SU2
 
     Outputs:
     <tag>.cfg
@@ -33,15 +39,22 @@ def write_SU2_cfg(tag,SU2_settings):
     mach     = SU2_settings.mach_number
     AoA      = SU2_settings.angle_of_attack
     iters    = SU2_settings.maximum_iterations
+    mesh     = SU2_settings.get('mesh_filename',None)
+    restart  = SU2_settings.get('restart_filename',None)
     
+    if mesh is None:
+        mesh = tag + '.su2'
     
-    filename = tag + '.cfg'
+    filename = os.path.join(folder,tag + '.cfg')
     f = open(filename,mode='w')
 
     # Problem definition
     f.write('PHYSICAL_PROBLEM = EULER\n\n')
     f.write('MATH_PROBLEM = DIRECT\n\n')
-    f.write('RESTART_SOL = NO\n\n')
+    if restart is None:
+        f.write('RESTART_SOL = NO\n\n')
+    else:
+        f.write('RESTART_SOL = YES\n\n')
     
     # Freestream definition
     f.write('MACH_NUMBER = ' + str(float(mach)) + '\n\n')
@@ -122,9 +135,12 @@ def write_SU2_cfg(tag,SU2_settings):
     f.write('CAUCHY_FUNC_FLOW = LIFT\n\n')
     
     # Input/Output
-    f.write('MESH_FILENAME = ' + tag + '.su2\n\n')
+    f.write('MESH_FILENAME = ' + mesh + '\n\n')
     f.write('MESH_OUT_FILENAME = mesh_out.su2\n\n')
-    f.write('SOLUTION_FLOW_FILENAME = solution_flow.dat\n\n')
+    if restart is None:
+        f.write('SOLUTION_FLOW_FILENAME = solution_flow.dat\n\n')
+    else:
+        f.write('SOLUTION_FLOW_FILENAME = ' + restart + '\n\n')
     f.write('SOLUTION_ADJ_FILENAME = solution_adj.dat\n\n')
     f.write('MESH_FORMAT = SU2\n\n')
     f.write('OUTPUT_FORMAT = TECPLOT\n\n')
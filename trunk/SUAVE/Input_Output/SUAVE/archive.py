@@ -3,27 +3,36 @@
 #
 # Created:  Jan 2015, T. Lukaczyk
 # Modified: Nov 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
-from SUAVE.Core import Data
+from SUAVE.Core import Data, DataOrdered
 import numpy as np
 import types
 import json
+import struct
 from collections import OrderedDict
 
+# binary archives start with this line, followed by the header length and the JSON header
+binary_magic     = 'SUAVE_BINARY_ARCHIVE 1\n'
+binary_alignment = 64
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
 ## @ingroup Input_Output-SUAVE
-def archive(data,filename):
+def archive(data,filename,binary=False):
     """Converts a SUAVE data structure to a JSON file for storage. 
 
     Assumptions:
     Data must be numpy arrays, strings, booleans, floats, ints, or lists.
     Functions are ignored and all other data raises an error.
+    
+    With binary=True the arrays are written raw after a JSON header that keeps the
+    structure, see archive_binary. load() recognizes both formats.
 
     Source:
     N/A
@@ -31,6 +40,7 @@ def archive(data,filename):
     Inputs:
     data       SUAVE data structure
     filename   <string> - file to be output
+    binary     <boolean> - write the binary format
 
     Outputs:
     filename   File as specified in JSON format
@@ -39,6 +49,10 @@ def archive(data,filename):
     N/A
     """     
     
+    if binary:
+        archive_binary(data,filename)
+        return
+    
     # Create a dictionary structure with the results
     res_dict = build_dict_base(data)
     
@@ -128,4 +142,111 @@ def build_dict_r(v):
         for k in keys:
             ret[k] = build_dict_r(v[k])        
     
+    return ret
+
+## @ingroup Input_Output-SUAVE
+def archive_binary(data,filename):
+    """Writes a SUAVE data structure to a binary file. The structure, the Data or DataOrdered
+    type of each level and the small values are kept in a JSON header. The arrays are
+    written without conversion after the header, each one aligned so that it can be memory
+    mapped when loaded.
+
+    Assumptions:
+    Same types as archive(). Arrays of Python objects raise an error.
+
+    Source:
+    N/A
+
+    Inputs:
+    data       SUAVE data structure
+    filename   <string> - file to be output
+
+    Outputs:
+    filename   File with the layout
+               magic line, header length <uint64>, JSON header, padding, arrays
+
+    Properties Used:
+    N/A
+    """
+    
+    # Build the header, arrays are replaced by their place in the file
+    arrays = []
+    header = build_binary_r(data,arrays)
+    header = json.dumps(header)
+    
+    start = len(binary_magic) + 8 + len(header)
+    
+    # Write the header and the arrays
+    f = open(filename,'wb')
+    f.write(binary_magic)
+    f.write(struct.pack('<Q',len(header)))
+    f.write(header)
+    f.write('\0' * (-start % binary_alignment))
+    for offset,v in arrays:
+        v.tofile(f)
+        f.write('\0' * (-v.nbytes % binary_alignment))
+    f.close()
+    
+## @ingroup Input_Output-SUAVE
+def build_binary_r(v,arrays):
+    """Builds the header of a binary archive. This the recursive step.
+
+    Assumptions:
+    Same types as archive(). Arrays of Python objects raise an error.
+
+    Source:
+    N/A
+
+    Inputs:
+    v       value in a data structure
+    arrays  list of the (offset, array) to write, appended to
+
+    Outputs:
+    ret     value based on type of v, data structures and arrays become dictionaries
+            {'data' : type, 'items' : [[key, value], ...]}
+            {'array': [dtype, shape, offset]}
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+    
+    # Arrays are placed after the previous ones
+    if tv == np.ndarray:
+        if v.dtype.hasobject:
+            raise TypeError('Unexpected array type in SUAVE data structure')
+        v = np.ascontiguousarray(v)
+        offset = 0
+        if arrays:
+            last_offset, last = arrays[-1]
+            offset = last_offset + last.nbytes + (-last.nbytes % binary_alignment)
+        arrays.append((offset,v))
+        ret = {'array':[v.dtype.str,list(v.shape),offset]}
+    elif tv == np.float64:
+        ret = float(v)
+    elif (tv == str) or (tv == bool):
+        ret = v
+    elif tv == type(None):
+        ret = None
+    elif (tv == float) or (tv == int):
+        ret = v
+    elif tv == types.FunctionType: # Functions cannot be stored
+        ret = None
+    elif tv == list:
+        ret = [ build_binary_r(u,arrays) for u in v ]
+    else:
+        # Assume other data types are SUAVE data types and check
+        try:
+            keys = v.keys()
+        except:
+            raise TypeError('Unexpected data type in SUAVE data structure')
+        if isinstance(v,DataOrdered):
+            kind = 'DataOrdered'
+        else:
+            kind = 'Data'
+        # Recursively assign values
+        ret = OrderedDict()
+        ret['data']  = kind
+        ret['items'] = [ [k,build_binary_r(v[k],arrays)] for k in keys ]
+    
     return ret
\ No newline at end of file
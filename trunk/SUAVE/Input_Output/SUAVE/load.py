@@ -3,6 +3,7 @@
 #
 # Created:  Jan 2015, T. Lukaczyk
 # Modified: Nov 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 
 
@@ -11,26 +12,32 @@
 # ----------------------------------------------------------------------
 
 import json
+import struct
 from SUAVE.Core import Data, DataOrdered
 import numpy as np
 from collections import OrderedDict
 
+from archive import binary_magic, binary_alignment
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
 
 ## @ingroup Input_Output-SUAVE
-def load(filename):
+def load(filename,lazy=False):
     """Converts a JSON file into a SUAVE data structure.
 
     Assumptions:
     JSON file was a previously saved SUAVE data structure.
+    
+    Binary archives, see archive_binary, are recognized and read with load_binary.
 
     Source:
     N/A
 
     Inputs:
     filename   <string> - file to be loaded
+    lazy       <boolean> - memory map the arrays of a binary archive
 
     Outputs:
     data       SUAVE data structure
@@ -39,6 +46,14 @@ def load(filename):
     N/A
     """ 
     
+    # Check the format
+    f = open(filename,'rb')
+    magic = f.read(len(binary_magic))
+    f.close()
+    
+    if magic == binary_magic:
+        return load_binary(filename,lazy)
+    
     # Get JSON string
     f = open(filename)
     res_string = f.readline()
@@ -123,4 +138,111 @@ def build_data_r(v):
     else:
         raise TypeError('Data type not expected in SUAVE JSON structure')
 
-    return ret
\ No newline at end of file
+    return ret
+
+## @ingroup Input_Output-SUAVE
+def load_binary(filename,lazy=False):
+    """Reads a binary archive into a SUAVE data structure. Lazily, the arrays are views of a
+    copy on write memory map of the file, so only the parts of the results that are used are
+    read from disk. Changing them does not change the file.
+
+    Assumptions:
+    The file was written by archive_binary.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - file to be loaded
+    lazy       <boolean> - memory map the arrays
+
+    Outputs:
+    data       SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+    
+    # Read the header
+    f = open(filename,'rb')
+    f.read(len(binary_magic))
+    length = struct.unpack('<Q',f.read(8))[0]
+    header = json.loads(f.read(length),object_pairs_hook=OrderedDict)
+    
+    start  = len(binary_magic) + 8 + length
+    start += -start % binary_alignment
+    
+    if lazy:
+        # One map of the whole array region, the arrays are views of it
+        f.seek(0,2)
+        if f.tell() > start:
+            region = np.memmap(filename,dtype=np.uint8,mode='c',offset=start)
+        else:
+            region = np.zeros(0,dtype=np.uint8)
+        f.close()
+        def read_array(dtype,shape,offset):
+            dtype  = np.dtype(str(dtype))
+            nbytes = dtype.itemsize * int(np.prod(shape))
+            return region[offset:offset+nbytes].view(dtype).reshape(shape)
+    else:
+        def read_array(dtype,shape,offset):
+            dtype = np.dtype(str(dtype))
+            f.seek(start + offset)
+            return np.fromfile(f,dtype=dtype,count=int(np.prod(shape))).reshape(shape)
+    
+    data = build_binary_data_r(header,read_array)
+    
+    if not lazy:
+        f.close()
+    
+    return data
+
+## @ingroup Input_Output-SUAVE
+def build_binary_data_r(v,read_array):
+    """Builds a SUAVE data structure from the header of a binary archive. This is recursive step.
+
+    Assumptions:
+    The header was written by archive_binary.
+
+    Source:
+    N/A
+
+    Inputs:
+    v           generic value of the header
+    read_array  function(dtype,shape,offset) that returns an array of the file
+
+    Outputs:
+    ret         value converted to needed format
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+    
+    # Transform to SUAVE data structure with appropriate types
+    if tv == OrderedDict:
+        if 'array' in v:
+            dtype, shape, offset = v['array']
+            ret = read_array(dtype,tuple(shape),offset)
+        else:
+            if v['data'] == 'DataOrdered':
+                ret = DataOrdered()
+            else:
+                ret = Data()
+            # Recursively assign values
+            for k,u in v['items']:
+                ret[str(k)] = build_binary_data_r(u,read_array)
+    elif tv == list:
+        ret = [ build_binary_data_r(u,read_array) for u in v ]
+    elif (tv == unicode): 
+        ret = str(v)
+    elif (tv == bool):
+        ret = v
+    elif tv == type(None):
+        ret = None
+    elif (tv == float) or (tv == int) or (tv == long):
+        ret = v
+    else:
+        raise TypeError('Data type not expected in SUAVE binary archive')
+
+    return ret
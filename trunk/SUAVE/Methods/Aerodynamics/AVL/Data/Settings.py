@@ -4,6 +4,7 @@
 # Created:  Dec 2014, T. Momose
 # Modified: Jan 2016, E. Botero
 #           Arp 2017, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -79,6 +80,7 @@ class Settings(Data):
                 self.filenames.deck_template   = 'commands_{0:03d}.deck'
                 self.filenames.output_template = 'results_{}.txt'
                 self.filenames.case_template   = 'case_{0:03d}_{1:02d}'
+                self.filenames.case_folder_template = 'case_folder_{0:03d}' # used when AVL runs are done concurrently
                 self.filenames.log_filename    = 'avl_log.txt'
                 self.filenames.err_filename    = 'avl_err.txt'
                 #--------------------------------------------------------------------------
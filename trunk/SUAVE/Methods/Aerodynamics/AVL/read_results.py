@@ -4,12 +4,14 @@
 # Created:  Mar 2015, T. Momose
 # Modified: Jan 2016, E. Botero
 #           Apr 2017, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.AVL.Data.Results import Results
 
 ## @ingroup Methods-Aerodynamics-AVL
 def read_results(avl_object):
@@ -38,7 +40,7 @@ def read_results(avl_object):
         case = avl_object.current_status.cases[case_name]
         num_ctrl = case.stability_and_control.control_deflections.size
         with open(case.result_filename,'r') as res_file:
-            case_res = Data()
+            case_res = Results()
             case_res.tag = case.tag
             lines   = res_file.readlines()
             
@@ -4,6 +4,7 @@
 # Created:  Dec 2013, SUAVE Team
 # Modified: Apr 2017, T. MacDonald
 #           Oct 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,7 +19,9 @@ import numpy as np
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
 def weissinger_vortex_lattice(conditions,configuration,wing):
-    """Uses the vortex lattice method to compute the lift coefficient and induced drag component
+    """Uses the vortex lattice method to compute the lift coefficient and induced drag component.
+    The influence matrix only depends on the geometry, so all the angles of attack are solved
+    with a single factorization.
 
     Assumptions:
     None
@@ -41,11 +44,11 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
       vertical                              [Boolean]
     configuration.number_panels_spanwise    [Unitless]
     configuration.number_panels_chordwise   [Unitless]
-    conditions.aerodynamics.angle_of_attack [radians]
+    conditions.aerodynamics.angle_of_attack [radians] (scalar or array)
 
     Outputs:
-    Cl                                      [Unitless]
-    Cd                                      [Unitless]
+    Cl                                      [Unitless] (same shape as angle_of_attack)
+    Cd                                      [Unitless] (same shape as angle_of_attack)
 
     Properties Used:
     N/A
@@ -65,8 +68,9 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
 
     n  = configuration.number_panels_spanwise
 
-    # conditions
-    aoa = conditions.aerodynamics.angle_of_attack
+    # conditions, one column per angle of attack
+    aoa_in = conditions.aerodynamics.angle_of_attack
+    aoa    = np.atleast_1d(aoa_in).ravel()
     
     # chord difference
     dchord = (root_chord-tip_chord)
@@ -75,8 +79,8 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         
     deltax = span/n
     
-    sin_aoa = np.sin(aoa)
-    cos_aoa = np.cos(aoa)
+    sin_aoa = np.sin(aoa)[:,None]
+    cos_aoa = np.cos(aoa)[:,None]
 
     if orientation == False :
 
@@ -91,17 +95,16 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         x  = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length)
         y  = np.atleast_2d(((i+1)*deltax-deltax/2))      
                 
-        RHS  = np.atleast_2d(np.sin(twist_distri+aoa))
+        RHS  = np.sin(twist_distri[:,None]+aoa[None,:])
         
         A = (whav(x,y,xa.T,ya.T)-whav(x,y,xa.T,yb.T)\
             -whav(x,y,xa.T,-ya.T)+whav(x,y,xa.T,-yb.T))*0.25/np.pi
     
-        # Vortex strength computation by matrix inversion
-        T = np.linalg.solve(A.T,RHS.T).T
+        # Vortex strength computation, one factorization for all the right hand sides
+        T = np.linalg.solve(A.T,RHS).T
         
         # Calculating the effective velocty         
-        A_v = A*0.25/np.pi*T
-        v   = np.sum(A_v,axis=1)
+        v = np.dot(T,A.T)*0.25/np.pi
         
         Lfi = -T * (sin_aoa-v)
         Lfk =  T * cos_aoa 
@@ -112,16 +115,24 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         D  = deltax * Dg
         
         # Total lift
-        LT = np.sum(L)
-        DT = np.sum(D)
+        LT = np.sum(L,axis=1)
+        DT = np.sum(D,axis=1)
     
         Cl = 2*LT/(0.5*Sref)
         Cd = 2*DT/(0.5*Sref)     
     
     else:
         
-        Cl = 0.0
-        Cd = 0.0         
+        Cl = np.zeros_like(aoa)
+        Cd = np.zeros_like(aoa)
+        
+    # return in the shape of the angles of attack
+    if np.ndim(aoa_in) == 0:
+        Cl = Cl[0]
+        Cd = Cd[0]
+    else:
+        Cl = np.reshape(Cl,np.shape(aoa_in))
+        Cd = np.reshape(Cd,np.shape(aoa_in))
 
     return Cl, Cd
 
@@ -3,12 +3,14 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core.Arrays import atleast_2d_col 
+from SUAVE.Methods.Utilities.Chebyshev import cached_discretization
 
 # ----------------------------------------------------------------------
 #  Initialize Differentials
@@ -16,7 +18,8 @@ from SUAVE.Core.Arrays import atleast_2d_col
 
 ## @ingroup Methods-Missions-Segments-Common
 def initialize_differentials_dimensionless(segment,state):
-    """ Discretizes the differential operators
+    """ Discretizes the differential operators. The operators are shared by all the
+        segments with the same discretization, see cached_discretization.
     
         Assumptions:
         N/A
@@ -44,7 +47,7 @@ def initialize_differentials_dimensionless(segment,state):
     discretization_method = numerics.discretization_method
     
     # get operators
-    x,D,I = discretization_method(N,**numerics)
+    x,D,I = cached_discretization(discretization_method,N,**numerics)
     x = atleast_2d_col(x)
     
     # pack
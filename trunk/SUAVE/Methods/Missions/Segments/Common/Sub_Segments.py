@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -59,6 +60,46 @@ def expand_sub_segments(segment,state):
             print 'segment end :' , tag        
 
 
+# ----------------------------------------------------------------------
+#  Expand Independent Sub Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common   
+def expand_independent_sub_segments(segment,state):
+    """ Fills in the segments to a mission with data, without linking the initials of one segment to the last.
+        Used when the sub segments are independent cases, such as whole missions in a batch.
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        N/A
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """    
+    
+    for tag,sub_segment in segment.segments.items():
+        
+        if Process.verbose:
+            print 'case start :' , tag
+        
+        sub_state = deepcopy( sub_segment.state )
+        
+        sub_segment.initialize(sub_state)
+        
+        state.segments[tag]     = sub_state
+        state.unknowns[tag]     = sub_state.unknowns
+        state.conditions[tag]   = sub_state.conditions
+        state.residuals[tag]    = sub_state.residuals
+        
+        if Process.verbose:
+            print 'case end :' , tag
+            
 # ----------------------------------------------------------------------
 #  Update Sub Segments
 # ----------------------------------------------------------------------        
@@ -86,6 +127,34 @@ def update_sub_segments(segment,state):
         sub_segment.iterate(state.segments[tag])
         sub_segment.finalize(state.segments[tag])
                          
+# ----------------------------------------------------------------------
+#  Converge Independent Sub Segments
+# ----------------------------------------------------------------------        
+
+## @ingroup Methods-Missions-Segments-Common
+def converge_independent_sub_segments(segment,state):
+    """ Converges each case of a batch with its own solver, then runs its iterate process once
+        more at the solution, as its own evaluation would.
+    
+        Assumptions:
+        The cases do not depend on each other
+        
+        Inputs:
+        N/A
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """      
+    
+    for tag,sub_segment in segment.segments.items():
+        sub_state = state.segments[tag]
+        sub_segment.process.converge(sub_segment,sub_state)
+        sub_segment.process.iterate(sub_segment,sub_state)
+        
 # ----------------------------------------------------------------------
 #  Finalize Sub Segments
 # ----------------------------------------------------------------------
@@ -114,6 +183,35 @@ def finalize_sub_segments(segment,state):
         sub_segment.finalize(state.segments[tag])
         state.segments[tag].initials = Conditions()
 
+# ----------------------------------------------------------------------
+#  Finalize Independent Sub Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def finalize_independent_sub_segments(segment,state):
+    """ Sets the conditions in each case of a batch. The cases are whole missions, whose finalize
+        method finalizes their analyses, so their finalize process is called directly.
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        N/A
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+    
+    for tag,sub_segment in segment.segments.items():
+        sub_segment.process.finalize(sub_segment,state.segments[tag])
+        state.segments[tag].initials = Conditions()
+
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
 # ----------------------------------------------------------------------
@@ -3,8 +3,10 @@
 # @ingroup Methods-Missions
 
 from converge_root import converge_root
-from expand_state  import expand_state
+from converge_adaptive import converge_adaptive
+from expand_state  import expand_state, fast_state
 from optimize      import converge_opt
+from warm_start    import set_warm_start, clear_warm_start, seed_unknowns
 
 import Common
 import Cruise
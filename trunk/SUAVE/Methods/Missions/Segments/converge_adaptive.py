@@ -0,0 +1,172 @@
+## @ingroup Methods-Missions-Segments
+# converge_adaptive.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import array_type
+from SUAVE.Methods.Utilities.Chebyshev import piecewise_data, discretization_error, interpolate_discretization
+
+from converge_root import converge_root
+
+# ----------------------------------------------------------------------
+#  Converge Adaptive
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def converge_adaptive(segment,state):
+    """Converges a segment with converge_root, then refines its discretization while the estimated
+    error of the converged state is above the tolerance. Each refinement about doubles the number
+    of control points and starts from the converged solution, interpolated to the new points.
+    Segments can then start at a low number of control points and only the ones that need more
+    points are refined. To use, replace segment.process.converge.converge_root by this function.
+
+    Assumptions:
+    The segment is converged on its own, as in a sequential mission. The error is estimated from
+    the unknowns and the inertial frame conditions.
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.number_control_points   [Unitless]
+    state.numerics.adaptive_tolerance      [Unitless]
+    state.numerics.maximum_control_points  [Unitless]
+    state.numerics.number_of_elements      [Unitless] for piecewise_data
+
+    Outputs:
+    state.unknowns                         [Any]
+    state.numerics.number_control_points   [Unitless]
+    state.numerics.discretization_error    [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = state.numerics
+
+    if numerics.discretization_method is piecewise_data:
+        elements = numerics.number_of_elements
+    else:
+        elements = 1
+
+    converge_root(segment,state)
+
+    # the refined solves start from the converged solution instead
+    state.pop('warm_start',None)
+
+    while True:
+        N     = numerics.number_control_points
+        x     = numerics.dimensionless.control_points[:,0]
+        error = state_error(state,x,elements)
+        numerics.discretization_error = error
+
+        if error <= numerics.adaptive_tolerance:
+            break
+
+        # nested points, keeping whole elements
+        N_new = min(2*N-1,numerics.maximum_control_points)
+        N_new = elements*((N_new-1)/elements) + 1
+        if N_new <= N:
+            break
+
+        # the converged unknowns
+        unknowns = []
+        collect_arrays(state.unknowns,N,unknowns)
+
+        # initialize the segment again on the new points, starting from the converged solution
+        numerics.number_control_points = N_new
+        segment.initialize(state)
+        x_new = numerics.dimensionless.control_points[:,0]
+        for data,key,value in unknowns:
+            data[key] = interpolate_discretization(x,value,x_new,elements)
+
+        converge_root(segment,state)
+
+    return
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def state_error(state,x,elements):
+    """Estimates the discretization error of the unknowns and of the integrated conditions: the
+    inertial position and velocity and the total mass. Forces and accelerations are left out, as
+    their values at convergence are residuals and round off.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                         [Data]
+    state.conditions.frames.inertial       [Data]
+    state.conditions.weights.total_mass    [kg]
+    x                                      [Unitless] dimensionless control points
+    elements                               [Unitless]
+
+    Outputs:
+    error                                  [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    values = []
+    collect_arrays(state.unknowns,len(x),values)
+    
+    conditions = state.conditions
+    integrated = []
+    if 'frames' in conditions:
+        integrated.append(conditions.frames.inertial.get('position_vector',None))
+        integrated.append(conditions.frames.inertial.get('velocity_vector',None))
+    if 'weights' in conditions:
+        integrated.append(conditions.weights.get('total_mass',None))
+    for value in integrated:
+        if isinstance(value,array_type) and value.ndim == 2 and value.shape[0] == len(x):
+            values.append((conditions,None,value))
+
+    error = 0.
+    for data,key,value in values:
+        error = max(error,discretization_error(x,value,elements))
+
+    return error
+
+## @ingroup Methods-Missions-Segments
+def collect_arrays(data,rows,arrays):
+    """Finds the 2D arrays with one row per control point in a data structure.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    data                                   [Data]
+    rows                                   [Unitless]
+    arrays                                 [list] appended with (data, key, array)
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    for key,value in data.items():
+        if isinstance(value,dict):
+            collect_arrays(value,rows,arrays) # recursion!
+        elif isinstance(value,array_type) and value.ndim == 2 and value.shape[0] == rows:
+            arrays.append((data,key,value))
+
+    return
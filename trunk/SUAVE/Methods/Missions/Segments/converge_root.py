@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,10 @@ import scipy.optimize
 import numpy as np
 
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Core import Data_Layout
+
+from jacobian import jacobian_sparsity, color_columns, colored_finite_difference
+from warm_start import seed_unknowns
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -20,6 +25,9 @@ from SUAVE.Core.Arrays import array_type
 ## @ingroup Methods-Missions-Segments
 def converge_root(segment,state):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
+    Setting state.numerics.solver_jacobian to 'finite_difference' gives the solver a colored finite
+    difference Jacobian built on the sparsity of the residuals instead of a dense one. A warm start
+    in the state, see set_warm_start, replaces the initial unknowns.
 
     Assumptions:
     N/A
@@ -33,6 +41,7 @@ def converge_root(segment,state):
     state                              [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string]
 
     Outputs:
     state.unknowns                     [Any]
@@ -42,18 +51,49 @@ def converge_root(segment,state):
     N/A
     """       
     
-    unknowns = state.unknowns.pack_array()
+    # start from the last converged solution if there is one
+    seed_unknowns(state)
+    
+    # compile the maps between the data and the solver vectors once per solve, they are
+    # kept out of the state so it can still be copied and archived
+    unknowns_layout  = Data_Layout(state.unknowns)
+    residuals_layout = Data_Layout(state.residuals)
+    unknowns_layout.bind()
+    layouts = (unknowns_layout,residuals_layout)
+    
+    unknowns = unknowns_layout.pack().copy()
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    solver_jacobian = state.numerics.solver_jacobian
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = [segment,state],
-                                         xtol = state.numerics.tolerance_solution,
-                                         full_output=1)
+    if solver_jacobian == 'none':
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = [segment,state,layouts],
+                                             xtol = state.numerics.tolerance_solution,
+                                             full_output=1)
+        
+    elif solver_jacobian == 'finite_difference':
+        # the pattern and coloring only depend on the layout of the unknowns and residuals
+        sparsity = jacobian_sparsity(segment,state)
+        colors   = color_columns(sparsity)
+        
+        def jacobian(unknowns,args):
+            return colored_finite_difference(iterate,unknowns,args,sparsity,colors)
+        
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = [segment,state,layouts],
+                                             fprime = jacobian,
+                                             xtol = state.numerics.tolerance_solution,
+                                             full_output=1)
+        
+    else:
+        raise ValueError , 'unknown solver_jacobian "%s"' % solver_jacobian
 
     if ier!=1:
         print "Segment did not converge. Segment Tag: " + segment.tag
@@ -70,7 +110,7 @@ def converge_root(segment,state):
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Missions-Segments
-def iterate(unknowns,(segment,state)):
+def iterate(unknowns,(segment,state,layouts)):
     
     """Runs one iteration of of all analyses for the mission.
 
@@ -82,6 +122,7 @@ def iterate(unknowns,(segment,state)):
 
     Inputs:
     state.unknowns                [Data]
+    layouts                       [tuple] the unknowns and residuals Data_Layout, or None
     segment.process.iterate       [Data]
 
     Outputs:
@@ -92,12 +133,18 @@ def iterate(unknowns,(segment,state)):
     """       
 
     if isinstance(unknowns,array_type):
-        state.unknowns.unpack_array(unknowns)
+        if layouts is None:
+            state.unknowns.unpack_array(unknowns)
+        else:
+            layouts[0].unpack(unknowns)
     else:
         state.unknowns = unknowns
         
     segment.process.iterate(segment,state)
     
-    residuals = state.residuals.pack_array()
+    if layouts is None:
+        residuals = state.residuals.pack_array()
+    else:
+        residuals = layouts[1].pack().copy()
         
     return residuals 
\ No newline at end of file
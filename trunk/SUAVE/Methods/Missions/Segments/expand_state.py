@@ -3,6 +3,13 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core.Data_Fast import make_fast
 
 # ----------------------------------------------------------------------
 #  Expand State
@@ -34,4 +41,34 @@ def expand_state(segment,state):
     state.expand_rows(n_points)
     
     return
-    
\ No newline at end of file
+    
+
+# ----------------------------------------------------------------------
+#  Fast State
+# ----------------------------------------------------------------------
+
+## @ingroup methods-mission-segments
+def fast_state(segment,state):
+    
+    """Switches the state to the fast attribute versions of its Data classes. This is opt in,
+    add it as the last step of the initialize process of the top level segment or mission.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state                                 [Data]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """       
+    
+    make_fast(state)
+    
+    return
@@ -0,0 +1,243 @@
+## @ingroup Methods-Missions-Segments
+# jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import atleast_2d_col, array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#  Jacobian Sparsity
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def jacobian_sparsity(segment,state):
+    """Builds the boolean sparsity pattern of the residuals with respect to the unknowns.
+
+    Assumptions:
+    Residuals at a control point only depend on the unknowns at that same control point,
+    unless the unknown is listed in state.numerics.jacobian_coupled_unknowns. Scalar unknowns,
+    residuals with a different number of rows than the unknown, and unknowns or residuals
+    owned by a parent segment (e.g. Vary_Cruise) are treated as fully coupled. Weak couplings
+    between segments and through the mass integration are dropped, the solver still converges
+    on the exact residuals.
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                            [Data]
+    state.residuals                           [Data]
+    state.segments                            [Data]
+    state.numerics.jacobian_coupled_unknowns  [list]
+
+    Outputs:
+    sparsity                                  [array of bool, residuals x unknowns]
+
+    Properties Used:
+    N/A
+    """
+
+    unknowns  = []
+    residuals = []
+
+    collect_blocks(segment,state,'unknowns',unknowns,())
+    collect_blocks(segment,state,'residuals',residuals,())
+
+    n_rows = sum([ r_block['size'] for r_block in residuals ])
+    n_cols = sum([ u_block['size'] for u_block in unknowns  ])
+
+    sparsity = np.zeros([n_rows,n_cols],dtype=bool)
+
+    for r_block in residuals:
+        for u_block in unknowns:
+
+            r_owner = r_block['owner']
+            u_owner = u_block['owner']
+
+            # only segments in the same branch see each other
+            depth = min(len(r_owner),len(u_owner))
+            if r_owner[:depth] != u_owner[:depth]:
+                continue
+
+            rows = slice(r_block['offset'],r_block['offset']+r_block['size'])
+            cols = slice(u_block['offset'],u_block['offset']+u_block['size'])
+
+            n_r,m_r = r_block['shape']
+            n_u,m_u = u_block['shape']
+
+            pointwise = ( r_owner == u_owner ) and ( n_r == n_u ) and ( n_u > 1 ) and not u_block['coupled']
+
+            if pointwise:
+                # entries are raveled column major, so the row index repeats every n entries
+                point_r = np.tile(np.arange(n_r),m_r)
+                point_u = np.tile(np.arange(n_u),m_u)
+                sparsity[rows,cols] = point_r[:,None] == point_u[None,:]
+            else:
+                sparsity[rows,cols] = True
+
+    return sparsity
+
+## @ingroup Methods-Missions-Segments
+def collect_blocks(segment,state,key,blocks,owner):
+    """Walks the unknowns or residuals of a state in the same order as Data.pack_array and
+    records the offset, shape and owning segment of every packed value.
+
+    Assumptions:
+    Sub segment states are stored in state.segments with the same tags as in state.unknowns
+
+    Source:
+    N/A
+
+    Inputs:
+    segment       [Segment]
+    state         [State]
+    key           ['unknowns' or 'residuals']
+    blocks        [list]
+    owner         [tuple]
+
+    Outputs:
+    blocks        [list of Data]
+
+    Properties Used:
+    N/A
+    """
+
+    owner = owner + (id(state),)
+
+    try:
+        coupled = state.numerics.jacobian_coupled_unknowns
+    except AttributeError:
+        coupled = []
+
+    try:
+        sub_states = state.segments
+    except AttributeError:
+        sub_states = {}
+
+    valid_types = ( int, float,
+                    array_type,
+                    matrix_type )
+
+    def do_collect(D,path):
+        for k,v in D.iteritems():
+            if isinstance(v,dict):
+                if path == () and k in sub_states:
+                    collect_blocks(segment.segments[k],sub_states[k],key,blocks,owner)
+                else:
+                    do_collect(v,path+(k,))
+                continue
+            elif not isinstance(v,valid_types): continue
+            elif np.rank(v) > 2: continue
+
+            shape  = atleast_2d_col(v).shape
+            offset = 0
+            if blocks:
+                offset = blocks[-1]['offset'] + blocks[-1]['size']
+
+            blocks.append({ 'offset'  : offset,
+                            'size'    : shape[0]*shape[1],
+                            'shape'   : shape,
+                            'owner'   : owner,
+                            'coupled' : '.'.join(path+(k,)) in coupled or k in coupled })
+
+    do_collect(state[key],())
+
+    return blocks
+
+# ----------------------------------------------------------------------
+#  Column Coloring
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def color_columns(sparsity):
+    """Groups the columns of a sparsity pattern so that no two columns in a group share a row.
+    All the columns in a group can then be perturbed with a single residual evaluation.
+
+    Assumptions:
+    Greedy coloring in column order
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    sparsity   [array of bool]
+
+    Outputs:
+    colors     [list of arrays of column indices]
+
+    Properties Used:
+    N/A
+    """
+
+    n_rows, n_cols = sparsity.shape
+
+    colors = []
+    masks  = []
+
+    for col in xrange(n_cols):
+        column = sparsity[:,col]
+        for color, mask in zip(colors,masks):
+            if not np.any(mask & column):
+                color.append(col)
+                mask |= column
+                break
+        else:
+            colors.append([col])
+            masks.append(column.copy())
+
+    colors = [ np.array(color) for color in colors ]
+
+    return colors
+
+# ----------------------------------------------------------------------
+#  Finite Difference Jacobian
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def colored_finite_difference(function,unknowns,args,sparsity,colors):
+    """Estimates a sparse Jacobian with forward differences, perturbing every column of a color at once.
+
+    Assumptions:
+    Entries outside of the sparsity pattern are zero
+
+    Source:
+    N/A
+
+    Inputs:
+    function   [callable, function(unknowns,args)]
+    unknowns   [array]
+    args       [list]
+    sparsity   [array of bool]
+    colors     [list of arrays]
+
+    Outputs:
+    jacobian   [array, residuals x unknowns]
+
+    Properties Used:
+    N/A
+    """
+
+    x0 = np.array(unknowns,dtype=float)
+    f0 = np.array(function(x0,args),dtype=float)
+
+    steps = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x0),1.)
+
+    jacobian = np.zeros([len(f0),len(x0)])
+
+    for color in colors:
+        x = x0.copy()
+        x[color] = x[color] + steps[color]
+        df = np.array(function(x,args),dtype=float) - f0
+        for col in color:
+            rows = sparsity[:,col]
+            jacobian[rows,col] = df[rows] / steps[col]
+
+    return jacobian
@@ -3,6 +3,7 @@
 # 
 # Created:  Dec 2016, E. Botero
 # Modified: Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,9 +11,12 @@
 
 import scipy.optimize as opt
 import numpy as np
+import time
 
 from SUAVE.Core.Arrays import array_type
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data, Cache, hash_data
+
+from warm_start import seed_unknowns
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -20,7 +24,10 @@ from SUAVE.Core import Units
 
 ## @ingroup Methods-Missions-Segments
 def converge_opt(segment,state):
-    """Interfaces the mission to an optimization algorithm
+    """Interfaces the mission to an optimization algorithm. The outputs of the last evaluated points
+    are kept for the solve, so the objective and the constraints at a point share one iteration of the
+    segment. The gradients of the objective and of all the constraints are found together with one
+    forward difference pass over the unknowns.
 
     Assumptions:
     N/A
@@ -36,25 +43,50 @@ def converge_opt(segment,state):
 
     Outputs:
     state.unknowns                     [Any]
+    state.numerics.optimization        [Data] evaluation counters and times [s]
 
     Properties Used:
     N/A
     """     
     
+    start_time = time.time()
+    
+    # start from the last converged solution if there is one
+    seed_unknowns(state)
+    
     # pack up the array
     unknowns = state.unknowns.pack_array()
     
+    # the outputs of the recent points of this solve, the conditions change between solves
+    state._optimization_memo = Cache(max_size=8)
+    state.inputs_last        = None
+    
+    counters = Data()
+    counters.iterations     = 0
+    counters.memo_hits      = 0
+    counters.gradients      = 0
+    counters.iterate_time   = 0.
+    counters.gradient_time  = 0.
+    counters.total_time     = 0.
+    state.numerics.optimization = counters
+    
     # Have the optimizer call the wrapper
     obj       = lambda unknowns:get_objective(unknowns,(segment,state))   
     econ      = lambda unknowns:get_econstraints(unknowns,(segment,state)) 
     iecon     = lambda unknowns:get_ieconstraints(unknowns,(segment,state)) 
     
+    # The gradients, all from the same difference pass
+    d_obj     = lambda unknowns:get_gradients(unknowns,(segment,state))[0]
+    d_econ    = lambda unknowns:get_gradients(unknowns,(segment,state))[1]
+    d_iecon   = lambda unknowns:get_gradients(unknowns,(segment,state))[2]
+    
     # Setup the bnds of the problem
     bnds = make_bnds(unknowns, (segment,state))
     
     # Solve the problem, based on chosen algorithm
     if segment.algorithm == 'SLSQP':
-        unknowns = opt.fmin_slsqp(obj,unknowns,f_eqcons=econ,f_ieqcons=iecon,bounds=bnds,iter=2000)
+        unknowns = opt.fmin_slsqp(obj,unknowns,f_eqcons=econ,f_ieqcons=iecon,bounds=bnds,iter=2000,
+                                  fprime=d_obj,fprime_eqcons=d_econ,fprime_ieqcons=d_iecon)
         
     elif segment.algorithm == 'SNOPT':
         
@@ -88,6 +120,15 @@ def converge_opt(segment,state):
     
         print outputs
         print opt_prob.solution(0)
+        
+        unknowns = np.array(outputs[1],dtype=float)
+
+    # leave the unknowns at the solution, the last evaluation may have been a gradient step,
+    # the iterate process of the segment runs next
+    state.unknowns.unpack_array(unknowns)
+        
+    state.pop('_optimization_memo',None)
+    counters.total_time = time.time() - start_time
 
     return
     
@@ -113,15 +154,7 @@ def get_objective(unknowns,(segment,state)):
                                 
     """      
     
-    if isinstance(unknowns,array_type):
-        state.unknowns.unpack_array(unknowns)
-    else:
-        state.unknowns = unknowns
-        
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
-        
-    objective = state.objective_value
+    objective, econstraints, ieconstraints = evaluate_point(unknowns,(segment,state))
     
     return objective
 
@@ -143,15 +176,7 @@ def get_econstraints(unknowns,(segment,state)):
                                 
     """       
     
-    if isinstance(unknowns,array_type):
-        state.unknowns.unpack_array(unknowns)
-    else:
-        state.unknowns = unknowns
-        
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
-
-    constraints = state.constraint_values
+    objective, constraints, ieconstraints = evaluate_point(unknowns,(segment,state))
     
     return constraints
 
@@ -214,26 +239,7 @@ def get_ieconstraints(unknowns,(segment,state)):
                                 
     """      
     
-    if isinstance(unknowns,array_type):
-        state.unknowns.unpack_array(unknowns)
-    else:
-        state.unknowns = unknowns
-        
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
-    
-    # Time goes forward, not backward
-    t_final = state.conditions.frames.inertial.time[-1,0]
-    time_con = (state.conditions.frames.inertial.time[1:,0] - state.conditions.frames.inertial.time[0:-1,0])/t_final
-    
-    # Less than a specified CL limit
-    CL_limit = segment.CL_limit 
-    CL_con = (CL_limit  - state.conditions.aerodynamics.lift_coefficient[:,0])/CL_limit
-    
-    # Altitudes are greater than 0
-    alt_con = state.conditions.freestream.altitude[:,0]/segment.altitude_end
-    
-    constraints = np.concatenate((time_con,CL_con,alt_con))
+    objective, econstraints, constraints = evaluate_point(unknowns,(segment,state))
     
     return constraints
 
@@ -259,32 +265,186 @@ def get_problem_pyopt(unknowns,(segment,state)):
                                 
     """       
     
-    if isinstance(unknowns,array_type):
-        state.unknowns.unpack_array(unknowns)
-    else:
+    obj, econstraints, ieconstraints = evaluate_point(unknowns,(segment,state))
+    
+    # Put the equality and inequality constraints together
+    constraints = np.concatenate((econstraints,ieconstraints))
+    
+    const = constraints.tolist()
+    fail  = np.array(np.isnan(obj.tolist()) or np.isnan(np.array(const).any())).astype(int)    
+    
+    return obj,const,fail
+
+## @ingroup Methods-Missions-Segments
+def evaluate_point(unknowns,(segment,state)):
+    """ Returns the objective and the constraints at a point, running the segment only if the
+        point is not one of the recent points of the solve
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        unknowns            [array or Data]
+        state._optimization_memo [Cache]
+    
+        Outputs:
+        objective           [float]
+        econstraints        [array]
+        ieconstraints       [array]
+
+        Properties Used:
+        N/A
+                                
+    """
+    
+    if not isinstance(unknowns,array_type):
         state.unknowns = unknowns
+        unknowns = unknowns.pack_array()
+    
+    memo = state.get('_optimization_memo',None)
+    if memo is None:
+        return run_point(unknowns,segment,state)
+    
+    key = hash_data(unknowns)
+    found, outputs = memo.lookup(key)
+    if found:
+        state.numerics.optimization.memo_hits += 1
+        return outputs
+    
+    outputs = run_point(unknowns,segment,state)
+    memo.store(key,outputs)
+    
+    return outputs
+
+## @ingroup Methods-Missions-Segments
+def run_point(unknowns,segment,state):
+    """ Runs the segment at a point and collects the objective and the constraints
+    
+        Assumptions:
+        N/A
         
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
+        Inputs:
+        unknowns            [array]
+    
+        Outputs:
+        objective           [float]
+        econstraints        [array]
+        ieconstraints       [array]
+
+        Properties Used:
+        N/A
+                                
+    """
+    
+    start_time = time.time()
+    
+    state.unknowns.unpack_array(unknowns)
+    segment.process.iterate(segment,state)
+    
+    objective     = state.objective_value
+    econstraints  = np.array(state.constraint_values,dtype=float)
+    ieconstraints = inequality_constraints(segment,state)
+    
+    counters = state.numerics.get('optimization',None)
+    if counters is not None:
+        counters.iterations   += 1
+        counters.iterate_time += time.time() - start_time
+    
+    return objective, econstraints, ieconstraints
+
+## @ingroup Methods-Missions-Segments
+def inequality_constraints(segment,state):
+    """ Finds the inequality constraints from the current conditions of the segment
+    
+        Assumptions:
+        Time only goes forward
+        CL is less than a specified limit
+        All altitudes are greater than zero
         
-    obj      = state.objective_value
+        Inputs:
+        state.conditions    [Data]
+            
+        Outputs:
+        constraints          [array]
+
+        Properties Used:
+        N/A
+                                
+    """
     
     # Time goes forward, not backward
-    t_final  = state.conditions.frames.inertial.time[-1,0]
+    t_final = state.conditions.frames.inertial.time[-1,0]
     time_con = (state.conditions.frames.inertial.time[1:,0] - state.conditions.frames.inertial.time[0:-1,0])/t_final
     
     # Less than a specified CL limit
     CL_limit = segment.CL_limit 
-    CL_con   = (CL_limit  - state.conditions.aerodynamics.lift_coefficient[:,0])/CL_limit
+    CL_con = (CL_limit  - state.conditions.aerodynamics.lift_coefficient[:,0])/CL_limit
     
     # Altitudes are greater than 0
     alt_con = state.conditions.freestream.altitude[:,0]/segment.altitude_end
     
-    # Put the equality and inequality constraints together
-    constraints = np.concatenate((state.constraint_values,time_con,CL_con,alt_con))
+    constraints = np.concatenate((time_con,CL_con,alt_con))
     
-    obj   = state.objective_value
-    const = constraints.tolist()
-    fail  = np.array(np.isnan(obj.tolist()) or np.isnan(np.array(const).any())).astype(int)    
+    return constraints
+
+## @ingroup Methods-Missions-Segments
+def get_gradients(unknowns,(segment,state)):
+    """ Finds the gradients of the objective and of all the constraints with forward differences.
+        Each step runs the segment once for all the outputs, the result is kept for the point so
+        the optimizer can ask for each gradient separately.
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        unknowns            [array]
+            
+        Outputs:
+        d_objective         [array, unknowns]
+        d_econstraints      [array, econstraints x unknowns]
+        d_ieconstraints     [array, ieconstraints x unknowns]
+
+        Properties Used:
+        N/A
+                                
+    """
+    
+    x0  = np.array(unknowns,dtype=float)
+    key = hash_data('gradients',x0)
+    
+    memo = state.get('_optimization_memo',None)
+    if memo is not None:
+        found, gradients = memo.lookup(key)
+        if found:
+            state.numerics.optimization.memo_hits += 1
+            return gradients
+    
+    start_time = time.time()
+    
+    obj0, econ0, iecon0 = evaluate_point(x0,(segment,state))
+    
+    steps = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x0),1.)
+    
+    n_x             = len(x0)
+    d_objective     = np.zeros(n_x)
+    d_econstraints  = np.zeros([len(econ0),n_x])
+    d_ieconstraints = np.zeros([len(iecon0),n_x])
+    
+    # the steps are not kept, they are not asked for again
+    for ii in xrange(n_x):
+        x = x0.copy()
+        x[ii] = x[ii] + steps[ii]
+        obj, econ, iecon = run_point(x,segment,state)
+        d_objective[ii]       = (obj   - obj0)  / steps[ii]
+        d_econstraints[:,ii]  = (econ  - econ0) / steps[ii]
+        d_ieconstraints[:,ii] = (iecon - iecon0)/ steps[ii]
+        
+    gradients = (d_objective, d_econstraints, d_ieconstraints)
+    
+    if memo is not None:
+        memo.store(key,gradients)
+        counters = state.numerics.optimization
+        counters.gradients     += 1
+        counters.gradient_time += time.time() - start_time
     
-    return obj,const,fail
\ No newline at end of file
+    return gradients
\ No newline at end of file
@@ -0,0 +1,198 @@
+## @ingroup Methods-Missions-Segments
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+
+# ----------------------------------------------------------------------
+#  Set Warm Start
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def set_warm_start(segment,state):
+    """Stores the converged unknowns of a solved segment, and of each of its sub segments, in the
+    segment state. Every later evaluation then starts from them instead of the default guesses,
+    see seed_unknowns.
+
+    Assumptions:
+    The state is the result of an evaluation of this segment
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                               [Data]
+    state.numerics.dimensionless.control_points  [Unitless]
+    state.segments                               [Data]
+
+    Outputs:
+    segment.state.warm_start                     [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    sub_states = state.get('segments',{})
+
+    # the unknowns of this level, the ones of the sub segments are stored with them
+    warm_start = Data()
+    warm_start.unknowns = Data()
+    for key,value in state.unknowns.items():
+        if not key in sub_states:
+            warm_start.unknowns[key] = deepcopy(value)
+
+    warm_start.control_points = None
+    if 'numerics' in state and np.size(state.numerics.dimensionless.control_points):
+        warm_start.control_points = np.array(state.numerics.dimensionless.control_points[:,0])
+
+    segment.state.warm_start = warm_start
+
+    for tag,sub_segment in segment.get('segments',{}).items():
+        if tag in sub_states:
+            set_warm_start(sub_segment,sub_states[tag]) # recursion!
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def clear_warm_start(segment):
+    """Removes the warm start of a segment and of its sub segments, so that the next evaluation
+    starts from the default guesses again.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state.warm_start                     [Data]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    segment.state.pop('warm_start',None)
+
+    for tag,sub_segment in segment.get('segments',{}).items():
+        clear_warm_start(sub_segment) # recursion!
+
+    return
+
+# ----------------------------------------------------------------------
+#  Seed Unknowns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def seed_unknowns(state):
+    """Replaces the initial unknowns of a state and of its sub segment states with their warm
+    starts. Unknowns with a different number of rows, as when the number of control points
+    changed, are interpolated in dimensionless time. Unknowns without a match keep their guess.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.warm_start                             [Data]
+    state.unknowns                               [Data]
+    state.numerics.dimensionless.control_points  [Unitless]
+
+    Outputs:
+    state.unknowns                               [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    sub_states = state.get('segments',{})
+
+    warm_start = state.get('warm_start',None)
+    if warm_start is not None:
+
+        x_new = None
+        if 'numerics' in state and np.size(state.numerics.dimensionless.control_points):
+            x_new = state.numerics.dimensionless.control_points[:,0]
+
+        for key,value in state.unknowns.items():
+            if key in sub_states or not key in warm_start.unknowns:
+                continue
+            state.unknowns[key] = rescale_unknown(warm_start.unknowns[key],value,warm_start.control_points,x_new)
+
+    for tag,sub_state in sub_states.items():
+        seed_unknowns(sub_state) # recursion!
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def rescale_unknown(old,guess,x_old,x_new):
+    """Fits a stored unknown to the size of the current guess. Values that are not numbers or
+    arrays, such as tags, keep their guess.
+
+    Assumptions:
+    Rows that do not match the control points are spread evenly in dimensionless time
+
+    Source:
+    N/A
+
+    Inputs:
+    old                                          [array or float] stored unknown
+    guess                                        [array or float] current guess
+    x_old, x_new                                 [Unitless] dimensionless control points, or None
+
+    Outputs:
+    value                                        [array or float]
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(old,dict) and isinstance(guess,dict):
+        for key,value in guess.items():
+            if key in old:
+                guess[key] = rescale_unknown(old[key],value,x_old,x_new) # recursion!
+        return guess
+
+    numbers = (int,float,np.number,array_type)
+    if not isinstance(old,numbers) or not isinstance(guess,numbers):
+        # tags and other values are kept
+        return guess
+
+    if not isinstance(guess,array_type):
+        if np.size(old) == 1:
+            return old * 1.
+        return guess
+
+    old = np.array(old,dtype=float)
+    if old.shape == guess.shape:
+        return old
+
+    if old.ndim != 2 or guess.ndim != 2 or old.shape[1] != guess.shape[1]:
+        return guess
+
+    # interpolate each column in dimensionless time
+    n_old = old.shape[0]
+    n_new = guess.shape[0]
+    if x_old is None or len(x_old) != n_old or x_new is None or len(x_new) != n_new:
+        x_old = np.linspace(0.,1.,n_old)
+        x_new = np.linspace(0.,1.,n_new)
+
+    value = np.zeros_like(guess,dtype=float)
+    for j in xrange(old.shape[1]):
+        value[:,j] = np.interp(x_new,x_old,old[:,j])
+
+    return value
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -26,6 +27,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import senel_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import interpolate_observers
 
 import numpy as np
 
@@ -79,8 +81,12 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
                 SPL_main_landing_gear            - Sound Pressure Level og the main landing gear
                 SPL_nose_landing_gear            - Sound Pressure Level of the nose landing gear
 
+                noise_segment.dist, theta and phi may have one column per microphone of an observer
+                grid. EPNL and SENEL then have one value per microphone and the SPL history is
+                [time steps x microphones x 24 bands]
+
             Assumptions:
-                Correlation based."""
+                Correlation based. The output files are only written for a single microphone."""
 
 
     # ==============================================
@@ -111,7 +117,6 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     time           =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
 
     noise_time = np.arange(0.,time[-1],.5)  
-    altitude = np.interp(noise_time,time,altitude)
 
     # determining flap slot number
     if wing.main_wing.flaps.type   == 'single_slotted':
@@ -121,44 +126,34 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     elif wing.main_wing.flaps.type == 'triple_slotted':
         slots = 3    
 
-    # Geometric information from the source to observer position
-    distance_vector = noise_segment.dist    
-    angle = noise_segment.theta 
-    phi   = noise_segment.phi
+    # Geometric information from the source to observer position, with an observer grid each 
+    # time step is repeated for every microphone
+    distance_vector, n_mics = interpolate_observers(noise_time,time,noise_segment.dist)
+    angle, n_mics           = interpolate_observers(noise_time,time,noise_segment.theta)
+    phi, n_mics             = interpolate_observers(noise_time,time,noise_segment.phi)
     
-    distance_vector = np.interp(noise_time,time,distance_vector)
-    angle = np.interp(noise_time,time,angle)
-    phi   = np.interp(noise_time,time,phi)
+    altitude = np.repeat(np.interp(noise_time,time,altitude),n_mics)
         
     # Number of points on the discretize segment   
     nsteps=len(noise_time)
     
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
-    
     # ==============================================
     #         Computing atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
-        
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
-        
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    
+    #unpack    
+    sound_speed =    atmo_data.speed_of_sound[:,0]
+    density     =    atmo_data.density[:,0]
+    viscosity   =    atmo_data.dynamic_viscosity[:,0]*10.7639 #units converstion - m2 to ft2
+    temperature =    atmo_data.temperature[:,0]
     
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
+
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
     
 
     #Units conversion - knots to ft/s
@@ -188,56 +183,63 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     SPLt_dBA_history = np.zeros((nrange,24))  
     SPLt_dBA_max = np.zeros(nrange)    
     
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(0,nrange-1):
-        #Emission angle theta   
-        theta = angle[i] 
-        #Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
-       
-         #Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
-
-        #Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
- 
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
- 
-        if (deltaf==0):
-            SPL_flap = np.zeros(24)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
- 
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(24)
-            SPL_nose_landing_gear = np.zeros(24)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: #Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
- 
- 
-         #Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear)) - delta_atmo
-            
-        SPL_total_history[i][:] = SPL_total[:]
-        SPL_wing_history[i][:]  = SPL_wing[:]
-        SPLvt_history[i][:]     = SPLvt[:]
-        SPLht_history[i][:]     = SPLht[:]
-        SPL_flap_history[i][:]  = SPL_flap[:]
-        SPL_slat_history[i][:]  = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:]
-        
+    # All the positions of the aircraft are computed together, the last position is not computed.
+    # Quantities of each position are columns that broadcast against the frequency bands.
+    n = (nsteps-1)*n_mics
+    
+    #Emission angle theta   
+    theta = angle[0:n,None]
+    #Distance from airplane to observer, evaluated at retarded time
+    distance = distance_vector[0:n,None]
+    
+    phi_n       = phi[0:n,None]
+    M_n         = M[0:n,None]
+    deltaw_n    = deltaw[0:n,None]
+    viscosity_n = viscosity[0:n,None]
+   
+     #Atmospheric attenuation
+    delta_atmo=atmospheric_attenuation(distance)
+
+    #Call each noise source model
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw_n,velocity,viscosity_n,M_n,phi_n,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw_n,velocity,viscosity_n,M_n,phi_n,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw_n,velocity,viscosity_n,M_n,phi_n,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw_n,viscosity_n,M_n,phi_n,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (deltaf==0):
+        SPL_flap = np.zeros((n,24))
+    else:
+        SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M_n,phi_n,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if gear=='up': #0
+        SPL_main_landing_gear = np.zeros((n,24))
+        SPL_nose_landing_gear = np.zeros((n,24))
+    else:
+        SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M_n,velocity,phi_n,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M_n,velocity,phi_n,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+
+
+     #Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear)) - delta_atmo
         
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)        
+    SPL_total_history[0:n] = SPL_total
+    SPL_wing_history[0:n]  = SPL_wing
+    SPLvt_history[0:n]     = SPLvt
+    SPLht_history[0:n]     = SPLht
+    SPL_flap_history[0:n]  = SPL_flap
+    SPL_slat_history[0:n]  = SPL_slat
+    SPL_nose_landing_gear_history[0:n] = SPL_nose_landing_gear
+    SPL_main_landing_gear_history[0:n] = SPL_main_landing_gear
+    
+    
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA = dbA_noise(SPL_total)
+    SPLt_dBA_history[0:n] = SPLt_dBA
+    SPLt_dBA_max[0:n] = np.max(SPLt_dBA,axis=1)
        
        
    #Calculation of dBA based on the sound pressure time history
@@ -274,6 +276,20 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     PNLT_slat = PNL_slat+tone_correction_slat
     PNLT_flap = PNL_flap+tone_correction_flap
     
+    if n_mics > 1:
+        # time histories with one column per microphone
+        PNLT_total = np.reshape(PNLT_total,(nsteps,n_mics))
+        PNLT_wing  = np.reshape(PNLT_wing,(nsteps,n_mics))
+        PNLT_ht    = np.reshape(PNLT_ht,(nsteps,n_mics))
+        PNLT_vt    = np.reshape(PNLT_vt,(nsteps,n_mics))
+        PNLT_nose_landing_gear = np.reshape(PNLT_nose_landing_gear,(nsteps,n_mics))
+        PNLT_main_landing_gear = np.reshape(PNLT_main_landing_gear,(nsteps,n_mics))
+        PNLT_slat = np.reshape(PNLT_slat,(nsteps,n_mics))
+        PNLT_flap = np.reshape(PNLT_flap,(nsteps,n_mics))
+        
+        SPLt_dBA_max      = np.reshape(SPLt_dBA_max,(nsteps,n_mics))
+        SPL_total_history = np.reshape(SPL_total_history,(nsteps,n_mics,24))
+    
     #Calculation of the EPNL for each component and total
     EPNL_total = epnl_noise(PNLT_total)
     EPNL_wing  = epnl_noise(PNLT_wing)
@@ -287,6 +303,10 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     #Calculation of the SENEL total
     SENEL_total = senel_noise(SPLt_dBA_max)
     
+    if ioprint and n_mics > 1:
+        print 'Warning: the airframe noise output files are not written for an observer grid'
+        ioprint = 0
+        
     if ioprint:
         # write header of file
         if not filename:            
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -49,9 +50,9 @@ def noise_landing_gear (D,H,wheels,M,velocity,phi,theta,distance,frequency):
     if (wheels==1 or wheels==2):
         G1 = 13+np.log10(4.5*((frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2)* \
             (12.5+((frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2))**-2.25)
-        G2 = (13+np.log10(2.0*(frequency*D/(velocity_fts*(1-M*np.math.cos(theta)))**2.0))* \
+        G2 = (13+np.log10(2.0*(frequency*D/(velocity_fts*(1-M*np.cos(theta)))**2.0))* \
             (30+(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**8)**-1*(0.34*H/D))* \
-            (np.math.sin(phi))**2
+            (np.sin(phi))**2
     elif wheels==4:
         G1 = 12+np.log10(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2 \
         *(0.4+(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2)**(-1.6)
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -42,7 +43,7 @@ def noise_leading_edge_slat (SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi,thet
     #Process
     SPLslat1   = SPL_wing+3.0
     SPLslat2   = noise_clean_wing(0.15*Sw,bw,1,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)
-    peakfactor = 3+max(SPL_wing)-max(SPLslat2)
+    peakfactor = 3+np.max(SPL_wing,axis=-1,keepdims=True)-np.max(SPLslat2,axis=-1,keepdims=True)
     SPLslat2   = SPLslat2+peakfactor
 
     SPL        = 10.*np.log10(10.0**(0.1*SPLslat1)+10.0**(0.1*SPLslat2))
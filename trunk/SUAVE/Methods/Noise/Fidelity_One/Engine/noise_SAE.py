@@ -4,6 +4,7 @@
 # Created:  May 2015, C. Ilario
 # Modified: Nov 2015, C. Ilario
 #           Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -29,6 +30,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import senel_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import interpolate_observers
 
 # ----------------------------------------------------------------------        
 #   Noise SAE
@@ -66,6 +68,9 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                         distance_microphone        - Distance from the nozzle exhaust to the microphones
                         angles                     - Array containing the desired polar angles
 
+                    noise_segment.dist, theta and phi may have one column per microphone of an
+                    observer grid, in which case all the microphones are computed together
+
 
                     airport   - SUAVE type airport data, with followig fields:
                         atmosphere                  - Airport atmosphere (SUAVE type)
@@ -79,8 +84,11 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                     SPL_m                           - Sound Pressure Level of the mixed jet
                     SPL_total                       - Sound Pressure Level of the total jet noise
 
+                With an observer grid, EPNL and SENEL have one value per microphone and the
+                SPL history is [time steps x microphones x 24 bands]
+
                 Assumptions:
-                    ."""
+                    The output file is only written for a single microphone."""
 
 
     #unpack
@@ -111,49 +119,37 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
     
     noise_time = np.arange(0.,time[-1],.5)
     
-    Temperature_primary   = np.interp(noise_time,time,Temperature_primary)
-    Pressure_primary      = np.interp(noise_time,time,Pressure_primary)
-    Temperature_secondary = np.interp(noise_time,time,Temperature_secondary)
-    Pressure_secondary    = np.interp(noise_time,time,Pressure_secondary)
-    Altitude              = np.interp(noise_time,time,Altitude)
-    
     # Calls the function noise_geometric to calculate all the distance and emission angles
    # geometric = noise_counterplot(noise_segment,analyses,config) #noise_geometric(noise_segment,analyses,config)
     
-    #unpack
-    distance_microphone = noise_segment.dist #geometric[:][0]    
-    angles              = noise_segment.theta #geometric[:][1]
-    phi                 = noise_segment.phi #geometric[:][2]      
+    #unpack, with an observer grid each time step is repeated for every microphone
+    distance_microphone, n_mics = interpolate_observers(noise_time,time,noise_segment.dist)
+    angles, n_mics              = interpolate_observers(noise_time,time,noise_segment.theta)
+    phi, n_mics                 = interpolate_observers(noise_time,time,noise_segment.phi)
     
-    distance_microphone = np.interp(noise_time,time,distance_microphone)
-    angles = np.interp(noise_time,time,angles)
-    phi   = np.interp(noise_time,time,phi)    
+    Temperature_primary   = np.repeat(np.interp(noise_time,time,Temperature_primary),n_mics)
+    Pressure_primary      = np.repeat(np.interp(noise_time,time,Pressure_primary),n_mics)
+    Temperature_secondary = np.repeat(np.interp(noise_time,time,Temperature_secondary),n_mics)
+    Pressure_secondary    = np.repeat(np.interp(noise_time,time,Pressure_secondary),n_mics)
+    Altitude              = np.repeat(np.interp(noise_time,time,Altitude),n_mics)
     
     nsteps = len(noise_time)        
+    nrows  = nsteps*n_mics
     
-    #Preparing matrix for noise calculation
-    sound_ambient       = np.zeros(nsteps)
-    density_ambient     = np.zeros(nsteps)
-    viscosity           = np.zeros(nsteps)
-    temperature_ambient = np.zeros(nsteps)
-    pressure_amb        = np.zeros(nsteps)
-    Mach_aircraft       = np.zeros(nsteps)
-    
-    Velocity_primary = np.ones(nsteps)*Velocity_primary_1
-    Velocity_secondary = np.ones(nsteps)*Velocity_secondary_1
+    Velocity_primary = np.ones(nrows)*Velocity_primary_1
+    Velocity_secondary = np.ones(nrows)*Velocity_secondary_1
 
     # ==============================================
     # Computing atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(Altitude[id])        
+    atmo_data = analyses.atmosphere.compute_values(Altitude)
     
-        sound_ambient[id]       =   np.float(atmo_data.speed_of_sound)
-        density_ambient[id]     =   np.float(atmo_data.density)
-        viscosity[id]           =   np.float(atmo_data.dynamic_viscosity)
-        temperature_ambient[id] =   np.float(atmo_data.temperature)
-        pressure_amb[id]        =   np.float(atmo_data.pressure)
+    sound_ambient       =   atmo_data.speed_of_sound[:,0]
+    density_ambient     =   atmo_data.density[:,0]
+    viscosity           =   atmo_data.dynamic_viscosity[:,0]
+    temperature_ambient =   atmo_data.temperature[:,0]
+    pressure_amb        =   atmo_data.pressure[:,0]
     
     #Base parameters necessary input for the noise code
     pressure_isa = 101325 #[Pa]
@@ -173,235 +169,202 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
 
     """Starting the main program"""
 
-    #Arrays for the calculation of atmospheric attenuation
-    Acq = np.array((0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.9, 1.2, 1.5, 1.9, 2.5, 2.9, 3.6, 4.9, 6.8))
-    Acf = np.array((0, 0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.3, 1.8, 2.5, 3.0, 4.2, 6.1, 9.0))
-
     #Desired frequency range for noise evaluation
     frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
             2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
 
-
-#Defining each array before the main loop
-    B       = np.zeros(24)
-    theta_p = np.ones(24)*np.pi/2
-    theta_s = np.ones(24)*np.pi/2
-    theta_m = np.ones(24)*np.pi/2
-    EX_p    = np.zeros(24)
-    EX_s    = np.zeros(24)
-    EX_m    = np.zeros(24)
-    exc     = np.zeros(24)
-    SPL_p   = np.zeros(24)
-    SPL_s   = np.zeros(24)
-    SPL_m   = np.zeros(24)
-    PG_p    = np.zeros(24)
-    PG_s    = np.zeros(24)
-    PG_m    = np.zeros(24)
-    
-    dspl_attenuation_p = np.zeros(24)
-    dspl_attenuation_s = np.zeros(24)
-    dspl_attenuation_m = np.zeros(24)
-    
-    SPL_total_history     = np.zeros((nsteps,24))
-    SPL_primary_history   = np.zeros((nsteps,24))
-    SPL_secondary_history = np.zeros((nsteps,24))
-    SPL_mixed_history     = np.zeros((nsteps,24))
-    
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nsteps,24))  
-    SPLt_dBA_max = np.zeros(nsteps)     
-
     # Open output file to print the results
+    if ioprint and n_mics > 1:
+        print 'Warning: the engine noise output file is not written for an observer grid'
+        ioprint = 0
+        
     if ioprint:
         if not filename:
             filename = ('SAE_Noise_' + str(config.tag) + '.dat')
             
         fid      = open(filename,'w')
     
- #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for id in range(0,nsteps):
+    # All the positions of the aircraft are computed together. Quantities that only depend on the
+    # time step are arrays of nsteps (times the microphones), spectra are arrays of nsteps x 24
+    # frequency bands. With an observer grid, the rows of the microphones of a step are adjacent.
 
-        # Jet Flow Parameters
-    
-        #Primary and Secondary jets
-        Cpp = R_gas/(1-1/gama_primary)
-        Cp  = R_gas/(1-1/gama)
-        
-        density_primary   = Pressure_primary[id]/(R_gas*Temperature_primary[id]-(0.5*R_gas*Velocity_primary[id]**2/Cpp))
-        density_secondary = Pressure_secondary[id]/(R_gas*Temperature_secondary[id]-(0.5*R_gas*Velocity_secondary[id]**2/Cp))
-    
-        mass_flow_primary   = Area_primary*Velocity_primary[id]*density_primary
-        mass_flow_secondary = Area_secondary*Velocity_secondary[id]*density_secondary
-    
-        #Mach number of the external flow - based on the aircraft velocity
-        Mach_aircraft[id] = Velocity_aircraft/sound_ambient[id]
-    
-        #Calculation Procedure for the Mixed Jet Flow Parameters
-        Velocity_mixed = (mass_flow_primary*Velocity_primary[id]+mass_flow_secondary*Velocity_secondary[id])/ \
-                (mass_flow_primary+mass_flow_secondary)
-        Temperature_mixed =(mass_flow_primary*Temperature_primary[id]+mass_flow_secondary*Temperature_secondary[id])/ \
-                (mass_flow_primary+mass_flow_secondary)
-        density_mixed = pressure_amb[id]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
-        Area_mixed = Area_primary*density_primary*Velocity_primary[id]*(1+(mass_flow_secondary/mass_flow_primary))/ \
-                (density_mixed*Velocity_mixed)
-        Diameter_mixed = (4*Area_mixed/np.pi)**0.5
-    
-        #**********************************************
-        # START OF THE NOISE PROCEDURE CALCULATIONS
-        #**********************************************
-    
-        XBPR = mass_flow_secondary/mass_flow_primary - 5.5
-        if XBPR<0:
-                XBPR=0
-        elif XBPR>4:
-                XBPR=4
-    
-        #Auxiliary parameter defined as DVPS
-        DVPS = np.abs((Velocity_primary[id] - (Velocity_secondary[id]*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
-        if DVPS<0.3:
-            DVPS=0.3
-    
-        # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
-        Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
-        Str_s = frequency*Diameter_mixed/(Velocity_secondary[id]-Velocity_aircraft) #Secondary jet
-        Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
-    
-        #Calculation of the Excitation adjustment parameter
-        #Excitation Strouhal Number
-        excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
-        if (excitation_Strouhal > 0.25 and excitation_Strouhal < 0.5):
-            SX = 0.0
-        else:
-            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
-    
-        #Effectiveness
-        exps = np.exp(-SX)
-    
-        #Spectral Shape Factor
-        exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
-    
-        #Fan Duct Lenght Factor
-        exd = np.exp(0.6-(EXA)**0.5)
+    # Jet Flow Parameters
+
+    #Primary and Secondary jets
+    Cpp = R_gas/(1-1/gama_primary)
+    Cp  = R_gas/(1-1/gama)
     
-        #Excitation source location factor (zk)
-        zk = 1-0.4*(exd)*(exps)    
+    density_primary   = Pressure_primary/(R_gas*Temperature_primary-(0.5*R_gas*Velocity_primary**2/Cpp))
+    density_secondary = Pressure_secondary/(R_gas*Temperature_secondary-(0.5*R_gas*Velocity_secondary**2/Cp))
 
-        #Main loop for the desired polar angles
+    mass_flow_primary   = Area_primary*Velocity_primary*density_primary
+    mass_flow_secondary = Area_secondary*Velocity_secondary*density_secondary
 
-        theta = angles[id]
-    
-      #Call function noise source location for the calculation of theta
-        thetaj = noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone[id],Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary[id],Velocity_secondary[id],Velocity_mixed,Velocity_aircraft,sound_ambient[id],Str_m,Str_s)
-    
-      # Loop for the frequency array range
-        for i in range(0,24):
-               #Calculation of the Directivity Factor
-                if (theta_m[i] <=1.4):
-                    exc[i] = sound_ambient[id]/Velocity_mixed
-                elif (theta_m[i]>1.4):
-                    exc[i] =(sound_ambient[id]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m[i]-1.4))
-    
-                #Acoustic excitation adjustment (EX)
-                EX_m[i] = exd*exs[i]*exc[i]   #mixed component - dependant of the frequency
-        
-        EX_p = +5*exd*exps   #primary component - no frequency dependance
-        EX_s = 2*sound_ambient[id]/(Velocity_secondary[id]*(zk)) #secondary component - no frequency dependance    
-    
-        distance_primary   = distance_microphone[id] 
-        distance_secondary = distance_microphone[id] 
-        distance_mixed     = distance_microphone[id]
-    
-        #Noise attenuation due to Ambient Pressure
-        dspl_ambient_pressure = 20*np.log10(pressure_amb[id]/pressure_isa)
-    
-        #Noise attenuation due to Density Gradientes
-        dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[id]))
-        dspl_density_s = 20*np.log10((density_secondary+density_ambient[id])/(2*density_ambient[id]))
-        dspl_density_m = 20*np.log10((density_mixed+density_ambient[id])/(2*density_ambient[id]))
-    
-        #Noise attenuation due to Spherical divergence
-        dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
-        dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
-        dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
-    
-       #Noise attenuation due to Geometric Near-Field
-        if near_field ==0:
-                dspl_geometric_p = 0.0
-                dspl_geometric_s = 0.0
-                dspl_geometric_m = 0.0
-        elif near_field ==1:
-                dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient[id]/frequency))/distance_primary)
-                dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_secondary)
-                dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_mixed)
-    
-       #Noise attenuation due to Acoustic Near-Field
-        if near_field ==0:
-                dspl_acoustic_p = 0.0;
-                dspl_acoustic_s = 0.0;
-                dspl_acoustic_m = 0.0;
-        elif near_field ==1:
-                dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_primary*frequency))**2)
-                dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_secondary*frequency))**2)
-                dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_mixed*frequency))**2)
-    
-        #Atmospheric attenuation coefficient
-        if tunnel==0:
-                f_primary   = frequency/(1-Mach_aircraft[id]*np.cos(theta_p))
-                f_secondary = frequency/(1-Mach_aircraft[id]*np.cos(theta_s))
-                f_mixed     = frequency/(1-Mach_aircraft[id]*np.cos(theta_m))
-                Aci         = Acf + ((temperature_ambient[id]-0)-15)/10*(Acq-Acf)    
-                
-                Ac_primary   = np.interp(f_primary,frequency,Aci)
-                Ac_secondary = np.interp(f_secondary,frequency,Aci)
-                Ac_mixed     = np.interp(f_mixed,frequency,Aci)
-                
-                 #Atmospheric attenuation
-                delta_atmo = atmospheric_attenuation(distance_primary)
-                
-                dspl_attenuation_p = -delta_atmo 
-                dspl_attenuation_s = -delta_atmo 
-                dspl_attenuation_m = -delta_atmo 
-    
-        elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
-                dspl_attenuation_p = np.zeros(24)
-                dspl_attenuation_s = np.zeros(24)
-                dspl_attenuation_m = np.zeros(24)
-                EX_m = np.zeros(24)
-                EX_p = 0
-                EX_s = 0
-    
-       #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
-        DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
-        DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
-        DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
-    
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft = Velocity_aircraft/sound_ambient
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Velocity_primary+mass_flow_secondary*Velocity_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Temperature_primary+mass_flow_secondary*Temperature_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_amb/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Velocity_primary*(1+(mass_flow_secondary/mass_flow_primary))/ \
+            (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    #**********************************************
+    # START OF THE NOISE PROCEDURE CALCULATIONS
+    #**********************************************
+
+    XBPR = np.clip(mass_flow_secondary/mass_flow_primary - 5.5, 0., 4.)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_primary - (Velocity_secondary*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
+    DVPS[DVPS<0.3] = 0.3
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS[:,None])  #Primary jet
+    Str_s = frequency*Diameter_mixed[:,None]/(Velocity_secondary-Velocity_aircraft)[:,None] #Secondary jet
+    Str_m = frequency*Diameter_mixed[:,None]/(Velocity_mixed-Velocity_aircraft)[:,None] #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter
+    #Excitation Strouhal Number
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    SX = np.where((excitation_Strouhal > 0.25) & (excitation_Strouhal < 0.5), 0.0, \
+                  50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5))
+
+    #Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps[:,None]*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal[:,None]+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)    
+
+    #Call function noise source location for the calculation of theta. The source location of
+    #each step starts from the angles of the previous step, so this is the only loop over time.
+    B       = np.zeros((n_mics,24))
+    theta_j = [np.ones((n_mics,24))*np.pi/2 for k in xrange(3)]
+    theta_p = np.zeros((nrows,24))
+    theta_s = np.zeros((nrows,24))
+    theta_m = np.zeros((nrows,24))
+    
+    for id in xrange(nsteps):
+        rows = slice(id*n_mics,(id+1)*n_mics)
+        noise_source_location(B,Xo,zk[rows,None],Diameter_primary,theta_j[0],Area_primary,Area_secondary,distance_microphone[rows,None],Diameter_secondary,angles[rows,None],theta_j[1],theta_j[2],Diameter_mixed[rows,None],Velocity_primary[rows,None],Velocity_secondary[rows,None],Velocity_mixed[rows,None],Velocity_aircraft,sound_ambient[rows,None],Str_m[rows],Str_s[rows])
+        theta_p[rows] = theta_j[0]
+        theta_s[rows] = theta_j[1]
+        theta_m[rows] = theta_j[2]
+
+    #Calculation of the Directivity Factor
+    exc = np.where(theta_m <= 1.4, (sound_ambient/Velocity_mixed)[:,None], \
+                   (sound_ambient/Velocity_mixed)[:,None]*(1-(1.8/np.pi)*(theta_m-1.4)))
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   #mixed component - dependant of the frequency
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient/(Velocity_secondary*(zk)) #secondary component - no frequency dependance    
+
+    distance_primary   = distance_microphone 
+    distance_secondary = distance_microphone 
+    distance_mixed     = distance_microphone
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient)/(2*density_ambient))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient)/(2*density_ambient))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+
+    #Noise attenuation due to Geometric Near-Field
+    if near_field ==0:
+            dspl_geometric_p = 0.0
+            dspl_geometric_s = 0.0
+            dspl_geometric_m = 0.0
+    elif near_field ==1:
+            dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient[:,None]/frequency))/distance_primary[:,None])
+            dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed[:,None]+(Diameter_mixed[:,None]*sound_ambient[:,None]/frequency))/distance_secondary[:,None])
+            dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed[:,None]+(Diameter_mixed[:,None]*sound_ambient[:,None]/frequency))/distance_mixed[:,None])
+
+    #Noise attenuation due to Acoustic Near-Field
+    if near_field ==0:
+            dspl_acoustic_p = 0.0;
+            dspl_acoustic_s = 0.0;
+            dspl_acoustic_m = 0.0;
+    elif near_field ==1:
+            dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient[:,None]/(distance_primary[:,None]*frequency))**2)
+            dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient[:,None]/(distance_secondary[:,None]*frequency))**2)
+            dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient[:,None]/(distance_mixed[:,None]*frequency))**2)
+
+    #Atmospheric attenuation coefficient
+    if tunnel==0:
+             #Atmospheric attenuation
+            delta_atmo = atmospheric_attenuation(distance_primary[:,None])
+            
+            dspl_attenuation_p = -delta_atmo 
+            dspl_attenuation_s = -delta_atmo 
+            dspl_attenuation_m = -delta_atmo 
+
+    elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
+            dspl_attenuation_p = np.zeros((nrows,24))
+            dspl_attenuation_s = np.zeros((nrows,24))
+            dspl_attenuation_m = np.zeros((nrows,24))
+            EX_m = np.zeros((nrows,24))
+            EX_p = np.zeros(nrows)
+            EX_s = np.zeros(nrows)
+
+    #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = (dspl_ambient_pressure+dspl_density_p)[:,None]+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p[:,None]
+    DSPL_s = (dspl_ambient_pressure+dspl_density_s)[:,None]+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s[:,None]
+    DSPL_m = (dspl_ambient_pressure+dspl_density_m)[:,None]+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m[:,None]
+
+    #Step parameters as columns, to broadcast against the frequency bands
+    Velocity_primary_c   = Velocity_primary[:,None]
+    Velocity_secondary_c = Velocity_secondary[:,None]
+    Velocity_mixed_c     = Velocity_mixed[:,None]
+    Diameter_mixed_c     = Diameter_mixed[:,None]
+    sound_ambient_c      = sound_ambient[:,None]
+
+    #Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[:,None],theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed_c)
+    Plug    = external_plug_effect(Velocity_primary_c,Velocity_secondary_c, Velocity_mixed_c, Diameter_primary,Diameter_secondary,Diameter_mixed_c, Plug_diameter, sound_ambient_c, theta_p,theta_s,theta_m)
+    GPROX_m = ground_proximity_effect(Velocity_mixed_c,sound_ambient_c,theta_m,engine_height,Diameter_mixed_c,frequency)
+
+    #Calculation of the sound pressure level for each jet component
+    SPL_p = primary_noise_component(np.zeros((nrows,24)),Velocity_primary_c,Temperature_primary[:,None],R_gas,theta_p,DVPS[:,None],sound_ambient_c,Velocity_secondary_c,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p[:,None],Str_p) + Plug[0]
     
-      #Calculation of interference effects on jet noise
-        ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[id],theta_m)
-        INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
-        Plug    = external_plug_effect(Velocity_primary[id],Velocity_secondary[id], Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient[id], theta_p,theta_s,theta_m)
-        GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[id],theta_m,engine_height,Diameter_mixed,frequency)
+    #The last band of the primary jet is not computed by the component, it carries over the
+    #plug effect of the previous positions as in the original step by step calculation
+    SPL_p[:,23] = np.cumsum(np.reshape(Plug[0][:,23],(nsteps,n_mics)),axis=0).ravel()
     
-      #Calculation of the sound pressure level for each jet component
-        SPL_p = primary_noise_component(SPL_p,Velocity_primary[id],Temperature_primary[id],R_gas,theta_p,DVPS,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
-        
-        SPL_s = secondary_noise_component(SPL_s,Velocity_primary[id],theta_s,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
-        
-        SPL_m = mixed_noise_component(SPL_m,Velocity_primary[id],theta_m,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
+    SPL_s = secondary_noise_component(np.zeros((nrows,24)),Velocity_primary_c,theta_s,sound_ambient_c,Velocity_secondary_c,Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s[:,None],Str_s) + Plug[1] + INST_s
     
-     #Sum of the Total Noise
-        SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
-        
-     #Store the SPL history     
-        SPL_total_history[id][:]     = SPL_total[:]
-        SPL_primary_history[id][:]   = SPL_p[:]
-        SPL_secondary_history[id][:] = SPL_s[:]
-        SPL_mixed_history[id][:]     = SPL_m[:]
-        
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)          
+    SPL_m = mixed_noise_component(np.zeros((nrows,24)),Velocity_primary_c,theta_m,sound_ambient_c,Velocity_secondary_c,Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed_c,XBPR[:,None]) + Plug[2] + ATK_m + GPROX_m
+
+    #Sum of the Total Noise
+    SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+    
+    #Store the SPL history     
+    SPL_total_history     = SPL_total
+    SPL_primary_history   = SPL_p
+    SPL_secondary_history = SPL_s
+    SPL_mixed_history     = SPL_m
+    
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = dbA_noise(SPL_total_history)
+    SPLt_dBA_max     = np.max(SPLt_dBA_history,axis=1)
      
     #Calculation of the Perceived Noise Level EPNL based on the sound time history
     PNL_total               =  pnl_noise(SPL_total_history)    
@@ -421,6 +384,15 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
     PNLT_secondary = PNL_secondary+tone_correction_secondary
     PNLT_mixed     = PNL_mixed+tone_correction_mixed
     
+    if n_mics > 1:
+        # time histories with one column per microphone
+        PNLT_total            = np.reshape(PNLT_total,(nsteps,n_mics))
+        PNLT_primary          = np.reshape(PNLT_primary,(nsteps,n_mics))
+        PNLT_secondary        = np.reshape(PNLT_secondary,(nsteps,n_mics))
+        PNLT_mixed            = np.reshape(PNLT_mixed,(nsteps,n_mics))
+        SPLt_dBA_max          = np.reshape(SPLt_dBA_max,(nsteps,n_mics))
+        SPL_total_history     = np.reshape(SPL_total_history,(nsteps,n_mics,24))
+    
     #Calculation of the EPNL for each component and total
     EPNL_total     = epnl_noise(PNLT_total)
     EPNL_primary   = epnl_noise(PNLT_primary)
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -16,103 +17,71 @@ import numpy as np
 
 ## @ingroupMethods-Noise-Fidelity_One-Engine
 def noise_source_location (B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    
+    """This function calculates the source location angles of the three jet components. All the
+    frequency bands are iterated together, each band stops once its source location has converged.
+    B, theta_p, theta_s and theta_m are updated in place, so the previous angles are the initial
+    guess of the next call. The angles may have a leading axis of microphones, in which case the
+    observer inputs are columns with one row per microphone."""
+
+    # every input is spread over the shape of the angles, so the bands that are still iterating
+    # can be picked out of all of them
+    ones                = np.ones_like(theta_p)
+    zk                  = zk*ones
+    theta               = theta*ones
+    distance_microphone = distance_microphone*ones
+    Diameter_primary    = Diameter_primary*ones
+    Diameter_secondary  = Diameter_secondary*ones
+    Diameter_mixed      = Diameter_mixed*ones
+    Velocity_secondary  = Velocity_secondary*ones
+    Velocity_mixed      = Velocity_mixed*ones
+    sound_ambient       = sound_ambient*ones
+    Str_m               = Str_m*ones
+    Str_s               = Str_s*ones
+
+    #Source location of each jet component as a function of its angle, for the bands k
+    def primary_location(k,theta_j,diameter):
+        return (zk[k]*diameter[k])*(4.+4.*np.arctan((18.*theta_j/np.pi)-9.)+(Area_secondary/Area_primary))
+
+    def secondary_location(k,theta_j,diameter):
+        return (zk[k]*diameter[k])*(2.+1.6*np.arctan((4.5*theta_j/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[k]))* \
+            np.sqrt(1.+(0.7*Velocity_secondary[k]/sound_ambient[k]))*(Velocity_secondary[k]/(Velocity_secondary[k]-Velocity_aircraft))
+
+    def mixed_location(k,theta_j,diameter):
+        return (zk[k]*diameter[k])*(3.+np.exp(-Str_m[k])+(2.+1.1*np.arctan((18.*theta_j/np.pi)-13.))+ \
+            (1.+0.5/np.sqrt(Str_m[k])))*np.sqrt(0.5+0.5*Velocity_mixed[k]/sound_ambient[k]) * \
+            (Velocity_mixed[k]/(Velocity_mixed[k]-Velocity_aircraft))
+
+    def source_angle(k,XJ):
+        B_j   = (1./np.sin(theta[k]))*(((Xo+XJ)/distance_microphone[k])+np.cos(theta[k]))
+        angle = np.arcsin((B_j**2.+1.)**(-0.5))
+        return B_j, np.where(B_j>=0.,angle,np.pi-angle)
+
+    def converge_location(theta_j,location,first_diameter,diameter):
+        XJ                    = location(Ellipsis,theta_j,first_diameter)
+        B[...], theta_j[...]  = source_angle(Ellipsis,XJ)
+        XJ                    = location(Ellipsis,theta_j,diameter)
+
+        # every band is iterated at least once
+        residual = first_diameter.copy()
+        active   = residual>(diameter/200.)
+        while np.any(active):
+            XJ_old = XJ[active]
+            theta1 = theta_j[active]
+            B[active], theta2 = source_angle(active,XJ_old)
+            theta_j[active]   = (theta1+theta2)/2.
+            XJ[active]        = location(active,theta_j[active],diameter)
+            residual[active]  = np.abs(XJ_old-XJ[active])
+            active            = residual>(diameter/200.)
+
+        return theta_j
+
     #Primary jet source location
-    XJ = np.zeros(24)
-    
-    for i in xrange(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        #Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
-            *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
-
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
-            (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-            *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
-
-    return(theta_p,theta_s,theta_m)
\ No newline at end of file
+    converge_location(theta_p,primary_location,Diameter_primary,Diameter_primary)
+
+    #Secondary jet source location, the first estimate uses the secondary diameter
+    converge_location(theta_s,secondary_location,Diameter_secondary,Diameter_mixed)
+
+    #Mixed jet source location
+    converge_location(theta_m,mixed_location,Diameter_mixed,Diameter_mixed)
+
+    return(theta_p,theta_s,theta_m)
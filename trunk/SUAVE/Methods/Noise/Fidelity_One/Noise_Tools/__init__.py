@@ -10,5 +10,5 @@ from noise_tone_correction import noise_tone_correction
 from dbA_noise import dbA_noise
 from noise_geometric import noise_geometric
 from noise_certification_limits import noise_certification_limits
-from noise_counterplot import noise_counterplot
+from noise_counterplot import noise_counterplot, interpolate_observers
 from senel_noise import senel_noise
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -23,8 +24,12 @@ def epnl_noise(PNLT):
                     PNLT                     - Perceived Noise Level with Tone Correction
 
                 Outputs: 
-                    EPNL                     - Effective Perceived Noise Level in EPNdB"""
+                    EPNL                     - Effective Perceived Noise Level in EPNdB
+
+                A 2D input holds one time history per column, e.g. per microphone of an observer grid."""
                     
+    if np.ndim(PNLT) == 2:
+        return np.array([ epnl_noise(column) for column in np.transpose(PNLT) ])
                     
     #Maximum PNLT on the time history data    
     PNLT_max = np.max(PNLT)
@@ -2,7 +2,7 @@
 # noise_counterplot.py
 # 
 # Created:  Feb 2016, C. Ilario
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -14,7 +14,7 @@ import numpy as np
 # ----------------------------------------------------------------------
 
 ## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
-def noise_counterplot(noise_segment,analyses,config):
+def noise_counterplot(noise_segment,analyses,config,mic_position=None):
     """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_counterplot(noise_segment,analyses,config):
             Computes the geometric parameters for the noise tools at any microphone potsition, not only the certification points:
             distance and emission angles for both polar and azimuthal angles.
@@ -23,46 +23,44 @@ def noise_counterplot(noise_segment,analyses,config):
                 noise_segment	 - SUAVE type vehicle
                 analyses
                 config
+                mic_position    - Microphone coordinates, [3] or [microphones x 3], optional [meters]
 
             Outputs:
                 dist            - Distance vector from the aircraft position in relation to the microphone coordinates, [meters]
                 theta           - Polar angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
                 phi             - Azimuthal angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
 
+                With several microphones the outputs are [time steps x microphones]
+
             Assumptions:
-                None."""
+                The microphones default to analyses.mic_array."""
     
     #unpack
     position_vector = noise_segment.conditions.frames.inertial.position_vector
-    mic_position = analyses.mic_array
-    
-    #X,Y,Z position of the aircraft
-    x_aircraft = position_vector[:,0]
-    altitude   = - position_vector[:,2]
-    z_aircraft = position_vector[:,1]
-    
-
-    n_steps = len(altitude)  #number of time steps (space discretization)
+    if mic_position is None:
+        mic_position = analyses.mic_array
     
-    # Preparing the matrix: Angles
-    phi = np.zeros(n_steps)
-    theta = np.zeros(n_steps)  
+    #X,Y,Z position of the aircraft, as columns
+    x_aircraft = position_vector[:,0,None]
+    altitude   = - position_vector[:,2,None]
+    z_aircraft = position_vector[:,1,None]
     
-   
     #X,Y,Z position of each microphone
-    x_mic = np.float(mic_position[0])
-    y_mic = np.float(mic_position[1])
-    z_mic = np.float(mic_position[2])
+    mic_array = np.reshape(np.array(mic_position,dtype=float),(-1,3))
+    x_mic = mic_array[:,0]
+    y_mic = mic_array[:,1]
+    z_mic = mic_array[:,2]
 
-    dist = np.sqrt((x_aircraft-x_mic)**2+(altitude-y_mic)**2+(z_aircraft-z_mic)**2)
+    dist  = np.sqrt((x_aircraft-x_mic)**2+(altitude-y_mic)**2+(z_aircraft-z_mic)**2)
     phi   = np.arctan(np.abs(z_mic)/altitude)
-
-    for i in range (0,n_steps):
-        if (x_aircraft[i]-x_mic)< 0.:
-            theta[i] = np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
-        else:
-            theta[i] = np.pi - np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
-            
+    theta = np.arctan(np.abs(altitude/(x_aircraft-x_mic)))
+    theta = np.where((x_aircraft-x_mic)< 0., theta, np.pi - theta)
+    
+    # a single microphone keeps the time history vectors
+    if np.size(mic_position) == 3:
+        dist  = dist[:,0]
+        theta = theta[:,0]
+        phi   = phi[:,0]
                 
     #Pack the results
     noise_segment.dist  = dist
@@ -72,6 +70,30 @@ def noise_counterplot(noise_segment,analyses,config):
 
     return (dist,theta,phi)
 
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+def interpolate_observers(noise_time,time,values):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.interpolate_observers(noise_time,time,values):
+            Interpolates the geometric parameters of one or several microphones at the noise time steps.
+
+            Inputs:
+                noise_time      - Time steps of the noise calculation, [s]
+                time            - Time of the segment, [s]
+                values          - Geometric parameter, [time] or [time x microphones]
+
+            Outputs:
+                values          - Interpolated values, with the microphones of each time step adjacent
+                n_mics          - Number of microphones
+
+            Assumptions:
+                None."""
+    
+    values = np.reshape(values,(len(time),-1))
+    n_mics = values.shape[1]
+    
+    values = np.array([ np.interp(noise_time,time,column) for column in values.T ]).T
+    
+    return values.ravel(), n_mics
+
 
 #if __name__ == '__main__':
         #main()
@@ -2,6 +2,7 @@
 # senel_noise.py
 # 
 # Created:  Jul 2015, C. Ilario
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -22,8 +23,12 @@ def senel_noise(SPLt_dBA_max):
                     PNLT                     - Perceived Noise Level with Tone Correction
 
                 Outputs: 
-                    EPNL                     - Effective Perceived Noise Level in EPNdB"""
+                    EPNL                     - Effective Perceived Noise Level in EPNdB
+
+                A 2D input holds one time history per column, e.g. per microphone of an observer grid."""
                     
+    if np.ndim(SPLt_dBA_max) == 2:
+        return np.array([ senel_noise(column) for column in np.transpose(SPLt_dBA_max) ])
                     
     #Maximum PNLT on the time history data    
     dBA_max = np.max(SPLt_dBA_max)
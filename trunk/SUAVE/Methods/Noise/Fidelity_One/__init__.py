@@ -4,4 +4,6 @@
 
 import Airframe
 import Engine
-import Noise_Tools
\ No newline at end of file
+import Noise_Tools
+
+from noise_footprint import noise_footprint
\ No newline at end of file
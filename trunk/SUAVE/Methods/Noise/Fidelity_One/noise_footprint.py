@@ -0,0 +1,79 @@
+## @ingroup Methods-Noise-Fidelity_One
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+from Airframe import noise_airframe_Fink
+from Engine import noise_SAE
+from Noise_Tools import noise_counterplot
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Noise Footprint
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Noise-Fidelity_One
+def noise_footprint(config,analyses,noise_segment,mic_grid,engine_flag=1):
+    """ SUAVE.Methods.Noise.Fidelity_One.noise_footprint(config,analyses,noise_segment,mic_grid):
+            Computes the EPNL and SENEL maps of a segment over a grid of microphones. The geometry, the
+            airframe noise and the engine noise of all the microphones are computed in a single run.
+
+            Inputs:
+                config                           - SUAVE type vehicle, with a 'turbofan' propulsor
+                analyses
+                noise_segment                    - Segment results
+                mic_grid                         - Microphone coordinates (x, altitude, lateral), [... x 3] [meters]
+                engine_flag                      - 0 to exclude the engine noise, e.g. for approach
+
+            Outputs:
+                footprint.x                      - Longitudinal coordinate of the microphones [meters]
+                footprint.y                      - Lateral coordinate of the microphones [meters]
+                footprint.EPNL                   - Effective perceived noise level [EPNdB]
+                footprint.SENEL                  - Single event noise exposure level [dBA]
+                footprint.airframe.EPNL, SENEL   - Airframe noise components
+                footprint.engine.EPNL, SENEL     - Engine noise components
+
+                Every map has the shape of mic_grid without its last axis.
+
+            Assumptions:
+                Same as noise_counterplot, noise_airframe_Fink and noise_SAE."""
+
+    #unpack
+    turbofan  = config.propulsors['turbofan']
+
+    mic_grid  = np.array(mic_grid,dtype=float)
+    shape     = mic_grid.shape[:-1]
+    mic_array = np.reshape(mic_grid,(-1,3))
+
+    # Distance and emission angles of all the microphones
+    noise_counterplot(noise_segment,analyses,config,mic_array)
+
+    # The noise time history of every microphone
+    airframe_noise = noise_airframe_Fink(config,analyses,noise_segment)
+    engine_noise   = noise_SAE(turbofan,noise_segment,config,analyses)
+
+    # Maps on the grid
+    footprint = Data()
+    footprint.x = mic_grid[...,0]
+    footprint.y = mic_grid[...,2]
+
+    footprint.airframe = Data()
+    footprint.airframe.EPNL  = np.reshape(airframe_noise[0],shape)
+    footprint.airframe.SENEL = np.reshape(airframe_noise[2],shape)
+
+    footprint.engine = Data()
+    footprint.engine.EPNL  = np.reshape(engine_noise[0],shape)
+    footprint.engine.SENEL = np.reshape(engine_noise[2],shape)
+
+    footprint.EPNL  = 10. * np.log10(10**(footprint.airframe.EPNL/10)  + (engine_flag)*10**(footprint.engine.EPNL/10))
+    footprint.SENEL = 10. * np.log10(10**(footprint.airframe.SENEL/10) + (engine_flag)*10**(footprint.engine.SENEL/10))
+
+    return footprint
@@ -3,6 +3,7 @@
 #
 # Created:  Apr 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,7 @@
 
 from SUAVE.Core import Units
 import time
+import multiprocessing
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -17,11 +19,13 @@ import numpy as np
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Performance
-def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
+def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.,number_of_workers=1,intermediate_points=0):
     """Calculates a vehicle's payload range diagram. Includes plotting.
 
     Assumptions:
     Constant altitude cruise
+    Each point starts from the converged mission of the previous one
+    The mission is left with the takeoff weight and cruise distance of the last point
 
     Source:
     N/A
@@ -37,6 +41,9 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     mission.segments[0].analyses.weights.
       vehicle.mass_properties.takeoff     [kg]
     cruise_segment_tag                    <string>
+    reserves                              [kg]
+    number_of_workers                     [Unitless] processes that evaluate the points concurrently
+    intermediate_points                   [Unitless] added points on each leg of the diagram
 
     Outputs:
     payload_range.
@@ -100,70 +107,67 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     FUEL    = [ min(TOW[1] - OEW - MaxPLD,MaxFuel) , MaxFuel                , MaxFuel       ]
     PLD     = [ MaxPLD                             , MTOW - MaxFuel - OEW   , 0.            ]
 
-    # allocating Range array
-    R       = [0,0,0]
+    # Intermediate points along each leg of the diagram, before each corner point
+    if intermediate_points:
+        n = intermediate_points
+        TOW_legs  = []
+        FUEL_legs = []
+        PLD_legs  = []
+        for k in range(1,n+1):
+            # max payload, from the reserves to the first corner
+            fuel = reserves + (FUEL[0] - reserves) * k / (n + 1.)
+            TOW_legs.append(OEW + MaxPLD + fuel)
+            FUEL_legs.append(fuel)
+            PLD_legs.append(MaxPLD)
+        TOW_legs.append(TOW[0]); FUEL_legs.append(FUEL[0]); PLD_legs.append(PLD[0])
+        for k in range(1,n+1):
+            # max takeoff weight, trading payload for fuel
+            fuel = FUEL[0] + (FUEL[1] - FUEL[0]) * k / (n + 1.)
+            TOW_legs.append(MTOW)
+            FUEL_legs.append(fuel)
+            PLD_legs.append(MTOW - OEW - fuel)
+        TOW_legs.append(TOW[1]); FUEL_legs.append(FUEL[1]); PLD_legs.append(PLD[1])
+        for k in range(1,n+1):
+            # max fuel, reducing the payload
+            payload = PLD[1] * (1. - k / (n + 1.))
+            TOW_legs.append(OEW + MaxFuel + payload)
+            FUEL_legs.append(MaxFuel)
+            PLD_legs.append(payload)
+        TOW_legs.append(TOW[2]); FUEL_legs.append(FUEL[2]); PLD_legs.append(PLD[2])
+        TOW, FUEL, PLD = TOW_legs, FUEL_legs, PLD_legs
 
     # evaluate the mission
     if iprint:
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
-    # loop for each point of Payload Range Diagram
-    for i in range(len(TOW)):
-##    for i in [2]:
-        if iprint:
-            print('   EVALUATING POINT : ' + str(i+1))
-
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
-
-        maxIter = 10 # maximum iteration limit
-        tol = 1.     # fuel convergency tolerance
-        err = 9999.  # error to be minimized
-        iter = 0     # iteration count
-
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
-
-            # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
-
-            # Difference between burned fuel and target fuel
-            missingFuel = FUEL[i] - TotalFuel - reserves
-
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
-
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
-
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[cruise_segment_tag]
-
-            # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+    points  = zip(range(1,len(TOW)+1),TOW,FUEL)
+    workers = min(number_of_workers,len(points))
+
+    if workers > 1:
+        # each worker converges a contiguous run of points on its own copy of the mission,
+        # so that every point starts from the converged neighbouring one
+        chunksize = int(np.ceil(len(points) / float(workers)))
+        pool = multiprocessing.Pool(workers,initializer=initialize_worker,initargs=(mission,cruise_segment_tag,reserves,iprint))
+        try:
+            R, distances = zip(*pool.map(evaluate_point,points,chunksize))
+        finally:
+            pool.terminate()
+            pool.join()
+
+        # the mission of the caller ends as the serial loop leaves it
+        R = list(R)
+        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[-1]
+        mission.segments[cruise_segment_tag].distance = distances[-1]
 
+    else:
+        # loop for each point of Payload Range Diagram, starting from the previous converged point
+        R = []
+        for i in range(len(TOW)):
             if iprint:
-                print('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
-                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
-                  + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err))
+                print('   EVALUATING POINT : ' + str(i+1))
+            R.append(converge_point(mission,cruise_segment_tag,TOW[i],FUEL[i],reserves,iprint))
 
-        # Allocating resulting range in ouput array.
-        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+        mission.clear_warm_start()
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
@@ -225,3 +229,160 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
         plt.show(True)
 
     return payload_range
+
+# ----------------------------------------------------------------------
+#  Converge a Payload Range Point
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def converge_point(mission,cruise_segment_tag,TOW,FUEL,reserves=0.,iprint=0):
+    """Finds the range of a mission with a given takeoff weight and fuel burn, by iterating
+    on the cruise distance. The first update uses the cruise specific range, the next ones
+    are secant updates on the fuel residual. Each evaluation starts from the converged
+    state of the previous one.
+
+    Assumptions:
+    Constant altitude cruise
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission()]
+    cruise_segment_tag                    <string>
+    TOW                                   [kg]
+    FUEL                                  [kg]
+    reserves                              [kg]
+    iprint                                [Unitless] print the iterations
+
+    Outputs:
+    R                                     [nm]
+
+    Properties Used:
+    N/A
+    """
+
+    # Define takeoff weight
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW
+
+    # Evaluate mission with current TOW
+    results = mission.evaluate()
+    mission.set_warm_start(results)
+
+    # Distance convergency in order to have total fuel equal to target fuel
+    #
+    # User don't have the option of run a mission for a given fuel. So, we
+    # have to iterate distance in order to have total fuel equal to target fuel
+    #
+
+    maxIter = 10 # maximum iteration limit
+    tol = 1.     # fuel convergency tolerance
+    iter = 0     # iteration count
+
+    # Current distance in the cruise segment, and difference between burned fuel and target fuel
+    segment    = results.segments[cruise_segment_tag]
+    CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+    err        = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL + reserves
+
+    LastDist = None
+    LastErr  = None
+
+    while abs(err) > tol and iter < maxIter:
+        iter = iter + 1
+
+        if LastErr is None or err == LastErr:
+            # Current specific range (m/kg)
+            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
+            CruiseSR   = CruiseDist / CruiseFuel        # [m/kg]
+
+            # Estimated distance that will result in total fuel burn = target fuel
+            NewDist = CruiseDist - CruiseSR * err
+        else:
+            # Secant update, the fuel burned is close to linear with the cruise distance
+            NewDist = CruiseDist - err * (CruiseDist - LastDist) / (err - LastErr)
+
+        LastDist = CruiseDist
+        LastErr  = err
+        mission.segments[cruise_segment_tag].distance = NewDist
+
+        # running mission with new distance
+        results = mission.evaluate()
+        mission.set_warm_start(results)
+        segment = results.segments[cruise_segment_tag]
+
+        CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+        err        = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL + reserves
+
+        if iprint:
+            print('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
+              + str('%8.0F' % FUEL) + ' (kg) | Current Fuel: ' \
+              + str('%8.0F' % (err+FUEL))+' (kg) | Residual : '+str('%8.0F' % err))
+
+    # Resulting range
+    R = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+
+    return R
+
+# ----------------------------------------------------------------------
+#  Worker Processes
+# ----------------------------------------------------------------------
+
+# the mission copy of a worker process, with the cruise segment tag, the reserves and the print flag
+_worker_mission = None
+
+## @ingroup Methods-Performance
+def initialize_worker(mission,cruise_segment_tag,reserves,iprint=0):
+    """Stores the copy of the mission that a worker process evaluates.
+
+    Assumptions:
+    Called once when a worker process starts
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission()]
+    cruise_segment_tag                    <string>
+    reserves                              [kg]
+    iprint                                [Unitless] print the iterations
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    global _worker_mission
+    _worker_mission = (mission,cruise_segment_tag,reserves,iprint)
+
+## @ingroup Methods-Performance
+def evaluate_point(point):
+    """Converges a payload range point on the worker mission.
+
+    Assumptions:
+    initialize_worker was called in this process
+
+    Source:
+    N/A
+
+    Inputs:
+    point                                 (number [Unitless], TOW [kg], FUEL [kg])
+
+    Outputs:
+    R                                     [nm]
+    distance                              [m] the cruise distance left in the mission
+
+    Properties Used:
+    N/A
+    """
+
+    mission, cruise_segment_tag, reserves, iprint = _worker_mission
+    number, TOW, FUEL = point
+
+    if iprint:
+        print('   EVALUATING POINT : ' + str(number))
+
+    R = converge_point(mission,cruise_segment_tag,TOW,FUEL,reserves,iprint)
+
+    return R, mission.segments[cruise_segment_tag].distance
@@ -2,4 +2,8 @@
 # These functions provide methods for discrete derivative and integral calculations.
 # @ingroup Methods-Utilities
 from chebyshev_data import chebyshev_data
-from linear_data import linear_data
\ No newline at end of file
+from linear_data import linear_data
+from lgl_data import lgl_data
+from piecewise_data import piecewise_data
+from discretization_cache import cached_discretization
+from discretization_error import discretization_error, interpolate_discretization
\ No newline at end of file
@@ -0,0 +1,66 @@
+## @ingroup Methods-Utilities-Chebyshev
+# discretization_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import inspect
+
+# the operators computed so far, by method and arguments
+_operators = {}
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def cached_discretization(method, N = 16, **options):
+    """Calls a discretization method such as chebyshev_data, or returns 
+    the operators of an earlier call with the same method, N and named 
+    arguments. Every segment with the same discretization then shares 
+    the same operators instead of building and inverting them again.
+
+    Assumptions:
+    The operators only depend on N and the named arguments of the method.
+    The cached arrays are read only.
+
+    Source:
+    N/A
+
+    Inputs:
+    method                 <function> as chebyshev_data
+    N                      [-]        Number of points
+    options                           Passed to the method, the named arguments are part of the key
+
+    Outputs:
+    x                      [-]        Control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix
+
+    Properties Used:
+    N/A
+    """           
+    
+    # the named arguments after N, with their defaults
+    names, varargs, keywords, defaults = inspect.getargspec(method)
+    defaults = dict(zip(names[len(names)-len(defaults or ()):],defaults or ()))
+    
+    try:
+        key = (method,int(N)) + tuple([ options.get(k,defaults.get(k)) for k in names[1:] ])
+        hash(key)
+    except TypeError:
+        # unhashable options are not cached
+        return method(N,**options)
+    
+    if not key in _operators:
+        operators = method(N,**options)
+        for array in operators:
+            if array is not None:
+                array.flags.writeable = False
+        _operators[key] = operators
+        
+    return _operators[key]
@@ -0,0 +1,125 @@
+## @ingroup Methods-Utilities-Chebyshev
+# discretization_error.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def discretization_error(x, f, number_of_elements = 1):
+    """Estimates the relative error of values sampled at the control 
+    points of a discretization, from the last Chebyshev coefficients 
+    of their interpolating polynomial in each element. A well resolved 
+    solution has coefficients that decay to round off.
+
+    Assumptions:
+    The control points span [0,1], in equal elements that share their end point
+
+    Source:
+    Boyd, J. P., "Chebyshev and Fourier Spectral Methods", 2001
+
+    Inputs:
+    x                      [-]        Control points, 1-d vector
+    f                      [-]        Values, 1-d vector or 2-d column array
+    number_of_elements     [-]        Number of elements
+
+    Outputs:
+    error                  [-]        Largest tail of the coefficients, relative to the largest value
+
+    Properties Used:
+    N/A
+    """           
+    
+    # the columns of a vector share one scale, so round off in a zero component is not an error
+    f     = np.reshape(f,(len(x),-1))
+    scale = np.max(np.abs(f))
+    if scale == 0.:
+        return 0.
+    
+    error = 0.
+    for c in element_coefficients(x,f,number_of_elements):
+        tail  = np.sum(np.abs(c[-2:]),axis=0)
+        error = max(error,np.max(tail)/scale)
+        
+    return error
+
+## @ingroup Methods-Utilities-Chebyshev
+def interpolate_discretization(x, f, x_new, number_of_elements = 1):
+    """Interpolates values from the control points of a discretization 
+    to the control points of another one with the same elements, with 
+    the interpolating polynomial of each element.
+
+    Assumptions:
+    The control points span [0,1], in equal elements that share their end point
+
+    Source:
+    N/A
+
+    Inputs:
+    x                      [-]        Control points, 1-d vector
+    f                      [-]        Values, 2-d column array
+    x_new                  [-]        New control points, 1-d vector
+    number_of_elements     [-]        Number of elements
+
+    Outputs:
+    f_new                  [-]        Values at the new control points
+
+    Properties Used:
+    N/A
+    """           
+    
+    E     = number_of_elements
+    f     = np.reshape(f,(len(x),-1))
+    f_new = np.zeros((len(x_new),f.shape[1]))
+    n_new = (len(x_new)-1) / E + 1
+    
+    for e,c in enumerate(element_coefficients(x,f,E)):
+        start = e*(n_new-1)
+        idx   = slice(start,start+n_new)
+        t     = 2.*E*x_new[idx] - 2.*e - 1.
+        f_new[idx] = np.dot(chebyshev.chebvander(t,len(c)-1),c)
+        
+    return f_new
+
+## @ingroup Methods-Utilities-Chebyshev
+def element_coefficients(x, f, number_of_elements = 1):
+    """Chebyshev coefficients of the interpolating polynomial of each element
+
+    Assumptions:
+    The control points span [0,1], in equal elements that share their end point
+
+    Source:
+    N/A
+
+    Inputs:
+    x                      [-]        Control points, 1-d vector
+    f                      [-]        Values, 2-d column array
+    number_of_elements     [-]        Number of elements
+
+    Outputs:
+    coefficients           [-]        List of the coefficients of each element, one row per degree
+
+    Properties Used:
+    N/A
+    """           
+    
+    E = number_of_elements
+    n = (len(x)-1) / E + 1
+    
+    coefficients = []
+    for e in xrange(E):
+        idx = slice(e*(n-1),e*(n-1)+n)
+        t   = 2.*E*x[idx] - 2.*e - 1.
+        coefficients.append(np.linalg.solve(chebyshev.chebvander(t,n-1),f[idx]))
+        
+    return coefficients
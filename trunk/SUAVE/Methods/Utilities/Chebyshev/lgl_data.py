@@ -0,0 +1,113 @@
+## @ingroup Methods-Utilities-Chebyshev
+# lgl_data.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def lgl_data(N = 16, integration = True, **options):
+    """Calculates the differentiation and integration matricies
+    using the Legendre pseudospectral algorithm, based on 
+    Legendre-Gauss-Lobatto samples in x.
+    
+    D and I are not symmetric
+    get derivatives with df_dy = np.dot(D,f)
+    get integral with    int_f = np.dot(I,f)
+        where f is either a 1-d vector or 2-d column array
+        
+    A full example of how these operators are used is available in 
+    the chebyshev_data.py (same folder)
+
+    Assumptions:
+    None
+
+    Source:
+    Canuto, C., Hussaini, M. Y., Quarteroni, A., Zang, T. A., "Spectral Methods in Fluid Dynamics", 1988
+
+    Inputs:
+    N                      [-]        Number of points
+    integration (optional) <boolean>  Determines if the integration operator is calculated
+
+    Outputs:
+    x                      [-]        N-number of Legendre-Gauss-Lobatto points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix, or None if integration = False
+
+    Properties Used:
+    N/A
+    """           
+    
+    # setup
+    N = int(N)
+    if N <= 1: raise RuntimeError , "N = %i, must be > 1" % N
+    n = N - 1
+    
+    
+    # --- X vector
+    
+    # Legendre polynomials up to degree n at t, by recurrence
+    def legendre(t):
+        P = np.zeros((N,N))
+        P[:,0] = 1.
+        P[:,1] = t
+        for k in xrange(2,N):
+            P[:,k] = ( (2.*k-1.)*t*P[:,k-1] - (k-1.)*P[:,k-2] ) / k
+        return P
+    
+    # the roots of (1-t^2) P_n'(t) by Newton iteration, from the cosine spaced points
+    t = -np.cos(np.pi*np.arange(0,N)/n)
+    for iteration in xrange(100):
+        P     = legendre(t)
+        t_old = t
+        t     = t_old - ( t_old*P[:,n] - P[:,n-1] ) / ( N*P[:,n] )
+        if np.max(np.abs(t-t_old)) < 1e-15:
+            break
+    t[0]  = -1.
+    t[-1] =  1.
+    P     = legendre(t)
+    
+    # in range [0,1]
+    x = 0.5*(t + 1.)
+    
+    
+    # --- Differentiation Operator
+    
+    # off diagonal terms
+    Pn = P[:,n]
+    dt = np.tile( t, (N,1) ).T
+    dt = dt - dt.T + np.eye( N )
+    D  = np.outer(Pn,1./Pn) / dt
+    
+    # diagonal terms
+    D[np.arange(N),np.arange(N)] = 0.
+    D[0,0]   = -n*(n+1.)/4.
+    D[-1,-1] =  n*(n+1.)/4.
+    
+    # from [-1,1] to [0,1]
+    D = 2.*D
+    
+    # --- Integration operator
+    
+    if integration:
+        # invert D except first row and column
+        I = np.linalg.inv(D[1:,1:]); 
+        
+        # repack missing columns with zeros
+        I = np.append(np.zeros((1,N-1)),I,axis=0)
+        I = np.append(np.zeros((N,1)),I,axis=1)
+        
+    else:
+        I = None
+        
+    # done!
+    return x, D, I
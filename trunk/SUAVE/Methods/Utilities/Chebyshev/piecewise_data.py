@@ -0,0 +1,94 @@
+## @ingroup Methods-Utilities-Chebyshev
+# piecewise_data.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from chebyshev_data import chebyshev_data
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def piecewise_data(N = 16, integration = True, number_of_elements = 1, element_method = chebyshev_data, **options):
+    """Calculates the differentiation and integration matricies
+    of a piecewise collocation. The range is split into equal 
+    elements, each one discretized by element_method. Neighbouring 
+    elements share their end point.
+    
+    D and I are not symmetric
+    get derivatives with df_dy = np.dot(D,f)
+    get integral with    int_f = np.dot(I,f)
+        where f is either a 1-d vector or 2-d column array
+        
+    A full example of how these operators are used is available in 
+    the chebyshev_data.py (same folder)
+
+    Assumptions:
+    The derivative at a shared point is the average of the two elements
+
+    Source:
+    N/A
+
+    Inputs:
+    N                      [-]        Number of points, N-1 must be a multiple of the number of elements
+    integration (optional) <boolean>  Determines if the integration operator is calculated
+    number_of_elements     [-]        Number of elements
+    element_method         <function> Discretization of each element, as chebyshev_data
+
+    Outputs:
+    x                      [-]        N-number of control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix, or None if integration = False
+
+    Properties Used:
+    N/A
+    """           
+    
+    # setup
+    N = int(N)
+    E = int(number_of_elements)
+    if N <= 0: raise RuntimeError , "N = %i, must be > 0" % N
+    if E <= 0: raise RuntimeError , "number_of_elements = %i, must be > 0" % E
+    if (N-1) % E or N-1 < E: 
+        raise RuntimeError , "N - 1 = %i, must be a positive multiple of the %i elements" % (N-1,E)
+    
+    # points per element
+    n = (N-1) / E + 1
+    h = 1. / E
+    xe, De, Ie = element_method(n,integration)
+    
+    x     = np.zeros(N)
+    D     = np.zeros((N,N))
+    count = np.zeros(N)
+    if integration:
+        I = np.zeros((N,N))
+    else:
+        I = None
+    
+    # assemble the elements
+    for e in xrange(E):
+        start = e*(n-1)
+        idx   = slice(start,start+n)
+        
+        x[idx]       = (e + xe) * h
+        D[idx,idx]  += De / h
+        count[idx]  += 1.
+        
+        if integration:
+            # integral up to the start of the element, plus the integral in the element
+            I[idx,:]    = I[start,:].copy()
+            I[idx,idx] += Ie * h
+            
+    # average the derivatives at the shared points
+    D = D / count[:,None]
+    
+    # done!
+    return x, D, I
@@ -4,6 +4,7 @@
 # Created:  Jul 2015, E. Botero 
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,11 +12,12 @@
 
 # suave imports
 import SUAVE 
-from SUAVE.Core import Data, DataOrdered
+from SUAVE.Core import Data, DataOrdered, hash_data
 from SUAVE.Analyses import Process
 from copy import deepcopy
 import helper_functions as help_fun
 import numpy as np
+import multiprocessing
 
 # ----------------------------------------------------------------------
 #  Nexus Class
@@ -67,13 +69,24 @@ class Nexus(Data):
         self.last_inputs            = None
         self.last_fidelity          = None
         self.evaluation_count       = 0
+        self.number_of_workers      = 1
+        self.output_values          = Data()
+        self.evaluation_history     = None
+        self.history_tolerance      = 0.
+        self.optimization_filename  = None
+        self.use_history_file       = False
+        self.compiled_aliases       = None
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
             If the last time you ran this the inputs were the same, a cache is used.
+            If an evaluation history is set, for example with
+            nexus.evaluation_history = SUAVE.Core.Cache(max_size=64,filename='history.pkl'),
+            earlier evaluations at the same scaled inputs and fidelity level are replayed.
     
             Assumptions:
-            None
+            A replayed evaluation restores the summary and the objective and constraint values,
+            but not the results of the procedure
     
             Source:
             N/A
@@ -85,7 +98,8 @@ class Nexus(Data):
             None
     
             Properties Used:
-            None
+            self.evaluation_history
+            self.history_tolerance
         """          
         
         self.unpack_inputs(x)
@@ -93,10 +107,82 @@ class Nexus(Data):
         # Check if last call was the same
         if np.all(self.optimization_problem.inputs==self.last_inputs) \
            and self.last_fidelity == self.fidelity_level:
-            pass
+            return
+        
+        history = self.evaluation_history
+        if history is None:
+            self._really_evaluate()
+            return
+        
+        # Check if the point was run before
+        key = self.history_key()
+        found, entry = history.lookup(key)
+        
+        if found:
+            self.summary       = entry.summary
+            self.output_values = entry.output_values
+            self.last_inputs   = deepcopy(self.optimization_problem.inputs)
+            self.last_fidelity = self.fidelity_level
         else:
             self._really_evaluate()
+            entry = Data()
+            entry.summary       = self.summary
+            entry.output_values = self.output_values
+            history.store(key,entry)
+            
+    def history_key(self):
+        """Makes the key of the current inputs and fidelity level in the evaluation history.
+    
+            Assumptions:
+            With a tolerance, the scaled inputs are rounded to multiples of the tolerance
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            key     [string]
+    
+            Properties Used:
+            self.history_tolerance
+        """          
+        
+        inputs    = self.optimization_problem.inputs
+        scaled    = np.array(inputs[:,1],dtype=float)/np.array(inputs[:,3],dtype=float)
+        tolerance = self.history_tolerance
         
+        if tolerance > 0.:
+            scaled = np.round(scaled/tolerance).astype(int)
+            
+        return hash_data(scaled,self.fidelity_level)
+    
+    def check_history_tolerance(self,diff_interval):
+        """Rejects a history tolerance larger than a finite difference step. Otherwise a perturbed
+            point could be rounded onto the unperturbed one and replayed, giving a zero gradient.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            diff_interval      [float] finite difference step of the scaled inputs
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.evaluation_history
+            self.history_tolerance
+        """          
+        
+        if self.evaluation_history is not None and self.history_tolerance > diff_interval:
+            raise ValueError, 'The history tolerance %g is larger than the finite difference step %g' \
+                  % (self.history_tolerance,diff_interval)
+    
     
     def _really_evaluate(self):
         """Tricky little function you're not supposed to use. Doesn't check if the last inputs were already run.
@@ -129,10 +215,72 @@ class Nexus(Data):
                 nexus = step(nexus)
             self = nexus
                 
+        # Pull out the outputs while the results are here
+        self.output_values = self.collect_outputs()
+                
         # Store to cache
         self.last_inputs   = deepcopy(self.optimization_problem.inputs)
         self.last_fidelity = self.fidelity_level
           
+    def collect_outputs(self):
+        """Retrieves the unscaled values of the objective and all the constraints after an evaluation.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            output_values      [Data()] values by output tag
+    
+            Properties Used:
+            None
+        """          
+        
+        aliases     = self.optimization_problem.aliases
+        objective   = self.optimization_problem.objective
+        constraints = self.optimization_problem.constraints
+        compiled    = self.get_compiled_aliases()
+        
+        output_values = Data()
+        
+        for outputs,getters in [(objective,compiled.objective),(constraints,compiled.constraints)]:
+            if len(outputs) == 0:
+                continue
+            values = help_fun.get_values(self,outputs,aliases,getters)
+            for tag,value in zip(np.array(outputs)[:,0],values):
+                output_values[tag] = value
+        
+        return output_values
+    
+    def get_output_values(self,outputs):
+        """Looks up the values of some outputs from the last evaluation.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            outputs            [array] rows of the objective or constraints
+    
+            Outputs:
+            values             [array]
+    
+            Properties Used:
+            self.output_values
+        """          
+        
+        output_values = self.output_values
+        values = np.array([ output_values[tag] for tag in np.array(outputs)[:,0] ],dtype=float)
+        
+        return values
+          
     
     def objective(self,x = None):
         """Retrieve the objective value for your function
@@ -159,7 +307,7 @@ class Nexus(Data):
         objective   = self.optimization_problem.objective
         results     = self.results
     
-        objective_value  = help_fun.get_values(self,objective,aliases)  
+        objective_value  = self.get_output_values(objective)  
         scaled_objective = help_fun.scale_obj_values(objective,objective_value)
         
         return scaled_objective
@@ -199,7 +347,7 @@ class Nexus(Data):
         if iqconstraints == []:
             scaled_constraints = []
         else:
-            constraint_values = help_fun.get_values(self,iqconstraints,aliases)
+            constraint_values = self.get_output_values(iqconstraints)
             constraint_values[iqconstraints[:,1]=='<'] = -constraint_values[iqconstraints[:,1]=='<']
             bnd_constraints   = constraint_values - help_fun.scale_const_bnds(iqconstraints)
             scaled_constraints = help_fun.scale_const_values(iqconstraints,constraint_values)
@@ -243,7 +391,7 @@ class Nexus(Data):
         if eqconstraints == []:
             scaled_constraints = []
         else:
-            constraint_values = help_fun.get_values(self,eqconstraints,aliases) - help_fun.scale_const_bnds(eqconstraints)
+            constraint_values = self.get_output_values(eqconstraints) - help_fun.scale_const_bnds(eqconstraints)
             scaled_constraints = help_fun.scale_const_values(eqconstraints,constraint_values)
 
         return scaled_constraints   
@@ -273,7 +421,7 @@ class Nexus(Data):
         constraints = self.optimization_problem.constraints
         results     = self.results
     
-        constraint_values  = help_fun.get_values(self,constraints,aliases) 
+        constraint_values  = self.get_output_values(constraints) 
         scaled_constraints = help_fun.scale_const_values(constraints,constraint_values)
     
         return scaled_constraints     
@@ -307,10 +455,103 @@ class Nexus(Data):
         converted_values = help_fun.convert_values(inputs)
         
         # Set the dictionary
-        aliases = self.optimization_problem.aliases
-        vehicle = self.vehicle_configurations
+        aliases  = self.optimization_problem.aliases
+        vehicle  = self.vehicle_configurations
+        compiled = self.get_compiled_aliases()
+        
+        self    = help_fun.set_values(self,inputs,converted_values,aliases,compiled.setters)     
+        
+    def compile_aliases(self):
+        """Compiles the aliases of the inputs, objective and constraints into data paths, so
+            evaluations set and get values without searching the aliases or parsing strings.
+    
+            Assumptions:
+            Wildcards are expanded with the configurations that are in the nexus now
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            compiled           [Data()]
+    
+            Properties Used:
+            None
+        """      
+        
+        problem     = self.optimization_problem
+        aliases     = problem.aliases
+        constraints = problem.constraints
+        
+        compiled = Data()
+        compiled.key         = self.aliases_key()
+        compiled.setters     = help_fun.compile_setters(self,problem.inputs,aliases)
+        compiled.objective   = help_fun.compile_getters(problem.objective,aliases)
+        compiled.constraints = []
+        if len(constraints):
+            compiled.constraints = help_fun.compile_getters(constraints,aliases)
+            
+        self.compiled_aliases = compiled
+        
+        return compiled
+    
+    def aliases_key(self):
+        """Makes the key of what the compiled aliases depend on, the names of the inputs, the
+            objective and the constraints, and the aliases.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            key                [string]
+    
+            Properties Used:
+            None
+        """      
+        
+        problem = self.optimization_problem
+        names   = []
+        for table in [problem.inputs,problem.objective,problem.constraints]:
+            if len(table):
+                names.append(list(np.array(table)[:,0]))
+            else:
+                names.append([])
         
-        self    = help_fun.set_values(self,inputs,converted_values,aliases)     
+        return hash_data(names,problem.aliases)
+    
+    def get_compiled_aliases(self):
+        """Returns the compiled aliases, compiling them the first time or when the inputs,
+            the objective, the constraints or the aliases of the problem changed.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            compiled           [Data()]
+    
+            Properties Used:
+            self.compiled_aliases
+        """      
+        
+        compiled = self.compiled_aliases
+        if compiled is None or compiled.key != self.aliases_key():
+            compiled = self.compile_aliases()
+            
+        return compiled
     
     def constraints_individual(self,x = None):
         """Put's the values of the problem in the right place.
@@ -336,7 +577,8 @@ class Nexus(Data):
         """Finite difference gradients and jacobians of the problem.
     
             Assumptions:
-            N/A
+            With more than one worker, each worker process gets its own copy of the nexus
+            and the perturbed points are evaluated concurrently
     
             Source:
             N/A
@@ -350,11 +592,11 @@ class Nexus(Data):
             jac_con            [array]
     
             Properties Used:
-            None
+            self.number_of_workers
+            self.history_tolerance
         """           
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
+        self.check_history_tolerance(diff_interval)
         
         inpu  = self.optimization_problem.inputs
         const = self.optimization_problem.constraints
@@ -365,14 +607,42 @@ class Nexus(Data):
         grad_obj = np.zeros(inplen)
         jac_con  = np.zeros((inplen,conlen))
         
-        con2 = (con*np.ones_like(jac_con))
-        
+        newxs = []
         for ii in xrange(0,inplen):
             newx     = np.asarray(x)*1.0
             newx[ii] = newx[ii] + diff_interval
+            newxs.append(newx)
+            
+        workers = min(self.number_of_workers,inplen)
+        
+        if workers > 1:
+            # the workers are started from the nexus before it moves to x
+            pool = multiprocessing.Pool(workers,initializer=initialize_worker,initargs=(self,))
+            try:
+                pending = pool.map_async(evaluate_point,newxs,chunksize=1)
+                obj = self.objective(x)
+                con = self.all_constraints(x)
+                points = pending.get()
+            finally:
+                pool.terminate()
+                pool.join()
+                
+            # results come back in the order of the design variables
+            for ii,(obj_ii,con_ii) in enumerate(points):
+                grad_obj[ii]  = obj_ii
+                jac_con[ii,:] = con_ii
+                
+            self.evaluation_count += inplen
             
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+        else:
+            obj = self.objective(x)
+            con = self.all_constraints(x)
+            
+            for ii in xrange(0,inplen):
+                grad_obj[ii]  = self.objective(newxs[ii])
+                jac_con[ii,:] = self.all_constraints(newxs[ii])
+                
+        con2 = (con*np.ones_like(jac_con))
         
         grad_obj = (grad_obj - obj)/diff_interval
         
@@ -429,3 +699,65 @@ class Nexus(Data):
         
     
  
+
+
+# ----------------------------------------------------------------------
+#  Worker Functions
+# ----------------------------------------------------------------------
+
+# the nexus copy owned by a worker process
+_worker_nexus = None
+
+## @ingroup Optimization
+def initialize_worker(nexus):
+    """Stores the copy of the nexus that a worker process evaluates.
+    
+        Assumptions:
+        Called once when a worker process starts
+    
+        Source:
+        N/A
+    
+        Inputs:
+        nexus              [Nexus()]
+    
+        Outputs:
+        None
+    
+        Properties Used:
+        None
+    """      
+    global _worker_nexus
+    _worker_nexus = nexus
+    
+    # only the parent process writes the evaluation history and the optimization file to disk
+    if nexus.evaluation_history is not None:
+        nexus.evaluation_history.filename = None
+    nexus.optimization_filename = None
+    
+## @ingroup Optimization
+def evaluate_point(x):
+    """Evaluates the objective and all the constraints of the worker nexus at a point.
+    
+        Assumptions:
+        initialize_worker was called in this process
+    
+        Source:
+        N/A
+    
+        Inputs:
+        x                  [vector]
+    
+        Outputs:
+        objective          [float]
+        constraints        [vector]
+    
+        Properties Used:
+        None
+    """      
+    nexus = _worker_nexus
+    
+    objective   = nexus.objective(x)
+    constraints = nexus.all_constraints(x)
+    
+    return objective, constraints
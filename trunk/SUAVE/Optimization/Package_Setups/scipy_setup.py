@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2015, E. Botero 
 # Modified: Feb 2017, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -59,6 +60,9 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08): #
         bnds[ii] = (bnd[ii][0]/scl[ii]),(bnd[ii][1]/scl[ii])
 
 
+    # Replayed evaluations must not hide the finite difference steps
+    problem.check_history_tolerance(sense_step)
+
     # Finalize problem statement and run
     if solver=='SLSQP':
         outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,iter=200, epsilon = sense_step, acc  = sense_step**2)
@@ -3,6 +3,7 @@
 #
 #Created:  Jul 2016, M. Vegh
 #Modified: Feb 2017, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,8 +16,12 @@ from SUAVE.Surrogate.scikit_surrogate_functions import build_scikit_models
 
 from SUAVE.Optimization.Package_Setups.pyopt_surrogate_setup import pyopt_surrogate_setup
 from read_optimization_outputs import read_optimization_outputs
+from write_optimization_outputs import write_optimization_record
+from Nexus import initialize_worker, evaluate_point
 import numpy as np
+import multiprocessing
 import time
+import os
 
 # ----------------------------------------------------------------------
 #  Surrogate_Optimization
@@ -62,9 +67,19 @@ class Surrogate_Optimization(Data):
         
     def build_surrogate(self):
         """Builds a surrogate for the problem
+        
+            The sample plan is saved next to the optimization file, with a .doe extension. When
+            the build is restarted with the same number of points, the saved plan is reused and
+            the samples that are already in the optimization file are skipped.
+            
+            With problem.number_of_workers > 1, the samples are run concurrently, each worker
+            process with its own copy of the nexus. The samples are then written to the
+            optimization file here, in the order of the plan, as they complete.
     
             Assumptions:
-            None
+            The procedure writes the optimization file with write_optimization_outputs(nexus),
+            which goes to problem.optimization_filename. The workers clear that filename, so
+            only this process writes the file.
     
             Source:
             N/A
@@ -76,7 +91,9 @@ class Surrogate_Optimization(Data):
             None
     
             Properties Used:
-            None
+            self.optimization_filename
+            self.problem.number_of_workers
+            self.problem.optimization_filename
         """         
         #unpack
         npoints           = self.number_of_points
@@ -103,17 +120,85 @@ class Surrogate_Optimization(Data):
             #now handle constraints    
             scaled_bounds      = np.array(scaled_bounds)
     
-            #now create a sample
-            npoints = self.number_of_points
-            Xsample = self.sample_plan(scaled_bounds,npoints)
-    
-            #now run; results will be written to file, which can be read later
-            for i in range(0,npoints):
-        
-                opt_prob.inputs[:,1] = Xsample[i,:]*scl#/base_units
+            #now create a sample, or reuse the one of an interrupted run
+            npoints   = self.number_of_points
+            filename  = self.optimization_filename
+            plan_file = None
+            Xsample   = None
+            if filename is not None:
+                plan_file = filename + '.doe'
+                if os.path.exists(plan_file):
+                    Xsample = np.loadtxt(plan_file,ndmin=2)
+                    if Xsample.shape != (npoints,len(bnd)):
+                        Xsample = None
+            if Xsample is None:
+                Xsample = self.sample_plan(scaled_bounds,npoints)
+                if plan_file is not None:
+                    np.savetxt(plan_file,Xsample)
             
-                problem.objective()
+            if filename is not None:
+                problem.optimization_filename = filename
+            
+            sampled = self.sampled_inputs()
+            todo    = [ i for i in range(0,npoints) if not \
+                        np.any(np.all(np.isclose(sampled,Xsample[i,:],rtol=1e-10,atol=1e-12),axis=1)) ]
+            if len(todo) < npoints:
+                print 'skipping', npoints-len(todo), 'samples already in', filename
+                
+            workers = min(problem.number_of_workers,len(todo))
+            
+            if workers > 1:
+                if filename is None:
+                    raise ValueError, 'Parallel sampling needs an optimization_filename'
+                # results come back in the order of the plan and are written as they complete
+                pool = multiprocessing.Pool(workers,initializer=initialize_worker,initargs=(problem,))
+                try:
+                    points = pool.imap(evaluate_point,[ Xsample[i,:] for i in todo ],chunksize=1)
+                    for i,(objective,constraints) in zip(todo,points):
+                        write_optimization_record(filename,i+1,objective,Xsample[i,:],constraints,
+                                                  problem.use_history_file)
+                        problem.evaluation_count += 1
+                finally:
+                    pool.terminate()
+                    pool.join()
+                
+            else:
+                #now run; results will be written to file, which can be read later
+                for i in todo:
+            
+                    opt_prob.inputs[:,1] = Xsample[i,:]*scl#/base_units
+                
+                    problem.objective()
         return 
+    
+    def sampled_inputs(self):
+        """Reads the scaled inputs of the points that are already in the optimization file
+    
+            Assumptions:
+            The values in the file are rounded by their text format
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            inputs             [array]
+    
+            Properties Used:
+            self.optimization_filename
+        """         
+        
+        filename = self.optimization_filename
+        opt_prob = self.problem.optimization_problem
+        
+        if filename is None or not os.path.exists(filename) or os.path.getsize(filename) == 0:
+            return np.zeros((0,len(opt_prob.inputs)))
+        
+        inputs = read_optimization_outputs(filename,opt_prob.inputs,opt_prob.constraints)[2]
+        
+        return inputs
         
         
         #now set up optimization problem on surrogate
@@ -3,19 +3,282 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
 # ----------------------------------------------------------------------    
 
+import re
 import numpy as np
 
+# ----------------------------------------------------------------------        
+#   Alias Paths
+# ----------------------------------------------------------------------    
+
+# a part of a path, a key followed by any number of integer indices like [0] or [-1,0]
+_path_part  = re.compile(r'^(\w*)((?:\[\s*-?\d+(?:\s*,\s*-?\d+)*\s*\])*)$')
+_path_index = re.compile(r'\[([^\]]*)\]')
+
+## @ingroup Optimization
+class Alias_Path(object):
+    """ A data path like 'summary.fuel_burn' or 'wings.main_wing.origin[0]' that is split once,
+        so values can be read and set without parsing strings or calling eval.
+
+    Assumptions:
+    Each part of the path is a key or attribute, optionally followed by integer indices, with
+    one or more integers in each bracket
+
+    Source:
+    N/A
+    """
+    
+    __slots__ = ['path','parts','keys','indices']
+    
+    def __init__(self,path,name=None):
+        """ Splits the path into keys and indices
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        path       [str]
+        name       [str] optional, the alias of the path, for the error message
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+        
+        parts   = path.split('.')
+        keys    = []
+        indices = []
+        for part in parts:
+            match = _path_part.match(part)
+            if match is None:
+                if name is None:
+                    raise ValueError, 'can not compile alias path "%s"' % path
+                raise ValueError, 'can not compile the path "%s" of alias "%s"' % (path,name)
+            keys.append(match.group(1))
+            indices.append(tuple([ make_index(i) for i in _path_index.findall(match.group(2)) ]))
+            
+        self.path    = path
+        self.parts   = tuple(parts)
+        self.keys    = tuple(keys)
+        self.indices = tuple(indices)
+        
+    def get(self,dictionary):
+        """ Reads the value at the path, the same as eval('dictionary.'+path)
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        dictionary [Data()]
+
+        Outputs:
+        value
+
+        Properties Used:
+        N/A
+        """
+        
+        value = dictionary
+        for key,indices in zip(self.keys,self.indices):
+            if isinstance(value,dict) and key in value:
+                value = value[key]
+            else:
+                value = getattr(value,key)
+            for index in indices:
+                value = value[index]
+        
+        return value
+    
+    def set(self,dictionary,value):
+        """ Sets the value at the path, the same as dictionary.deep_set(path,value) for paths
+            without indices
+
+        Assumptions:
+        As in deep_set, every key of the path is used as an item. Indices set an element of
+        the value at the last key
+
+        Source:
+        N/A
+
+        Inputs:
+        dictionary [Data()]
+        value
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+        
+        keys    = self.keys
+        indices = self.indices
+        data    = dictionary
+        for key,index in zip(keys[:-1],indices[:-1]):
+            data = data[key]
+            for i in index:
+                data = data[i]
+        
+        if not indices[-1]:
+            data[keys[-1]] = value
+            return
+        
+        data = data[keys[-1]]
+        for i in indices[-1][:-1]:
+            data = data[i]
+        data[indices[-1][-1]] = value
+        
+## @ingroup Optimization
+def make_index(string):
+    """ Converts the inside of a bracket of a path to an index, an integer for '0' and a tuple
+        of integers for '-1,0'
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    string           [str]
+
+    Outputs:
+    index            [int or tuple of int]
+
+    Properties Used:
+    N/A
+    """
+    
+    index = tuple([ int(i) for i in string.split(',') ])
+    if len(index) == 1:
+        return index[0]
+    
+    return index
+
+## @ingroup Optimization
+def match_aliases(names,aliases):
+    """ Finds the alias pointers of a list of names. Names without an alias get None.
+
+    Assumptions:
+    The first alias with a name is used
+
+    Source:
+    N/A
+
+    Inputs:
+    names            [list of str]
+    aliases          [list of str]
+
+    Outputs:
+    pointers         [list of str or list of str]
+
+    Properties Used:
+    N/A
+    """
+    
+    lookup = {}
+    for alias in aliases:
+        lookup.setdefault(alias[0],alias[1])
+        
+    pointers = [ lookup.get(name) for name in names ]
+    
+    return pointers
+
+## @ingroup Optimization
+def compile_setters(dictionary,input_dictionary,aliases):
+    """ Compiles the aliases of the inputs into the paths that set_values writes to.
+        Wildcards are expanded once, with the keys that are in the dictionary now.
+
+    Assumptions:
+    The keys matched by wildcards do not change after compiling
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    input_dictionary [Data()]
+    aliases          [list of str]
+
+    Outputs:
+    setters          [list of lists of Alias_Path()], one list per input
+
+    Properties Used:
+    N/A
+    """
+    
+    provided_names = input_dictionary[:,0]
+    pointers       = match_aliases(provided_names,aliases)
+    
+    setters = []
+    for name,pointer in zip(provided_names,pointers):
+        if pointer is None:
+            setters.append([])
+            continue
+        if isinstance(pointer,str):
+            pointer = [pointer]
+        paths = []
+        for string in pointer:
+            if '*' in string:
+                paths.extend(find_a_star(dictionary,string))
+            else:
+                paths.append(string)
+        setters.append([ Alias_Path(path,name) for path in paths ])
+        
+    return setters
+
+## @ingroup Optimization
+def compile_getters(outputs,aliases):
+    """ Compiles the aliases of the outputs into the paths that get_values reads from
+
+    Assumptions:
+    Every output has an alias
+
+    Source:
+    N/A
+
+    Inputs:
+    outputs          [Data()]
+    aliases          [list of str]
+
+    Outputs:
+    getters          [list of Alias_Path()], one per output
+
+    Properties Used:
+    N/A
+    """
+    
+    npoutputs    = np.array(outputs)
+    output_names = npoutputs[:,0]
+    pointers     = match_aliases(output_names,aliases)
+    
+    getters = []
+    for name,pointer in zip(output_names,pointers):
+        if pointer is None:
+            raise KeyError, 'no alias for output "%s"' % name
+        getters.append(Alias_Path(pointer,name))
+        
+    return getters
+
 # ----------------------------------------------------------------------        
 #   Set_values
 # ----------------------------------------------------------------------    
 
 ## @ingroup Optimization
-def set_values(dictionary,input_dictionary,converted_values,aliases):
+def set_values(dictionary,input_dictionary,converted_values,aliases,setters=None):
     """ This method regresses through a dictionary to set the required values.
         dictionary is the base class that will be modified, input_dictionary is
         the set of inputs to be used, converted_values are values to be set in the
@@ -23,7 +286,7 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
         the names link to
 
     Assumptions:
-    N/A
+    If setters from compile_setters are given, the aliases are not searched again
 
     Source:
     N/A
@@ -33,6 +296,7 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
     input_dictionary [Data()]
     converted_values [Data()]
     aliases          [list of str]
+    setters          [list of lists of Alias_Path()] optional
 
     Outputs:
     None
@@ -41,43 +305,12 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
     N/A
     """      
     
-    provided_names = input_dictionary[:,0]
+    if setters is None:
+        setters = compile_setters(dictionary,input_dictionary,aliases)
         
-    # Correspond aliases to inputs
-    pointer = []
-    for ii in xrange(0,len(provided_names)):
-        for jj in xrange(0,len(aliases)):
-            if provided_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])
-
-    for ii in xrange(0,len(pointer)):
-        pointers = pointer[ii][:]
-        if isinstance(pointers,str):
-            length = 0
-            if '*' in pointers:
-                newstrings = find_a_star(dictionary,pointer[ii])
-                for jj in xrange(0,len(newstrings)):
-                    localstrs = newstrings[jj].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])
-                    
-            elif '*' not in pointers:
-                localstrs = pointers.split('.')
-                correctname = '.'.join(localstrs[0:])
-                dictionary.deep_set(correctname,converted_values[ii])              
-        else:
-            for zz in xrange(1,len(pointers)+1):
-                if '*' in pointers[zz-1]:
-                    newstrings = find_a_star(dictionary,pointer[ii][zz-1])
-                    for jj in xrange(0,len(newstrings)):
-                        localstrs = newstrings[jj].split('.')
-                        correctname = '.'.join(localstrs[0:])
-                        dictionary.deep_set(correctname,converted_values[ii])
-                        
-                elif '*' not in pointers[zz-1]:
-                    localstrs = pointers[zz-1].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])            
+    for paths,value in zip(setters,converted_values):
+        for path in paths:
+            path.set(dictionary,value)
             
     return dictionary
         
@@ -109,8 +342,7 @@ def find_a_star(dictionary,string):
             if ii==0:
                 newkeys = dictionary.keys()
             elif ii !=0:
-                strtoeval = 'dictionary.'+'.'.join(splitstring[0:ii])+'.keys()'
-                newkeys = eval(strtoeval)
+                newkeys = Alias_Path('.'.join(splitstring[0:ii])).get(dictionary).keys()
             lastindex   = ii
             
     newstrings = []
@@ -181,11 +413,11 @@ def convert_values(inputs):
 # ----------------------------------------------------------------------  
 
 ## @ingroup Optimization
-def get_values(dictionary,outputs,aliases):
+def get_values(dictionary,outputs,aliases,getters=None):
     """ Retrieves values saved in a dictionary 
 
     Assumptions:
-    N/A
+    If getters from compile_getters are given, the aliases are not searched again
 
     Source:
     N/A
@@ -194,6 +426,7 @@ def get_values(dictionary,outputs,aliases):
     dictionary       [Data()]
     outputs          [Data()]
     aliases          [list of str]
+    getters          [list of Alias_Path()] optional
 
     Outputs:
     values           [float]
@@ -202,20 +435,12 @@ def get_values(dictionary,outputs,aliases):
     N/A
     """     
     
-    npoutputs   = np.array(outputs)
-    output_names = npoutputs[:,0]
-        
-    # Correspond aliases to outputs
-    pointer = []
-    for ii in xrange(0,len(output_names)):
-        for jj in xrange(0,len(aliases)):
-            if output_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])    
+    if getters is None:
+        getters = compile_getters(outputs,aliases)
                 
-    values = np.zeros(len(outputs))
-    for ii in xrange(0,len(outputs)):
-        splitstring = pointer[ii].split('.')
-        values[ii]  = eval('dictionary.'+'.'.join(splitstring[0:]))
+    values = np.zeros(len(getters))
+    for ii,path in enumerate(getters):
+        values[ii] = path.get(dictionary)
     
     return values
 
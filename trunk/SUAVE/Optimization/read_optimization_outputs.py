@@ -2,12 +2,15 @@
 # read_optimization_outputs.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np
+import os
+
+from SUAVE.Core import open_history, is_history_file
 
 # ----------------------------------------------------------------------
 #  read_optimization_outputs_inputs
@@ -59,7 +62,8 @@ def format_input_data(data):
     
 ## @ingroup Optimization
 def read_optimization_outputs(filename, base_inputs, constraint_inputs):
-    """Reads in the outputs of an optimization problem
+    """Reads in the outputs of an optimization problem. History files are read
+        incrementally, only the records written since the last call are parsed.
 
         Assumptions:
         None
@@ -84,10 +88,13 @@ def read_optimization_outputs(filename, base_inputs, constraint_inputs):
     """      
     #need vector of initial inputs to determine where to separate 
     #inputs from constraints in text file
-    file_in = open(filename)
-    data = file_in.readlines()
-    file_in.close()
-    data = format_input_data(data)
+    if os.path.exists(filename) and is_history_file(filename):
+        data = open_history(filename).read()
+    else:
+        file_in = open(filename)
+        data = file_in.readlines()
+        file_in.close()
+        data = format_input_data(data)
     
     #unpack data
     iterations    = data[:,0]
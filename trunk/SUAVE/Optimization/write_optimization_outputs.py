@@ -2,14 +2,17 @@
 # write_optimization_outputs.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+from SUAVE.Core import open_history, is_history_file
 from helper_functions import get_values, scale_obj_values, scale_const_values
+import numpy as np
+import os
 
 # ----------------------------------------------------------------------
 #  write_optimization_outputs
@@ -17,25 +20,33 @@ from helper_functions import get_values, scale_obj_values, scale_const_values
 
 
 ## @ingroup Optimization
-def write_optimization_outputs(nexus, filename):
+def write_optimization_outputs(nexus, filename=None):
     """ Writes the optimization outputs to a file
 
     Assumptions:
-    N/A
+    Without a filename, the outputs go to nexus.optimization_filename. Nothing is written
+    when that is None too, as in the worker processes of a parallel run. A new file is a
+    History file only when nexus.use_history_file is set
 
     Source:
     N/A
 
     Inputs:
     nexus            [nexus()]
-    filename         [str]
+    filename         [str] optional
 
     Outputs:
     N/A
 
     Properties Used:
-    N/A
+    nexus.optimization_filename
+    nexus.use_history_file
     """       
+    
+    if filename is None:
+        filename = nexus.optimization_filename
+    if filename is None:
+        return
  
     #unpack optimization problem values
     objective          = nexus.optimization_problem.objective
@@ -55,6 +66,43 @@ def write_optimization_outputs(nexus, filename):
     constraint_values  = get_values(nexus,constraints,aliases) 
     scaled_constraints = scale_const_values(constraints,constraint_values)
     
+    write_optimization_record(filename,nexus.total_number_of_iterations,scaled_objective,scaled_inputs,scaled_constraints,
+                              nexus.use_history_file)
+    
+    return
+
+## @ingroup Optimization
+def write_optimization_record(filename,iteration,scaled_objective,scaled_inputs,scaled_constraints,history=False):
+    """ Appends one evaluation to an optimization output file, in one write. History files get
+    the record [iteration, objective, inputs, constraints], text files get one more line in the
+    text format. An existing file keeps its format, a new file is a History file only if asked.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    filename           [str]
+    iteration          [int]
+    scaled_objective   [array]
+    scaled_inputs      [array]
+    scaled_constraints [array]
+    history            [bool]   optional, the format of a new file
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """       
+    
+    if is_history_file(filename) or (history and not os.path.exists(filename)):
+        record = np.hstack([iteration,scaled_objective[0],scaled_inputs,scaled_constraints])
+        open_history(filename).append(record)
+        return
+    
     problem_inputs  = []
     problem_constraints = []
     for value in scaled_inputs:
@@ -62,19 +110,13 @@ def write_optimization_outputs(nexus, filename):
     for value in scaled_constraints:
         problem_constraints.append(value)
     
+    line = 'iteration = '      + str(iteration) + ' , ' + \
+           'objective = '      + str(scaled_objective[0]) + \
+           ', inputs = '       + str(problem_inputs) + \
+           ', constraints = '  + str(problem_constraints) + '\n'
     
     file=open(filename, 'ab')
-    file.write('iteration = ')
-    file.write(str(nexus.total_number_of_iterations))
-    file.write(' , ')
-    file.write('objective = ')
-    file.write(str(scaled_objective[0]))
-    file.write(', inputs = ')
-    file.write(str(problem_inputs))
-    file.write(', constraints = ')
-    file.write(str(problem_constraints))
-    
-    file.write('\n') 
+    file.write(line)
     file.close()
     
     return
\ No newline at end of file
@@ -2,6 +2,7 @@
 #Sizing_Loop.py
 #Created:  Jun 2016, M. Vegh
 #Modified: Feb 2017, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -42,6 +43,7 @@ class Sizing_Loop(Data):
         self.default_scaling       = None  #scaling value to make sizing parameters ~1
         self.maximum_iterations    = None  #cutoff point for sizing loop to close
         self.output_filename       = None  #stores optimization parameters and closed sizing parameters
+        self.use_history_file      = False #a new output file is a binary History file instead of text
         self.sizing_evaluation     = None  #defined in the Procedure script
         self.write_threshhold      = 9     #number of iterations before it writes, regardless of how close it is to currently written values (i.e. this step is hard to converge)
         
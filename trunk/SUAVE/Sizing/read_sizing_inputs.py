@@ -2,6 +2,7 @@
 #read_sizing_inputs.py
 
 # Created: Jun 2016, M. Vegh
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -9,6 +10,8 @@
 
 import numpy as np
 
+from SUAVE.Core import open_history, is_history_file
+
 
 # ----------------------------------------------------------------------
 #  read_sizing_inputs
@@ -19,7 +22,8 @@ def read_sizing_inputs(sizing_loop, opt_inputs):
     """
     This function reads a sizing loop outputs file and returns an array 
     of design variables, an array of sizing variables, and an output 
-    flag to indicate whether the file was successfully read.
+    flag to indicate whether the file was successfully read. History
+    files are read incrementally.
     
     Inputs:
     sizing_loop.
@@ -45,10 +49,13 @@ def read_sizing_inputs(sizing_loop, opt_inputs):
         
     #read data from previous iterations
     if  read_success==1:
-        data=file_in.readlines()
-        file_in.close()
-        data=format_input_data(data) #format data so we can work with it
-        file_in.close()
+        if is_history_file(sizing_loop.output_filename):
+            file_in.close()
+            data=open_history(sizing_loop.output_filename).read()
+        else:
+            data=file_in.readlines()
+            file_in.close()
+            data=format_input_data(data) #format data so we can work with it
         
         if len(data)>0:
             data_inputs = data[:, 0:len(opt_inputs)]  #values from optimization problem
@@ -1,6 +1,7 @@
 ## @ingroup Sizing
 #write_sizing_inputs.py
 # Created: Jun 2016, M. Vegh
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -8,6 +9,9 @@
 # ---------------
 
 import numpy as np
+import os
+
+from SUAVE.Core import open_history, is_history_file
 
 
 # ----------------------------------------------------------------------
@@ -18,11 +22,14 @@ import numpy as np
 def write_sizing_outputs(sizing_loop, y_save, opt_inputs):
     """
     This function writes out the optimization input variables and the 
-    solved sizing inputs at that point
+    solved sizing inputs at that point. History files get the record
+    [opt_inputs, y_save], text files get a text line. A new file is a
+    History file only when sizing_loop.use_history_file is set.
     
     Inputs:
     sizing_loop.
         output_filename
+        use_history_file
     
     y_save
     opt_inputs
@@ -31,6 +38,13 @@ def write_sizing_outputs(sizing_loop, y_save, opt_inputs):
     None
     
     """
+    filename = sizing_loop.output_filename
+    new_file = not os.path.exists(filename)
+    if is_history_file(filename) or (new_file and sizing_loop.use_history_file):
+        record = np.hstack([np.ravel(opt_inputs),np.ravel(y_save)])
+        open_history(filename).append(record)
+        return
+    
     file=open(sizing_loop.output_filename, 'ab')
     if len(opt_inputs) == 1:
         #weird python formatting issue when writing a 1 entry array